@@ -0,0 +1,235 @@
+import sys
+import json
+import time
+import argparse
+
+from benchmarks.AnalyzerCorpus import (
+    LANGUAGE_TEMPLATES,
+    AdversarialCases,
+    NewCorpus,
+)
+from src.READMECreater.CodeAnalyzer import (
+    AnalyzeRepository,
+    ExtractComments,
+    SummarizeKeywords,
+)
+from src.READMECreater.LanguageRegistry import GetAnalyzer
+
+# 사용법 (저장소 루트에서 실행, 네트워크/캐시 없이 분석기만 측정)
+#   python -m benchmarks.AnalyzerBenchmark --files 200 --save analyzer.json
+#   python -m benchmarks.AnalyzerBenchmark --baseline analyzer.json
+# 언어별 Analyze*Code / ExtractComments 처리량(MB/s)과 가장 느린 파일,
+# SummarizeKeywords, AnalyzeRepository 전체 처리량, 비정상 입력별 시간을 보고함
+
+DEFAULT_LANGUAGES = tuple(LANGUAGE_TEMPLATES)
+# 비정상 입력 하나가 이 시간(초)을 넘으면 정규식 backtracking 폭주로 판단
+MAX_CASE_SECONDS = 1.0
+# 처리량이 기준보다 이 비율 이상 떨어지면 회귀로 판단
+DEFAULT_TOLERANCE = 0.2
+
+
+def BuildParser():
+    parser = argparse.ArgumentParser(description="Benchmark the code analyzers")
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        choices=DEFAULT_LANGUAGES,
+        default=list(DEFAULT_LANGUAGES),
+    )
+    parser.add_argument("--files", type=int, default=200, help="Files per language")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--no-adversarial", action="store_true")
+    parser.add_argument("--max-case-seconds", type=float, default=MAX_CASE_SECONDS)
+    parser.add_argument("--save", default=None, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline", default=None, help="Fail if throughput regresses vs this file"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser
+
+
+# 함수를 한 번 실행하고 (걸린 시간, 결과)를 반환하는 함수
+def TimeCall(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+# 코드 목록의 크기(MB)
+def CorpusMB(corpus):
+    return sum(len(code.encode("utf-8")) for _, code in corpus) / (1024 * 1024)
+
+
+# 파일마다 func를 실행하여 처리량과 가장 느린 파일을 재는 함수 (repeat번 중 가장 빠른 결과)
+def MeasureFiles(func, corpus, repeat):
+    best, worst = None, (0.0, None)
+    # 정규식 컴파일 등 첫 호출 비용은 제외
+    if corpus:
+        func(corpus[0][1])
+    for _ in range(repeat):
+        total = 0.0
+        for name, code in corpus:
+            seconds, _ = TimeCall(func, code)
+            total += seconds
+            if seconds > worst[0]:
+                worst = (seconds, name)
+        best = total if best is None else min(best, total)
+    return {
+        "mb_per_s": round(CorpusMB(corpus) / best, 2) if best else None,
+        "seconds": round(best, 4),
+        "worst_file_ms": round(worst[0] * 1000, 2),
+        "worst_file": worst[1],
+    }
+
+
+# 언어별 분석 함수와 ExtractComments를 측정하는 함수
+def BenchLanguages(corpora, repeat):
+    results = {}
+    for lang, corpus in corpora.items():
+        analyzer = GetAnalyzer(lang)
+        single, multi = LANGUAGE_TEMPLATES[lang]["comments"]
+        results[lang] = {
+            "analyzer": analyzer.__name__,
+            "files": len(corpus),
+            "mb": round(CorpusMB(corpus), 2),
+            "analyze": MeasureFiles(analyzer, corpus, repeat),
+            "comments": MeasureFiles(
+                lambda code: ExtractComments(code, single, multi), corpus, repeat
+            ),
+        }
+    return results
+
+
+# 저장소 전체 분석과 요약을 측정하는 함수 (worker 수별)
+def BenchRepository(corpora, workers, repeat):
+    files = [item for corpus in corpora.values() for item in corpus]
+    mb = CorpusMB(files)
+    results = {}
+    analysis = None
+    for count in workers:
+        best = None
+        for _ in range(repeat):
+            seconds, analysis = TimeCall(
+                lambda: AnalyzeRepository("bench", files, workers=count)
+            )
+            best = seconds if best is None else min(best, seconds)
+        results[f"workers_{count}"] = {
+            "files_per_s": round(len(files) / best, 1),
+            "mb_per_s": round(mb / best, 2),
+            "seconds": round(best, 4),
+        }
+
+    _, imports, functions, comments = analysis
+    for name, items in (("functions", functions), ("comments", comments)):
+        seconds, _ = TimeCall(SummarizeKeywords, list(items))
+        results[f"summarize_{name}"] = {
+            "items": len(items),
+            "seconds": round(seconds, 4),
+        }
+    return results
+
+
+# 비정상 입력별 분석 시간을 재는 함수
+def BenchAdversarial(languages, maxSeconds):
+    results, slow = {}, []
+    for lang in languages:
+        analyzer = GetAnalyzer(lang)
+        single, multi = LANGUAGE_TEMPLATES[lang]["comments"]
+        for case, code in AdversarialCases(lang):
+            analyzeSeconds, _ = TimeCall(analyzer, code)
+            commentSeconds, _ = TimeCall(ExtractComments, code, single, multi)
+            results[f"{lang}/{case}"] = {
+                "kb": round(len(code) / 1024, 1),
+                "analyze_ms": round(analyzeSeconds * 1000, 2),
+                "comments_ms": round(commentSeconds * 1000, 2),
+            }
+            if max(analyzeSeconds, commentSeconds) > maxSeconds:
+                slow.append(f"{lang}/{case}")
+    return results, slow
+
+
+# 기준 결과와 비교해 처리량이 떨어진 항목을 반환하는 함수
+def FindRegressions(results, baseline, tolerance):
+    regressions = []
+
+    def Compare(label, old, new):
+        if old and new is not None and new < old * (1 - tolerance):
+            regressions.append(f"{label} {old} -> {new}")
+
+    for lang, current in results["languages"].items():
+        before = baseline.get("languages", {}).get(lang)
+        if before:
+            for part in ("analyze", "comments"):
+                Compare(
+                    f"{lang} {part} MB/s",
+                    before[part]["mb_per_s"],
+                    current[part]["mb_per_s"],
+                )
+    for key, current in results["repository"].items():
+        before = baseline.get("repository", {}).get(key, {})
+        if "files_per_s" in current:
+            Compare(f"{key} files/s", before.get("files_per_s"), current["files_per_s"])
+    return regressions
+
+
+# 결과를 표 형태로 출력하는 함수
+def PrintResults(results):
+    print(
+        f"{'language':<11} {'MB':>6} {'analyze MB/s':>13} {'worst ms':>9} {'comments MB/s':>14}  slowest file"
+    )
+    for lang, r in results["languages"].items():
+        print(
+            f"{lang:<11} {r['mb']:>6} {r['analyze']['mb_per_s']:>13} "
+            f"{r['analyze']['worst_file_ms']:>9} {r['comments']['mb_per_s']:>14}  "
+            f"{r['analyze']['worst_file']}"
+        )
+    print()
+    for key, r in results["repository"].items():
+        print(f"{key:<22} " + " ".join(f"{k}={v}" for k, v in r.items()))
+    if results.get("adversarial"):
+        print()
+        print(f"{'case':<32} {'KB':>8} {'analyze ms':>11} {'comments ms':>12}")
+        for case, r in results["adversarial"].items():
+            print(
+                f"{case:<32} {r['kb']:>8} {r['analyze_ms']:>11} {r['comments_ms']:>12}"
+            )
+
+
+def main():
+    args = BuildParser().parse_args()
+    corpora = {lang: NewCorpus(lang, args.files) for lang in args.languages}
+
+    results = {
+        "languages": BenchLanguages(corpora, args.repeat),
+        "repository": BenchRepository(corpora, args.workers, args.repeat),
+    }
+    slow = []
+    if not args.no_adversarial:
+        results["adversarial"], slow = BenchAdversarial(
+            args.languages, args.max_case_seconds
+        )
+
+    PrintResults(results)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failures = [f"SLOW {case}" for case in slow]
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures += [
+            f"REGRESSION {line}"
+            for line in FindRegressions(results, baseline, args.tolerance)
+        ]
+    for line in failures:
+        print(line)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
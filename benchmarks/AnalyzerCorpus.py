@@ -0,0 +1,304 @@
+import random
+
+from src.READMECreater.CodeAnalyzer import (
+    C_BLOCK_COMMENT,
+    MAX_CODE_CHARS,
+    MAX_LINE_LENGTH,
+)
+
+# 분석기 벤치마크용 언어별 소스 코드 생성기
+# 일반 파일 외에 minified 코드, 거대한 생성 파일, 깊게 중첩된 코드,
+# 닫히지 않은 주석/문자열처럼 정규식이 오래 걸릴 수 있는 입력도 만듦
+
+WORDS = [
+    "user",
+    "order",
+    "payment",
+    "session",
+    "cache",
+    "config",
+    "token",
+    "report",
+    "invoice",
+    "account",
+    "message",
+    "queue",
+    "worker",
+    "schedule",
+    "profile",
+    "search",
+    "index",
+    "upload",
+    "image",
+    "event",
+    "metric",
+    "export",
+    "import",
+]
+
+# 언어별 코드 조각
+# - ext: 파일 확장자
+# - imports: import 한 줄 (name에 모듈 이름)
+# - function: 함수 하나 (name, value, comment)
+# - block: 여러 줄 주석 (text)
+# - open / close: 중첩 블록 한 단계
+# - comments: ExtractComments에 넘기는 (한 줄 주석, 여러 줄 주석) 패턴
+LANGUAGE_TEMPLATES = {
+    "python": {
+        "ext": ".py",
+        "imports": "import {name}\nfrom {name}.models import {cls}\n",
+        "function": (
+            "# {comment}\n"
+            'def {name}(value, label="# not a comment"):\n'
+            "    total = value + {value}\n"
+            "    return total\n\n"
+        ),
+        "block": '"""\n{text}\n"""\n',
+        "open": "{indent}if value > {value}:\n",
+        "close": "",
+        "comments": (r"#(.*)", r'""".*?(?:"""|\Z)'),
+    },
+    "java": {
+        "ext": ".java",
+        "imports": "import com.example.{name}.{cls};\n",
+        "function": (
+            "    // {comment}\n"
+            "    public int {name}(int value) throws IOException {{\n"
+            '        String label = "// not a comment";\n'
+            "        return value + {value};\n"
+            "    }}\n\n"
+        ),
+        "block": "/*\n * {text}\n */\n",
+        "open": "{indent}if (value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "javascript": {
+        "ext": ".js",
+        "imports": "import {{ {cls} }} from '{name}';\nconst {cls}Api = require('./{name}');\n",
+        "function": (
+            "// {comment}\n"
+            "function {name}(value) {{\n"
+            "  const label = `// not a comment ${{value}}`;\n"
+            "  return value + {value};\n"
+            "}}\n"
+            "const {name}Arrow = (value) => value * {value};\n\n"
+        ),
+        "block": "/**\n * {text}\n */\n",
+        "open": "{indent}if (value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "typescript": {
+        "ext": ".ts",
+        "imports": "import {{ {cls} }} from '@app/{name}';\n",
+        "function": (
+            "// {comment}\n"
+            "export function {name}(value: number): number {{\n"
+            '  const label: string = "// not a comment";\n'
+            "  return value + {value};\n"
+            "}}\n\n"
+        ),
+        "block": "/**\n * {text}\n */\n",
+        "open": "{indent}if (value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "c": {
+        "ext": ".c",
+        "imports": "#include <{name}.h>\n",
+        "function": (
+            "// {comment}\n"
+            "int {name}(int value) {{\n"
+            '    const char *label = "// not a comment";\n'
+            "    return value + {value};\n"
+            "}}\n\n"
+        ),
+        "block": "/*\n * {text}\n */\n",
+        "open": "{indent}if (value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "cpp": {
+        "ext": ".cpp",
+        "imports": "#include <{name}>\n",
+        "function": (
+            "// {comment}\n"
+            "int Service::{name}(int value) const {{\n"
+            '    std::string label = "// not a comment";\n'
+            "    return value + {value};\n"
+            "}}\n\n"
+        ),
+        "block": "/*\n * {text}\n */\n",
+        "open": "{indent}if (value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "go": {
+        "ext": ".go",
+        "imports": 'import "github.com/example/{name}"\n',
+        "function": (
+            "// {comment}\n"
+            "func {name}(value int) int {{\n"
+            '\tlabel := "// not a comment"\n'
+            "\t_ = label\n"
+            "\treturn value + {value}\n"
+            "}}\n\n"
+        ),
+        "block": "/*\n{text}\n*/\n",
+        "open": "{indent}if value > {value} {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "php": {
+        "ext": ".php",
+        "imports": "require_once '{name}/{cls}.php';\n",
+        "function": (
+            "// {comment}\n"
+            "function {name}($value) {{\n"
+            '    $label = "// not a comment";\n'
+            "    return $value + {value};\n"
+            "}}\n\n"
+        ),
+        "block": "/*\n * {text}\n */\n",
+        "open": "{indent}if ($value > {value}) {{\n",
+        "close": "{indent}}}\n",
+        "comments": (r"//(.*)", C_BLOCK_COMMENT),
+    },
+    "ruby": {
+        "ext": ".rb",
+        "imports": "require '{name}'\nrequire_relative '{name}/{cls}'\n",
+        "function": (
+            "# {comment}\n"
+            "def {name}(value)\n"
+            '  label = "# not a comment"\n'
+            "  value + {value}\n"
+            "end\n\n"
+        ),
+        "block": "=begin\n{text}\n=end\n",
+        "open": "{indent}if value > {value}\n",
+        "close": "{indent}end\n",
+        "comments": (r"#(.*)", r"(?m:^=begin\b.*?(?:^=end\b|\Z))"),
+    },
+}
+
+# 코드 조각 길이가 달라지도록 섞는 함수 수 범위
+FUNCTIONS_PER_FILE = (8, 40)
+# 중첩 테스트의 깊이 (Python AST의 재귀 제한보다 깊게)
+NESTING_DEPTH = 200
+
+
+# 이름 조각을 이어 식별자를 만드는 함수
+def Identifier(rng, parts=2):
+    return "_".join(rng.choice(WORDS) for _ in range(parts))
+
+
+# 단어 두 개로 클래스 이름을 만드는 함수
+def ClassName(rng):
+    return "".join(word.title() for word in (rng.choice(WORDS), rng.choice(WORDS)))
+
+
+# 주석에 넣을 문장을 만드는 함수
+def Sentence(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+# 일반적인 소스 파일 하나를 만드는 함수
+def SourceFile(rng, lang, functions):
+    template = LANGUAGE_TEMPLATES[lang]
+    parts = [template["block"].format(text=Sentence(rng, 20))]
+    if lang == "php":
+        parts.insert(0, "<?php\n")
+    elif lang == "go":
+        parts.insert(0, "package main\n\n")
+
+    for _ in range(rng.randint(2, 6)):
+        parts.append(
+            template["imports"].format(name=rng.choice(WORDS), cls=ClassName(rng))
+        )
+    for index in range(functions):
+        parts.append(
+            template["function"].format(
+                name=f"{Identifier(rng)}_{index}",
+                value=rng.randint(1, 999),
+                comment=Sentence(rng),
+            )
+        )
+        if index % 5 == 0:
+            parts.append(template["block"].format(text=Sentence(rng, 30)))
+    return "".join(parts)
+
+
+# 언어별 일반 파일 목록을 만드는 함수 (같은 인자면 항상 같은 내용)
+def NewCorpus(lang, files, seed=0):
+    rng = random.Random(f"{lang}:{files}:{seed}")
+    ext = LANGUAGE_TEMPLATES[lang]["ext"]
+    return [
+        (
+            f"{lang}/file_{index}{ext}",
+            SourceFile(rng, lang, rng.randint(*FUNCTIONS_PER_FILE)),
+        )
+        for index in range(files)
+    ]
+
+
+# 깊게 중첩된 블록과 괄호를 가진 코드를 만드는 함수
+def NestedCode(lang, depth):
+    template = LANGUAGE_TEMPLATES[lang]
+    parts = [template["function"].format(name="nested", value=0, comment="nested")]
+    for level in range(depth):
+        parts.append(template["open"].format(indent=" " * level, value=level))
+    parts.append(" " * depth + "x = " + "(" * depth + "1" + ")" * depth + "\n")
+    for level in reversed(range(depth)):
+        parts.append(template["close"].format(indent=" " * level))
+    return "".join(parts)
+
+
+# 분석기가 오래 걸릴 수 있는 입력 목록 [(이름, 코드)]
+# - minified : 한 줄이 MAX_LINE_LENGTH를 넘는 번들 (분석 전에 걸러져야 함)
+# - long_lines : 제한 바로 아래 길이의 줄이 많은 파일 (정규식이 실제로 실행됨)
+# - generated : MAX_CODE_CHARS 바로 아래 크기의 생성 파일
+# - nested : NESTING_DEPTH 단계로 중첩된 블록 (Python은 AST 재귀 제한을 넘음)
+# - unterminated_block / unterminated_string : 닫히지 않은 주석과 문자열이 반복되는 파일
+# - many_parens : 함수 패턴이 되돌아가며 다시 시도하기 쉬운 괄호/식별자 나열
+def AdversarialCases(lang, seed=0):
+    rng = random.Random(f"{lang}:adversarial:{seed}")
+    normal = SourceFile(rng, lang, 20)
+
+    minified = normal.replace("\n", " ") * (MAX_LINE_LENGTH // max(1, len(normal)) + 2)
+
+    longLine = "x = " + " + ".join(f"{Identifier(rng)}({i})" for i in range(400))
+    longLine = longLine[: MAX_LINE_LENGTH - 10]
+    longLines = "\n".join([longLine] * 200)
+
+    generated = []
+    size = 0
+    while size < MAX_CODE_CHARS - 20000:
+        chunk = SourceFile(rng, lang, 40)
+        generated.append(chunk)
+        size += len(chunk)
+
+    opener = '"""' if lang == "python" else "/*"
+    if lang == "ruby":
+        opener = "=begin"
+    unterminatedBlock = normal + "".join(
+        f"{opener} {Sentence(rng)}\n{Identifier(rng)}(1)\n" for _ in range(3000)
+    )
+    unterminatedString = "".join(
+        f"label = \"{Sentence(rng)} \\\n{Identifier(rng)}('x\n" for _ in range(5000)
+    )
+
+    manyParens = "\n".join(
+        " ".join(f"{Identifier(rng)} ({Identifier(rng)}, (" for _ in range(30))
+        for _ in range(1500)
+    )
+
+    return [
+        ("minified", minified),
+        ("long_lines", longLines),
+        ("generated", "".join(generated)),
+        ("nested", NestedCode(lang, NESTING_DEPTH)),
+        ("unterminated_block", unterminatedBlock),
+        ("unterminated_string", unterminatedString),
+        ("many_parens", manyParens),
+    ]
@@ -0,0 +1,449 @@
+import io
+import re
+import json
+import time
+import base64
+import tarfile
+import hashlib
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+# 벤치마크용 가짜 GitHub API / raw 파일 / Groq / Gemini 서버
+# 하나의 로컬 HTTP 서버가 경로로 서비스를 구분함
+# - GitHub API : /repos/...          (GITHUB_API_URL=<base>)
+# - GraphQL    : /graphql            (토큰이 있을 때만 사용됨)
+# - raw 파일   : /raw/owner/repo/...  (GITHUB_RAW_URL=<base>/raw)
+# - Groq       : /openai/v1/chat/completions (GROQ_BASE_URL=<base>)
+# - Gemini     : /v1beta/models/<model>:generateContent (GEMINI_BASE_URL=<base>)
+
+FAKE_TAGS = ["Python", "Flask", "React", "PostgreSQL", "Redis", "Docker"]
+FAKE_README = "# Synthetic Repository\n\nGenerated by the benchmark LLM stand-in.\n"
+
+REPO_PATH = re.compile(r"^/repos/([^/]+)/([^/]+)(?:/(.*))?$")
+RAW_PATH = re.compile(r"^/raw/([^/]+)/([^/]+)/([^/]+)/(.+)$")
+GEMINI_PATH = re.compile(r"^/v1beta/models/([^/:]+):generateContent$")
+RANGE_HEADER = re.compile(r"^bytes=(\d+)-(\d*)$")
+# GraphQL 쿼리의 README 별칭: readme0: object(expression: "HEAD:README.md")
+GRAPHQL_README = re.compile(r'(\w+): object\(expression: "HEAD:([^"]+)"\)')
+
+
+# 서버 상태를 만드는 함수
+# - repos: NewSyntheticRepo 결과 목록 ("bench/<이름>"으로 접근)
+# - latency / llmLatency: 요청마다 기다리는 시간(초)
+# - rateLimitEvery: N번째 GitHub 요청마다 secondary rate limit 응답 (0이면 사용 안 함)
+# - treeLimit: Trees API가 truncated를 반환하는 항목 수 (None이면 자르지 않음)
+def NewFakeState(
+    repos,
+    latency=0.0,
+    llmLatency=0.0,
+    rateLimitEvery=0,
+    retryAfter=0,
+    treeLimit=None,
+):
+    return {
+        "repos": {f"bench/{repo['name']}": repo for repo in repos},
+        "latency": latency,
+        "llmLatency": llmLatency,
+        "rateLimitEvery": rateLimitEvery,
+        "retryAfter": retryAfter,
+        "treeLimit": treeLimit,
+        "counts": Counter(),
+        "bytes": Counter(),
+        "lock": threading.Lock(),
+    }
+
+
+# 요청 수를 종류별로 세고, 이번 요청이 rate limit 대상인지 반환하는 함수
+def CountRequest(state, kind):
+    with state["lock"]:
+        state["counts"][kind] += 1
+        if not kind.startswith("github"):
+            return False
+        state["counts"]["github"] += 1
+        every = state["rateLimitEvery"]
+        limited = bool(every) and state["counts"]["github"] % every == 0
+        if limited:
+            state["counts"]["rate_limited"] += 1
+        return limited
+
+
+# 카운터를 0으로 되돌리는 함수 (저장소별 측정 사이에 사용)
+def ResetCounts(state):
+    with state["lock"]:
+        state["counts"].clear()
+        state["bytes"].clear()
+
+
+# 디렉터리 하나의 contents API 목록을 만드는 함수 (한 번 만든 목록은 재사용)
+def ContentsListing(baseURL, repoPath, repo, directory):
+    listings = repo.setdefault("listings", {})
+    if directory not in listings:
+        listings[directory] = BuildListing(baseURL, repoPath, repo, directory)
+    return listings[directory]
+
+
+# contents API 목록 하나를 새로 만드는 함수
+def BuildListing(baseURL, repoPath, repo, directory):
+    prefix = f"{directory}/" if directory else ""
+    entries, subDirs = [], set()
+    for path, data in repo["files"].items():
+        if not path.startswith(prefix):
+            continue
+        rest = path[len(prefix) :]
+        if "/" in rest:
+            subDirs.add(rest.split("/", 1)[0])
+            continue
+        entries.append(
+            {
+                "type": "file",
+                "name": rest,
+                "path": path,
+                "sha": repo["blobs"][path],
+                "size": len(data),
+                "download_url": f"{baseURL}/raw/{repoPath}/{repo['sha']}/{path}",
+            }
+        )
+    for name in sorted(subDirs):
+        entries.append(
+            {
+                "type": "dir",
+                "name": name,
+                "path": f"{prefix}{name}",
+                "url": f"{baseURL}/repos/{repoPath}/contents/{prefix}{name}",
+            }
+        )
+    return entries
+
+
+# GraphQL 트리 응답의 entries를 만드는 함수
+# 실제 GitHub처럼 쿼리에 펼친 깊이(depth)까지만 하위 트리의 entries를 채움
+def GraphQLEntries(repo, directory, depth):
+    prefix = f"{directory}/" if directory else ""
+    entries, subDirs = [], set()
+    for path, data in repo["files"].items():
+        if not path.startswith(prefix):
+            continue
+        rest = path[len(prefix) :]
+        if "/" in rest:
+            subDirs.add(rest.split("/", 1)[0])
+            continue
+        entries.append(
+            {
+                "name": rest,
+                "type": "blob",
+                "oid": repo["blobs"][path],
+                "object": {"byteSize": len(data)},
+            }
+        )
+    for name in sorted(subDirs):
+        path = f"{prefix}{name}"
+        oid = hashlib.sha1(f"{repo['sha']}:{path}".encode("utf-8")).hexdigest()
+        subtree = (
+            {"entries": GraphQLEntries(repo, path, depth - 1)} if depth > 1 else {}
+        )
+        entries.append({"name": name, "type": "tree", "oid": oid, "object": subtree})
+    return entries
+
+
+# 저장소 스냅샷 GraphQL 쿼리에 대한 응답 data를 만드는 함수
+def GraphQLRepository(repo, query):
+    depth = query.count("... on Tree") + 1
+    repository = {
+        "defaultBranchRef": {
+            "name": "main",
+            "target": {
+                "oid": repo["sha"],
+                "tree": {"entries": GraphQLEntries(repo, "", depth)},
+            },
+        }
+    }
+    for alias, path in GRAPHQL_README.findall(query):
+        data = repo["files"].get(path)
+        repository[alias] = {"text": data.decode("utf-8")} if data else None
+    return {"repository": repository}
+
+
+# 저장소 전체를 tar.gz로 묶는 함수 (처음 요청할 때 한 번만 만듦)
+def Tarball(repo):
+    if "tarball" not in repo:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=1) as tar:
+            root = f"bench-{repo['name']}-{repo['sha'][:7]}"
+            for path, data in repo["files"].items():
+                info = tarfile.TarInfo(f"{root}/{path}")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        repo["tarball"] = buffer.getvalue()
+    return repo["tarball"]
+
+
+# 프롬프트 종류에 맞는 가짜 LLM 응답을 만드는 함수
+def FakeCompletion(prompt):
+    if '"readme"' in prompt:
+        return json.dumps({"readme": FAKE_README, "tags": FAKE_TAGS})
+    if '"tags"' in prompt:
+        return json.dumps({"tags": FAKE_TAGS})
+    return FAKE_README
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    # keep-alive 연결을 유지해야 실제 GitHub와 비슷한 연결 재사용을 측정할 수 있음
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 보내므로 Nagle 알고리즘을 끄지 않으면 응답마다 지연이 생김
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def Send(self, status, body=b"", contentType="application/json", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+            with self.state["lock"]:
+                self.state["counts"]["not_modified"] += 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(body)))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        with self.state["lock"]:
+            self.state["bytes"]["sent"] += len(body)
+
+    def SendJson(self, data, status=200):
+        self.Send(status, json.dumps(data))
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        kind = "github.raw" if path.startswith("/raw/") else "github.api"
+        match = REPO_PATH.match(path)
+        if match and match.group(3):
+            kind = f"github.{match.group(3).split('/', 1)[0]}"
+        elif match:
+            kind = "github.repo"
+
+        limited = CountRequest(self.state, kind)
+        time.sleep(self.state["latency"])
+        if limited:
+            self.Send(
+                403,
+                '{"message": "You have exceeded a secondary rate limit."}',
+                headers={"Retry-After": str(self.state["retryAfter"])},
+            )
+            return
+
+        if path.startswith("/raw/"):
+            self.HandleRaw(path)
+        elif match:
+            self.HandleApi(match)
+        else:
+            self.SendJson({"message": "Not Found"}, 404)
+
+    def HandleRaw(self, path):
+        match = RAW_PATH.match(path)
+        repo = (
+            self.state["repos"].get(f"{match.group(1)}/{match.group(2)}")
+            if match
+            else None
+        )
+        data = repo["files"].get(unquote(match.group(4))) if repo else None
+        if data is None:
+            self.Send(404, "404: Not Found", "text/plain")
+            return
+        # raw.githubusercontent.com처럼 Range 요청에는 일부만 206으로 응답
+        byteRange = RANGE_HEADER.match(self.headers.get("Range", ""))
+        if byteRange and int(byteRange.group(1)) < len(data):
+            start = int(byteRange.group(1))
+            end = min(int(byteRange.group(2) or len(data) - 1), len(data) - 1)
+            self.Send(
+                206,
+                data[start : end + 1],
+                "application/octet-stream",
+                headers={"Content-Range": f"bytes {start}-{end}/{len(data)}"},
+            )
+            return
+        self.Send(200, data, "application/octet-stream")
+
+    def HandleApi(self, match):
+        repoPath = f"{match.group(1)}/{match.group(2)}"
+        repo = self.state["repos"].get(repoPath)
+        if repo is None:
+            self.SendJson({"message": "Not Found"}, 404)
+            return
+
+        baseURL = self.server.baseURL
+        rest = unquote(match.group(3) or "")
+        if not rest:
+            self.SendJson({"full_name": repoPath, "default_branch": "main"})
+        elif rest.startswith("commits/"):
+            if "sha" in self.headers.get("Accept", ""):
+                self.Send(200, repo["sha"], "text/plain")
+            else:
+                self.SendJson({"sha": repo["sha"]})
+        elif rest.startswith("git/trees/"):
+            tree = [
+                {
+                    "path": path,
+                    "type": "blob",
+                    "sha": repo["blobs"][path],
+                    "size": len(data),
+                }
+                for path, data in repo["files"].items()
+            ]
+            limit = self.state["treeLimit"]
+            truncated = limit is not None and len(tree) > limit
+            self.SendJson(
+                {"sha": repo["sha"], "tree": tree[:limit], "truncated": truncated}
+            )
+        elif rest == "contents" or rest.startswith("contents/"):
+            directory = rest[len("contents") :].strip("/")
+            self.SendJson(ContentsListing(baseURL, repoPath, repo, directory))
+        elif rest == "readme":
+            content = base64.b64encode(repo["readme"].encode("utf-8")).decode("ascii")
+            self.SendJson(
+                {"name": "README.md", "encoding": "base64", "content": content}
+            )
+        elif rest.startswith("tarball"):
+            self.Send(200, Tarball(repo), "application/x-gzip")
+        else:
+            self.SendJson({"message": "Not Found"}, 404)
+
+    def HandleGraphQL(self, request):
+        limited = CountRequest(self.state, "github.graphql")
+        time.sleep(self.state["latency"])
+        if limited:
+            self.Send(
+                403,
+                '{"message": "You have exceeded a secondary rate limit."}',
+                headers={"Retry-After": str(self.state["retryAfter"])},
+            )
+            return
+        if not self.headers.get("Authorization"):
+            self.SendJson({"message": "Requires authentication"}, 401)
+            return
+
+        variables = request.get("variables") or {}
+        repoPath = f"{variables.get('owner')}/{variables.get('name')}"
+        repo = self.state["repos"].get(repoPath)
+        if repo is None:
+            self.SendJson(
+                {
+                    "data": {"repository": None},
+                    "errors": [
+                        {
+                            "type": "NOT_FOUND",
+                            "message": f"Could not resolve {repoPath}",
+                        }
+                    ],
+                }
+            )
+            return
+        self.SendJson({"data": GraphQLRepository(repo, request.get("query", ""))})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        path = urlparse(self.path).path
+
+        if path == "/graphql":
+            self.HandleGraphQL(request)
+        elif path.endswith("/chat/completions"):
+            CountRequest(self.state, "groq")
+            time.sleep(self.state["llmLatency"])
+            prompt = "\n".join(
+                str(m.get("content", "")) for m in request.get("messages", [])
+            )
+            content = FakeCompletion(prompt)
+            self.SendJson(
+                {
+                    "id": "chatcmpl-bench",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": len(prompt) // 4,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": (len(prompt) + len(content)) // 4,
+                    },
+                }
+            )
+        elif GEMINI_PATH.match(path):
+            CountRequest(self.state, "gemini")
+            time.sleep(self.state["llmLatency"])
+            prompt = "\n".join(
+                part.get("text", "")
+                for content in request.get("contents", [])
+                for part in content.get("parts", [])
+            )
+            text = FakeCompletion(prompt)
+            self.SendJson(
+                {
+                    "candidates": [
+                        {
+                            "content": {"role": "model", "parts": [{"text": text}]},
+                            "finishReason": "STOP",
+                            "index": 0,
+                        }
+                    ],
+                    "usageMetadata": {
+                        "promptTokenCount": len(prompt) // 4,
+                        "candidatesTokenCount": len(text) // 4,
+                        "totalTokenCount": (len(prompt) + len(text)) // 4,
+                    },
+                }
+            )
+        else:
+            self.SendJson({"error": {"message": "Not Found"}}, 404)
+
+
+# 가짜 서버를 별도 thread로 시작하고 (서버, 기본 주소)를 반환하는 함수
+def StartFakeServer(state, host="127.0.0.1", port=0):
+    server = ThreadingHTTPServer((host, port), FakeHandler)
+    server.daemon_threads = True
+    server.state = state
+    server.baseURL = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.baseURL
+
+
+# 가짜 서버를 종료하는 함수
+def StopFakeServer(server):
+    server.shutdown()
+    server.server_close()
+
+
+# 가짜 서버를 가리키도록 설정하는 환경 변수 (src 모듈을 import하기 전에 적용해야 함)
+# token이 있으면 파이프라인이 GraphQL 스냅샷을 사용함
+def FakeEnvironment(baseURL, token=""):
+    return {
+        "GITHUB_API_URL": baseURL,
+        "GITHUB_RAW_URL": f"{baseURL}/raw",
+        "GROQ_BASE_URL": baseURL,
+        "GEMINI_BASE_URL": baseURL,
+        "GROQ_API_KEY": "bench",
+        "GOOGLE_API_KEY": "bench",
+        "GITHUB_TOKEN": token,
+    }
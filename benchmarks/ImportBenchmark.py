@@ -0,0 +1,117 @@
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+# 사용법 (저장소 루트에서 실행)
+#   python -m benchmarks.ImportBenchmark --save imports.json
+#   python -m benchmarks.ImportBenchmark --baseline imports.json
+# python -X importtime으로 main을 import하는 시간을 재고,
+# 예산을 넘거나 LLM SDK처럼 무거운 모듈이 시작 시점에 import되면 실패로 보고함
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# import 시간 예산(ms)
+DEFAULT_BUDGET_MS = 400.0
+# 시작 시점에 import되면 안 되는 모듈 (해당 단계가 실행될 때만 import)
+LAZY_MODULES = ("groq", "google.generativeai", "fuzzywuzzy", "pydantic")
+# import 시간이 기준보다 이 비율 이상 늘어나면 회귀로 판단
+DEFAULT_TOLERANCE = 0.3
+
+# -X importtime 출력 한 줄: "import time: <self us> | <cumulative us> | <들여쓰기><모듈>"
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def BuildParser():
+    parser = argparse.ArgumentParser(description="Benchmark CLI import time")
+    parser.add_argument("--module", default="main")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to show")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--save", default=None, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline", default=None, help="Fail if import time regresses vs this file"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser
+
+
+# 모듈을 새 프로세스에서 한 번 import하고 -X importtime 결과를 반환하는 함수
+# 반환값: {모듈 이름: 누적 import 시간(ms)} (최상위 import가 아닌 모듈도 포함)
+def ImportTimes(module):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{process.stderr}")
+
+    times = {}
+    for line in process.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2)) / 1000
+    return times
+
+
+# repeat번 중 가장 빠른 실행의 결과를 반환하는 함수
+def MeasureImport(module, repeat, top):
+    best = None
+    for _ in range(repeat):
+        times = ImportTimes(module)
+        if best is None or times[module] < best[module]:
+            best = times
+
+    slowest = sorted(
+        ((name, ms) for name, ms in best.items() if name != module),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:top]
+    return {
+        "module": module,
+        "total_ms": round(best[module], 1),
+        "modules": len(best),
+        "slowest": {name: round(ms, 1) for name, ms in slowest},
+        "lazy_violations": [name for name in LAZY_MODULES if name in best],
+    }
+
+
+# 결과를 출력하는 함수
+def PrintResults(result):
+    print(
+        f"import {result['module']}: {result['total_ms']} ms ({result['modules']} modules)"
+    )
+    for name, ms in result["slowest"].items():
+        print(f"  {ms:>8} ms  {name}")
+
+
+def main():
+    args = BuildParser().parse_args()
+    result = MeasureImport(args.module, args.repeat, args.top)
+
+    PrintResults(result)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    failures = [f"EAGER {name}" for name in result["lazy_violations"]]
+    if result["total_ms"] > args.budget_ms:
+        failures.append(f"BUDGET {result['total_ms']} ms > {args.budget_ms} ms")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            before = json.load(f)["total_ms"]
+        if result["total_ms"] > before * (1 + args.tolerance):
+            failures.append(f"REGRESSION total_ms {before} -> {result['total_ms']}")
+    for line in failures:
+        print(line)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
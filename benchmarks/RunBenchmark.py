@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+from benchmarks.FakeServices import (
+    FakeEnvironment,
+    NewFakeState,
+    ResetCounts,
+    StartFakeServer,
+    StopFakeServer,
+)
+from benchmarks.SyntheticRepo import NewSyntheticRepo
+
+# 사용법 (저장소 루트에서 실행, 인식하지 못한 옵션은 main.py에 그대로 전달)
+#   python -m benchmarks.RunBenchmark --sizes 10 1000 --save bench.json
+#   python -m benchmarks.RunBenchmark --baseline bench.json --fetch-mode tarball
+#   python -m benchmarks.RunBenchmark --sizes 100 --github-token bench  (GraphQL 경로)
+# 외부 서비스 대신 로컬 가짜 서버를 사용하므로 네트워크나 API 키 없이 실행 가능
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = (10, 1000, 20000)
+# 처리량이 기준보다 이 비율 이상 떨어지면 회귀로 판단
+DEFAULT_TOLERANCE = 0.2
+# 회귀 비교에 사용하는 값 (높을수록 좋은 값)
+THROUGHPUT_KEYS = ("fetch_files_per_s", "analyze_files_per_s")
+
+
+def BuildParser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pipeline against local GitHub/LLM stand-ins"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument(
+        "--passes",
+        nargs="+",
+        choices=["cold", "warm"],
+        default=["cold", "warm"],
+        help="cold: empty cache, warm: reuse the cache from the cold pass",
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Answer every Nth GitHub request with a secondary rate limit",
+    )
+    parser.add_argument("--retry-after", type=int, default=0)
+    parser.add_argument(
+        "--tree-limit",
+        type=int,
+        default=None,
+        help="Mark the Trees API response truncated above this many entries",
+    )
+    parser.add_argument(
+        "--github-token",
+        default="",
+        help="Send this token so the pipeline takes the GraphQL snapshot path",
+    )
+    parser.add_argument("--save", default=None, help="Write results as JSON")
+    parser.add_argument(
+        "--baseline", default=None, help="Fail if throughput regresses vs this file"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser
+
+
+# batch_summary.jsonl과 metrics.json에서 필요한 값을 읽는 함수
+def ReadRunOutput(outdir, metricsPath):
+    with open(os.path.join(outdir, "batch_summary.jsonl"), encoding="utf-8") as f:
+        summary = json.loads(f.readline())
+    with open(metricsPath, encoding="utf-8") as f:
+        metrics = json.load(f)
+
+    files = sum(
+        sample["value"]
+        for sample in metrics.get("readme_creater_files_analyzed_total", [])
+    )
+    tokens = {}
+    for sample in metrics.get("readme_creater_llm_tokens_total", []):
+        kind = sample["labels"]["kind"]
+        tokens[kind] = tokens.get(kind, 0) + int(sample["value"])
+    return summary, int(files), tokens
+
+
+# 처리한 파일 수를 단계 시간으로 나눈 처리량 (단계가 없으면 None)
+def Throughput(files, seconds):
+    return round(files / seconds, 1) if seconds else None
+
+
+# main.py를 별도 프로세스로 한 번 실행하고 결과를 반환하는 함수
+# 프로세스마다 peak RSS를 따로 재기 위해 wait4로 자식 프로세스의 rusage를 받음
+def RunOnce(repoURL, workdir, cacheDir, label, env, state, extraArgs):
+    outdir = os.path.join(workdir, label)
+    os.makedirs(outdir, exist_ok=True)
+    listPath = os.path.join(outdir, "repos.txt")
+    metricsPath = os.path.join(outdir, "metrics.json")
+    with open(listPath, "w", encoding="utf-8") as f:
+        f.write(repoURL + "\n")
+
+    command = [
+        sys.executable,
+        os.path.join(ROOT, "main.py"),
+        "--batch",
+        listPath,
+        "--out",
+        outdir,
+        "--cache-dir",
+        cacheDir,
+        "--metrics-json",
+        metricsPath,
+        "--log-level",
+        "WARNING",
+        *extraArgs,
+    ]
+    ResetCounts(state)
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=env)
+    _, status, usage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"{label} exited with {process.returncode}")
+
+    summary, files, tokens = ReadRunOutput(outdir, metricsPath)
+    stages = summary["stages"]
+    return {
+        "ok": summary["ok"],
+        "errors": summary["errors"],
+        "wall_seconds": round(wall, 3),
+        "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),
+        "files": files,
+        "fetch_files_per_s": Throughput(files, stages.get("fetch")),
+        "analyze_files_per_s": Throughput(files, stages.get("analyze")),
+        "stages": stages,
+        "requests": dict(state["counts"]),
+        "bytes_sent": state["bytes"]["sent"],
+        "llm_tokens": tokens,
+    }
+
+
+# 기준 결과와 비교해 처리량이 떨어진 항목을 반환하는 함수
+def FindRegressions(results, baseline, tolerance):
+    previous = {(r["size"], r["pass"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["size"], result["pass"]))
+        if before is None:
+            continue
+        for key in THROUGHPUT_KEYS:
+            old, new = before.get(key), result.get(key)
+            if old and new is not None and new < old * (1 - tolerance):
+                regressions.append(
+                    f"{result['size']} files ({result['pass']}): {key} {old} -> {new}"
+                )
+    return regressions
+
+
+# 결과를 표 형태로 출력하는 함수
+def PrintResults(results):
+    header = f"{'files':>7} {'pass':>5} {'wall s':>8} {'rss MB':>8} {'fetch f/s':>10} {'analyze f/s':>12} {'requests':>9}  stages"
+    print(header)
+    for r in results:
+        stages = " ".join(f"{name}={seconds}" for name, seconds in r["stages"].items())
+        print(
+            f"{r['size']:>7} {r['pass']:>5} {r['wall_seconds']:>8} {r['peak_rss_mb']:>8} "
+            f"{str(r['fetch_files_per_s']):>10} {str(r['analyze_files_per_s']):>12} "
+            f"{r['requests'].get('github', 0):>9}  {stages}"
+        )
+
+
+def main():
+    args, extraArgs = BuildParser().parse_known_args()
+
+    repos = [NewSyntheticRepo(f"repo-{size}", size) for size in args.sizes]
+    state = NewFakeState(
+        repos,
+        latency=args.latency_ms / 1000,
+        llmLatency=args.llm_latency_ms / 1000,
+        rateLimitEvery=args.rate_limit_every,
+        retryAfter=args.retry_after,
+        treeLimit=args.tree_limit,
+    )
+    server, baseURL = StartFakeServer(state)
+    env = {**os.environ, **FakeEnvironment(baseURL, args.github_token)}
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="readme-bench-") as workdir:
+            for size, repo in zip(args.sizes, repos):
+                repoURL = f"https://github.com/bench/{repo['name']}"
+                cacheDir = os.path.join(workdir, f"cache-{size}")
+                for name in args.passes:
+                    result = RunOnce(
+                        repoURL,
+                        workdir,
+                        cacheDir,
+                        f"{size}-{name}",
+                        env,
+                        state,
+                        extraArgs,
+                    )
+                    results.append({"size": size, "pass": name, **result})
+    finally:
+        StopFakeServer(server)
+
+    PrintResults(results)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = FindRegressions(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
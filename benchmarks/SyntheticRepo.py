@@ -0,0 +1,210 @@
+import zlib
+import random
+import struct
+
+from src.Utils.Cache import BlobSha, HashKey
+
+# 합성 저장소에 넣는 파일의 언어 비율 (실제 저장소처럼 한두 언어가 대부분을 차지)
+LANGUAGE_WEIGHTS = {"python": 5, "javascript": 3, "java": 2, "go": 1}
+LANGUAGE_EXTENSIONS = {
+    "python": ".py",
+    "javascript": ".js",
+    "java": ".java",
+    "go": ".go",
+}
+
+# 언어별 import 후보 (StaticTagger가 알아보는 패키지와 모르는 패키지를 섞음)
+IMPORT_POOLS = {
+    "python": [
+        "requests",
+        "flask",
+        "pydantic",
+        "numpy",
+        "pandas",
+        "os",
+        "json",
+        "re",
+        "typing",
+        "collections",
+        "internal.utils",
+        "internal.models",
+    ],
+    "javascript": [
+        "react",
+        "axios",
+        "express",
+        "lodash",
+        "./utils",
+        "./api",
+        "redux",
+        "dayjs",
+    ],
+    "java": [
+        "org.springframework.boot.SpringApplication",
+        "java.util.List",
+        "java.util.Map",
+        "com.fasterxml.jackson.databind.ObjectMapper",
+        "lombok.Data",
+        "org.junit.jupiter.api.Test",
+    ],
+    "go": [
+        "fmt",
+        "net/http",
+        "github.com/gin-gonic/gin",
+        "gorm.io/gorm",
+        "encoding/json",
+        "context",
+    ],
+}
+
+WORDS = [
+    "user",
+    "order",
+    "payment",
+    "session",
+    "cache",
+    "config",
+    "token",
+    "report",
+    "invoice",
+    "account",
+    "message",
+    "queue",
+    "worker",
+    "schedule",
+    "profile",
+    "search",
+    "index",
+    "upload",
+    "image",
+    "event",
+    "metric",
+    "export",
+    "import",
+]
+
+# 한 디렉터리에 넣는 최대 파일 수
+FILES_PER_DIR = 40
+
+
+# 이미지 탐색 단계용 PNG 파일 (IHDR 헤더만 있는 파일, 크기 비교를 위해 가로/세로 지정)
+def PngBytes(width, height, padding=64):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    chunk = b"IHDR" + ihdr
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", len(ihdr))
+        + chunk
+        + struct.pack(">I", zlib.crc32(chunk))
+        + b"\x00" * padding
+    )
+
+
+# 이름 조각 몇 개를 이어 식별자를 만드는 함수
+def Identifier(rng, parts=2, sep="_"):
+    return sep.join(rng.choice(WORDS) for _ in range(parts))
+
+
+# 언어별 소스 파일 하나의 내용을 만드는 함수 (분석기가 실제로 읽을 수 있는 문법)
+def SourceFile(rng, lang, functions):
+    imports = rng.sample(IMPORT_POOLS[lang], k=min(4, len(IMPORT_POOLS[lang])))
+    names = [Identifier(rng) for _ in range(functions)]
+    comment = f"Handles {rng.choice(WORDS)} {rng.choice(WORDS)} for the {rng.choice(WORDS)} service"
+
+    if lang == "python":
+        lines = [f"import {name}" for name in imports] + [""]
+        for name in names:
+            lines += [
+                f"# {comment}",
+                f"def {name}(value):",
+                f"    return value + {rng.randint(1, 99)}",
+                "",
+            ]
+    elif lang == "javascript":
+        lines = [f"import {Identifier(rng, 1)} from '{name}';" for name in imports] + [
+            ""
+        ]
+        for name in names:
+            lines += [
+                f"// {comment}",
+                f"function {Identifier(rng, 2, '')}(value) {{",
+                f"  return value + {rng.randint(1, 99)};",
+                "}",
+                "",
+            ]
+    elif lang == "java":
+        lines = [f"import {name};" for name in imports] + ["", "public class Service {"]
+        for name in names:
+            lines += [
+                f"    // {comment}",
+                f"    public int {Identifier(rng, 2, '')}(int value) {{",
+                f"        return value + {rng.randint(1, 99)};",
+                "    }",
+                "",
+            ]
+        lines.append("}")
+    else:
+        lines = (
+            ["package main", "", "import ("]
+            + [f'\t"{name}"' for name in imports]
+            + [")", ""]
+        )
+        for name in names:
+            lines += [
+                f"// {comment}",
+                f"func {Identifier(rng, 2, '')}(value int) int {{",
+                f"\treturn value + {rng.randint(1, 99)}",
+                "}",
+                "",
+            ]
+    return "\n".join(lines)
+
+
+# 디렉터리 번호를 최대 3단계 경로로 바꾸는 함수 (0은 최상위)
+def Directory(dirIndex):
+    parts = []
+    while dirIndex and len(parts) < 3:
+        parts.append(f"pkg{dirIndex % 8}")
+        dirIndex //= 8
+    return "/".join(reversed(parts))
+
+
+# 합성 저장소를 만드는 함수 (같은 인자면 항상 같은 내용)
+# 반환값: {"name", "sha", "files": {경로: bytes}, "blobs": {경로: blob SHA}, "readme"}
+def NewSyntheticRepo(name, fileCount, seed=0, functionsPerFile=6):
+    rng = random.Random(f"{name}:{fileCount}:{seed}")
+    languages = list(LANGUAGE_WEIGHTS)
+    weights = [LANGUAGE_WEIGHTS[lang] for lang in languages]
+
+    files = {}
+    for index in range(fileCount):
+        lang = rng.choices(languages, weights)[0]
+        directory = Directory(index // FILES_PER_DIR)
+        path = f"{directory}/{Identifier(rng)}_{index}{LANGUAGE_EXTENSIONS[lang]}"
+        path = path.lstrip("/")
+        files[path] = SourceFile(rng, lang, functionsPerFile).encode("utf-8")
+
+    files["requirements.txt"] = b"requests==2.32.5\nflask>=3.0\npydantic\nnumpy\n"
+    files["package.json"] = (
+        b'{"dependencies": {"react": "^18.0.0", "axios": "^1.6.0", "express": "^4.0.0"}}'
+    )
+    files["Dockerfile"] = b"FROM python:3.11-slim\nCOPY . .\n"
+    files["assets/demo.png"] = PngBytes(800, 600, padding=64 * 1024)
+    files["docs/logo.png"] = PngBytes(256, 256)
+    files["assets/favicon.png"] = PngBytes(16, 16)
+
+    readme = (
+        f"# {name}\n\n"
+        '<img src="assets/demo.png" width="600">\n\n'
+        f"Synthetic repository with {fileCount} source files used for benchmarks.\n"
+        "It is a Flask and React web service backed by PostgreSQL and Redis.\n"
+    )
+    files["README.md"] = readme.encode("utf-8")
+
+    return {
+        "name": name,
+        "sha": HashKey(f"{name}:{fileCount}:{seed}")[:40],
+        "files": files,
+        "blobs": {path: BlobSha(data) for path, data in files.items()},
+        "readme": readme,
+    }
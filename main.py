@@ -1,12 +1,77 @@
 import os
+import sys
+import time
 import argparse
 import json
+import shlex
+import shutil
+import logging
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 
-from src.READMECreater.GithubFetcher import DownloadRepoFiles
-from src.READMECreater.READMEGenerator import GenerateREADME
-from src.TagCreater.Models import ModelThreading
-from src.Utils.GetImage import GetImageInGithub
+from src.READMECreater.GithubFetcher import (
+    DownloadRepoFiles,
+    FetchNamedFiles,
+    IterRepoFiles,
+    GetCommitSha,
+    GetDefaultBranch,
+    GetRepoPath,
+    FETCH_MODES,
+    DOWNLOAD_WORKERS,
+    MAX_FILE_BYTES,
+)
+from src.READMECreater.CodeAnalyzer import AnalyzeRepository
+from src.TagCreater.Models import ModelThreading, MODEL_TIMEOUT
+from src.TagCreater.READMEFetcher import GetREADME
+from src.TagCreater.StaticTagger import (
+    MANIFEST_FILES,
+    MIN_STATIC_TAGS,
+    ConfidentTags,
+    StaticTags,
+)
+from src.TagCreater.TagMerger import MergeCleanTags
+from src.Utils.GetImage import GetImageInGithub, MAX_IMAGE_BYTES
+from src.Utils.Cache import ConfigureCache, EvictCache, CACHE_MAX_BYTES
+from src.Utils.PromptBuilder import PROMPT_TOKEN_BUDGET
+from src.Utils.LLMCache import ConfigureLLMCache, LLM_CACHE_TTL
+from src.Utils.Scheduler import ConfigureLimits
+from src.Utils.GithubClient import (
+    GITHUB_API_URL,
+    GITHUB_RAW_URL,
+    ConfigureGithub,
+    EnvTokens,
+    GetWithRetry,
+    GithubError,
+)
+from src.Utils.JobQueue import (
+    GetJob,
+    NewJobQueue,
+    QueueFull,
+    QueueStats,
+    StopJobQueue,
+    SubmitJob,
+    JOB_WORKERS,
+    MAX_QUEUED_JOBS,
+)
+from src.Utils.Metrics import (
+    REGISTRY,
+    STAGE_FAILURES,
+    STAGE_SECONDS,
+    StartMetricsServer,
+    WriteMetricsJson,
+)
+
+logger = logging.getLogger(__name__)
+
+# 서비스 모드 기본 포트 (Dockerfile과 동일)
+SERVICE_PORT = 4886
+# `uvicorn main:app`으로 실행할 때 명령행 옵션을 넘기는 환경 변수
+SERVICE_ARGS_ENV = "README_CREATER_ARGS"
+# 대기열이 가득 찼을 때 다시 요청하라고 알려주는 시간(초)
+RETRY_AFTER_SECONDS = 10
+# 태그 단계가 README 단계의 코드 분석(import)을 기다리는 최대 시간(초)
+# 넘으면 manifest 태그만으로 LLM 호출을 시작하여 파일 다운로드와 겹치도록 함
+STATIC_ANALYSIS_WAIT = 2.0
 
 
 def ensure_dir(path):
@@ -29,14 +94,16 @@ def save_text(path, text):
         f.write(text)
 
 
-def download_file(url, dest_path):
+def download_file(url, dest_path, max_bytes=MAX_IMAGE_BYTES):
     """URL에서 파일을 다운로드하여 지정된 경로에 저장합니다.
 
     이미지 다운로드에서 사용되며, 실패 시 False를 반환합니다.
+    파일이 max_bytes를 넘으면 받던 내용을 지우고 중단합니다.
 
     Args:
         url (str): 다운로드할 파일의 URL
         dest_path (str): 저장할 로컬 경로
+        max_bytes (int | None): 허용하는 최대 크기 (None이면 제한 없음)
 
     Returns:
         bool: 다운로드 성공 여부
@@ -44,24 +111,140 @@ def download_file(url, dest_path):
     if not url:
         return False
     try:
-        resp = requests.get(url, stream=True, timeout=30)
+        # GitHub 파일은 공유 클라이언트로 받아 rate limit을 함께 관리
+        get = (
+            GetWithRetry
+            if url.startswith((GITHUB_RAW_URL, GITHUB_API_URL))
+            else requests.get
+        )
+        resp = get(url, stream=True, timeout=30)
         resp.raise_for_status()
+        size = resp.headers.get("Content-Length")
+        if max_bytes and size and size.isdigit() and int(size) > max_bytes:
+            resp.close()
+            raise ValueError(f"image larger than {max_bytes} bytes")
+        written = 0
         with open(dest_path, "wb") as fh:
             for chunk in resp.iter_content(8192):
+                written += len(chunk)
+                if max_bytes and written > max_bytes:
+                    break
                 fh.write(chunk)
+        if max_bytes and written > max_bytes:
+            resp.close()
+            os.remove(dest_path)
+            raise ValueError(f"image larger than {max_bytes} bytes")
         return True
     except Exception as e:
-        print(f"Failed to download image: {e}")
+        logger.warning("Failed to download image: %s", e)
         return False
 
 
-def main():
-    # 명령행 파서 설정
+def build_parser():
+    """명령행 파서를 생성합니다.
+
+    Returns:
+        argparse.ArgumentParser: 단일 저장소/배치 실행 옵션이 등록된 파서
+    """
     parser = argparse.ArgumentParser(
         description="Generate README, tags, and choose image for a GitHub repo."
     )
     parser.add_argument(
-        "repo", help="GitHub repository URL (e.g. https://github.com/owner/repo)"
+        "repo",
+        nargs="?",
+        help="GitHub repository URL (e.g. https://github.com/owner/repo)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help="File with one repository URL per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        default=4,
+        help="Repositories processed at the same time in batch mode (default: 4)",
+    )
+    parser.add_argument(
+        "--github-concurrency",
+        type=int,
+        default=16,
+        help="Maximum concurrent GitHub requests across all repositories (0: unlimited)",
+    )
+    parser.add_argument(
+        "--github-rate",
+        type=float,
+        default=None,
+        help="Average GitHub requests per second across all repositories "
+        "(tokens are read from GITHUB_TOKENS, comma separated, or GITHUB_TOKEN)",
+    )
+    parser.add_argument(
+        "--github-burst",
+        type=int,
+        default=None,
+        help="GitHub requests allowed in a burst above --github-rate",
+    )
+    parser.add_argument(
+        "--no-graphql",
+        action="store_true",
+        help="Use only the REST API instead of one GraphQL request per repository",
+    )
+    parser.add_argument(
+        "--groq-concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent Groq calls across all repositories (0: unlimited)",
+    )
+    parser.add_argument(
+        "--gemini-concurrency",
+        type=int,
+        default=2,
+        help="Maximum concurrent Gemini calls across all repositories (0: unlimited)",
+    )
+    parser.add_argument(
+        "--prompt-tokens",
+        type=int,
+        default=PROMPT_TOKEN_BUDGET,
+        help=f"Token budget for the README generation prompt (default: {PROMPT_TOKEN_BUDGET})",
+    )
+    parser.add_argument(
+        "--tag-timeout",
+        type=float,
+        default=MODEL_TIMEOUT,
+        help=f"Seconds to wait for each tag model (default: {MODEL_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--tag-quorum",
+        type=int,
+        default=None,
+        help="Continue once this many tag models have answered (default: all)",
+    )
+    parser.add_argument(
+        "--no-hedge",
+        action="store_true",
+        help="Do not re-send slow tag requests to a backup model",
+    )
+    parser.add_argument(
+        "--no-static-tags",
+        action="store_true",
+        help="Always ask the LLMs instead of tagging from imports and manifests first",
+    )
+    parser.add_argument(
+        "--min-static-tags",
+        type=int,
+        default=MIN_STATIC_TAGS,
+        help=f"Skip the tag LLMs when this many confident static tags are found (default: {MIN_STATIC_TAGS}, 0: never)",
+    )
+    parser.add_argument(
+        "--single-call",
+        action="store_true",
+        help="Generate README and tags with one LLM call (falls back to separate calls on invalid output)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Run README, tag and image stages concurrently with a shared README",
     )
     parser.add_argument(
         "--out", default="output", help="Output directory to save results"
@@ -71,89 +254,920 @@ def main():
     )
     parser.add_argument("--no-tags", action="store_true", help="Skip tag extraction")
     parser.add_argument("--no-image", action="store_true", help="Skip image fetching")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--fetch-mode",
+        choices=FETCH_MODES,
+        default="tree",
+        help="How to fetch repository files (default: tree)",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help=f"Concurrent file downloads (default: {DOWNLOAD_WORKERS})",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Analyze files as they are downloaded instead of fetching them all first",
+    )
+    parser.add_argument(
+        "--max-file-kb",
+        type=int,
+        default=MAX_FILE_BYTES // 1024,
+        help="Skip source files larger than this many KB",
+    )
+    parser.add_argument(
+        "--max-total-mb",
+        type=int,
+        default=None,
+        help="Stop fetching once this many MB of source have been collected",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for code analysis (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the download cache (default: <out>/.cache)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=CACHE_MAX_BYTES // (1024 * 1024),
+        help="Maximum cache size in MB before old entries are evicted",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the download cache"
+    )
+    parser.add_argument(
+        "--llm-cache-ttl-hours",
+        type=float,
+        default=LLM_CACHE_TTL / 3600,
+        help="Hours a cached LLM response stays valid",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Always call the LLM APIs instead of reusing cached responses",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        default=None,
+        help="Where to write run metrics as JSON (default: <out>/metrics.json)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Expose Prometheus metrics on this port while running",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as an HTTP service instead of processing a repository",
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="Service bind address")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=SERVICE_PORT,
+        help=f"Service port (default: {SERVICE_PORT})",
+    )
+    parser.add_argument(
+        "--service-workers",
+        type=int,
+        default=JOB_WORKERS,
+        help=f"Repositories processed at once by the service (default: {JOB_WORKERS})",
+    )
+    parser.add_argument(
+        "--max-queued-jobs",
+        type=int,
+        default=MAX_QUEUED_JOBS,
+        help="Jobs waiting for a worker before new submissions get HTTP 429",
+    )
+    return parser
 
-    # 입력값 및 출력 디렉터리 준비
-    repo = args.repo
-    outdir = os.path.abspath(args.out)
-    ensure_dir(outdir)
 
-    # 저장할 폴더 이름을 정규화 (owner/repo -> owner__repo)
-    repo_name = (
-        repo.rstrip("/\n").replace("https://github.com/", "").replace(".git", "")
-    )
-    repo_dir = os.path.join(outdir, repo_name.replace("/", "__"))
-    ensure_dir(repo_dir)
+def fetch_readme(repo):
+    """저장소의 README를 한 번 가져옵니다.
 
-    # 저장소 파일 다운로드
-    print(f"Fetching repository files for: {repo}")
+    태그 추출과 이미지 선택 단계가 같은 README를 공유하도록 사용합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+
+    Returns:
+        str: README 내용 (없거나 실패하면 빈 문자열)
+    """
     try:
-        files = DownloadRepoFiles(repo)
-        print(f"Fetched {len(files)} code files.")
+        return GetREADME(repo) or ""
     except Exception as e:
-        print(f"Error fetching repository files: {e}")
-        files = []
+        logger.warning("[%s] README fetch failed: %s", repo, e)
+        return ""
 
-    # README 생성 (외부 LLM API 사용 가능)
-    readme_path = os.path.join(repo_dir, "GENERATED_README.md")
-    if not args.no_readme:
+
+def shared_readme(readme):
+    """태그/이미지 단계가 공유하는 README를 반환합니다.
+
+    --pipeline에서는 README를 다른 단계와 동시에 가져오므로 Future로 전달되며,
+    실제로 README가 필요한 시점에만 기다립니다.
+
+    Args:
+        readme (str | Future | None): 미리 받은 README 또는 README를 담을 Future
+
+    Returns:
+        str | None: README 내용 (None이면 단계에서 직접 가져옴)
+    """
+    return readme.result() if isinstance(readme, Future) else readme
+
+
+def analyze_repo(repo, args, summary):
+    """저장소 파일을 받아 코드를 분석합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+
+    Returns:
+        tuple: AnalyzeRepository 결과 (저장소 이름, import, 함수, 주석)
+    """
+    # 저장소 파일 다운로드
+    fetch_options = {
+        "mode": args.fetch_mode,
+        "workers": args.fetch_workers,
+        "maxFileBytes": args.max_file_kb * 1024,
+        "maxTotalBytes": (
+            args.max_total_mb * 1024 * 1024 if args.max_total_mb is not None else None
+        ),
+    }
+    stage_start = time.perf_counter()
+    if args.stream:
+        # 파일을 받는 대로 README 생성 단계의 분석기로 바로 넘김
+        logger.info("Streaming repository files for: %s", repo)
+        files = IterRepoFiles(repo, **fetch_options)
+    else:
+        logger.info("Fetching repository files for: %s", repo)
         try:
-            print("Generating README (may call external API)...")
-            readme_text = GenerateREADME(repo, files)
-            save_text(readme_path, readme_text)
-            print(f"Saved generated README to: {readme_path}")
+            files = DownloadRepoFiles(repo, **fetch_options)
+            logger.info("Fetched %s code files.", len(files))
         except Exception as e:
-            print(f"README generation failed: {e}")
-    else:
-        print("Skipping README generation.")
+            stage_failed(summary, "fetch", e)
+            files = []
+        record_stage(summary, "fetch", stage_start)
+
+    # 스트리밍 모드에서는 다운로드 시간이 분석 시간에 포함됨
+    stage_start = time.perf_counter()
+    result = AnalyzeRepository(repo, files, workers=args.workers)
+    record_stage(summary, "analyze", stage_start)
+    return result
+
+
+def run_readme_stage(repo, args, repo_dir, summary, analysis=None):
+    """저장소 파일을 받아 README를 생성하고 저장합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        repo_dir (str): 저장소별 결과 디렉터리
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+        analysis (Future | None): 코드 분석 결과를 태그 단계와 공유할 Future
+            (이미 채워져 있으면 그 결과를 사용하고, 분석에 실패하면 None으로 채워짐)
+    """
+    # README 생성 (외부 LLM API 사용 가능)
+    readme_path = os.path.join(repo_dir, "GENERATED_README.md")
+    stage_start = time.perf_counter()
+    try:
+        result = None
+        if analysis is not None and analysis.done():
+            result = analysis.result()
+        if result is None:
+            result = analyze_repo(repo, args, summary)
+            if analysis is not None and not analysis.done():
+                analysis.set_result(result)
+
+        # pydantic 모델 정의 비용이 크므로 README 단계가 실행될 때만 import
+        from src.READMECreater.READMEGenerator import GenerateREADMEFromAnalysis
+
+        logger.info("Generating README (may call external API)...")
+        readme_text = GenerateREADMEFromAnalysis(result, args.prompt_tokens)
+        save_text(readme_path, readme_text)
+        logger.info("Saved generated README to: %s", readme_path)
+    except Exception as e:
+        stage_failed(summary, "readme", e)
+    finally:
+        if analysis is not None and not analysis.done():
+            analysis.set_result(None)
+    record_stage(summary, "readme", stage_start)
+
 
-    # README에서 태그(기술 스택) 추출 (멀티 모델 호출)
+def collect_static_tags(
+    repo, analysis=None, min_tags=None, wait_seconds=STATIC_ANALYSIS_WAIT
+):
+    """import와 manifest 파일로 정적 태그를 계산합니다.
+
+    manifest 파일로 먼저 계산하고, 그것만으로 확정 태그가 min_tags개 이상이면 바로 반환합니다.
+    부족하면 README 단계의 코드 분석 결과를 wait_seconds까지만 기다렸다가 import도 반영하며,
+    그때까지 분석이 끝나지 않으면 manifest 태그만 반환합니다 (--pipeline에서 태그 LLM 호출이
+    파일 다운로드가 끝날 때까지 밀리지 않도록).
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        analysis (Future | None): README 단계가 채우는 코드 분석 결과
+        min_tags (int | None): 기다리지 않아도 되는 확정 태그 수 (None이면 항상 기다림)
+        wait_seconds (float | None): 분석 결과를 기다리는 최대 시간 (None이면 끝날 때까지)
+
+    Returns:
+        list[tuple[str, float]]: (태그, 신뢰도) 목록 (실패하면 빈 목록)
+    """
+    try:
+        manifests = FetchNamedFiles(repo, MANIFEST_FILES)
+    except Exception as e:
+        logger.warning("[%s] manifest fetch failed: %s", repo, e)
+        manifests = []
+
+    static_tags = StaticTags(None, manifests)
+    if analysis is None:
+        return static_tags
+    if min_tags and len(ConfidentTags(static_tags)) >= min_tags:
+        return static_tags
+
+    done, _ = wait([analysis], timeout=wait_seconds)
+    if not done:
+        logger.info("[%s] code analysis still running, using manifest tags only", repo)
+        return static_tags
+    result = analysis.result()
+    return StaticTags(result[1], manifests) if result else static_tags
+
+
+def run_tags_stage(repo, args, readme, repo_dir, summary, analysis=None):
+    """README에서 태그(기술 스택)를 추출하고 저장합니다.
+
+    정적 분석(import, manifest)으로 충분한 태그가 나오면 LLM을 호출하지 않습니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        readme (str | Future | None): 미리 받은 README (None이면 단계에서 직접 가져옴)
+        repo_dir (str): 저장소별 결과 디렉터리
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+        analysis (Future | None): README 단계가 채우는 코드 분석 결과
+    """
     tags_path = os.path.join(repo_dir, "TAGS.json")
-    if not args.no_tags:
+    stage_start = time.perf_counter()
+    try:
+        static_tags = None
+        if not args.no_static_tags:
+            static_tags = collect_static_tags(repo, analysis, args.min_static_tags)
+
+        logger.info("Running tag extraction models (may call external APIs)...")
+        response = ModelThreading(
+            repo,
+            shared_readme(readme),
+            timeout=args.tag_timeout,
+            quorum=args.tag_quorum,
+            hedge=not args.no_hedge,
+            staticTags=static_tags,
+            minStaticTags=args.min_static_tags,
+        )
+        # ModelThreading의 반환값은 response-like 객체일 수 있으므로 텍스트를 추출
+        tags_text = None
+        if hasattr(response, "text"):
+            tags_text = response.text
+        else:
+            tags_text = str(response)
+
+        # 모델 출력이 JSON이면 파싱, 아니면 raw로 저장
         try:
-            print("Running tag extraction models (may call external APIs)...")
-            response = ModelThreading(repo)
-            # ModelThreading의 반환값은 response-like 객체일 수 있으므로 텍스트를 추출
-            tags_text = None
-            if hasattr(response, "text"):
-                tags_text = response.text
+            tags_json = json.loads(tags_text)
+        except Exception:
+            tags_json = {"raw": tags_text}
+
+        save_text(tags_path, json.dumps(tags_json, ensure_ascii=False, indent=2))
+        logger.info("Saved tags output to: %s", tags_path)
+    except Exception as e:
+        stage_failed(summary, "tags", e)
+    record_stage(summary, "tags", stage_start)
+
+
+def run_image_stage(repo, readme, repo_dir, summary):
+    """저장소에서 대표 이미지를 선택하여 다운로드합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        readme (str | None): 미리 받은 README (None이면 단계에서 직접 가져옴)
+        repo_dir (str): 저장소별 결과 디렉터리
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+    """
+    stage_start = time.perf_counter()
+    try:
+        logger.info("Choosing image from repository (README or repo files)...")
+        img_url = GetImageInGithub(repo, readme)
+        if img_url:
+            ext = os.path.splitext(img_url)[1].split("?")[0] or ".jpg"
+            img_dest = os.path.join(repo_dir, f"repo_image{ext}")
+            ok = download_file(img_url, img_dest)
+            if ok:
+                logger.info("Saved image to: %s", img_dest)
             else:
-                tags_text = str(response)
+                stage_failed(summary, "image", "download failed")
+        else:
+            logger.info("No image found for repository.")
+    except Exception as e:
+        stage_failed(summary, "image", e)
+    record_stage(summary, "image", stage_start)
+
+
+def record_stage(summary, stage, stage_start):
+    """단계 실행 시간을 요약과 지표에 기록합니다.
+
+    Args:
+        summary (dict): 저장소 요약
+        stage (str): 단계 이름
+        stage_start (float): time.perf_counter()로 잰 단계 시작 시각
+    """
+    seconds = time.perf_counter() - stage_start
+    STAGE_SECONDS.labels(stage=stage).observe(seconds)
+    summary["stages"][stage] = round(seconds, 3)
+
+
+def stage_failed(summary, stage, error):
+    """단계 실패를 출력하고 요약에 기록합니다.
+
+    Args:
+        summary (dict): 저장소 요약
+        stage (str): 실패한 단계 이름
+        error (Exception | str): 실패 원인
+    """
+    logger.warning("[%s] %s failed: %s", summary["repo"], stage, error)
+    STAGE_FAILURES.labels(stage=stage).inc()
+    summary["ok"] = False
+    summary["errors"][stage] = str(error)
+
 
-            # 모델 출력이 JSON이면 파싱, 아니면 raw로 저장
+def run_combined_stage(repo, args, readme, repo_dir, summary, analysis):
+    """한 번의 LLM 호출로 README와 태그를 함께 생성하고 저장합니다.
+
+    응답이 형식 검증에 실패하거나 호출이 실패하면 아무것도 저장하지 않고 False를 반환하며,
+    호출한 쪽에서 기존의 README/태그 단계로 대체합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        readme (str | Future | None): 미리 받은 README (None이면 단계에서 직접 가져옴)
+        repo_dir (str): 저장소별 결과 디렉터리
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+        analysis (Future): 코드 분석 결과를 대체 단계와 공유할 Future
+
+    Returns:
+        bool: README와 태그를 모두 저장했으면 True
+    """
+    stage_start = time.perf_counter()
+    try:
+        result = analyze_repo(repo, args, summary)
+        analysis.set_result(result)
+        readme = shared_readme(readme)
+        if readme is None:
+            readme = fetch_readme(repo)
+
+        from src.READMECreater.READMEGenerator import GenerateCombined
+
+        logger.info("Generating README and tags in one call (may call external API)...")
+        output = GenerateCombined(result, readme, args.prompt_tokens)
+        if output is None:
+            logger.warning(
+                "Single-call output was invalid; falling back to separate calls."
+            )
+            return False
+        readme_text, tags = output
+
+        # 정적 분석으로 확정된 태그와 합쳐 이름을 정규화
+        if not args.no_static_tags:
+            tags = MergeCleanTags(
+                ConfidentTags(collect_static_tags(repo, analysis)), tags
+            )
+
+        readme_path = os.path.join(repo_dir, "GENERATED_README.md")
+        save_text(readme_path, readme_text)
+        logger.info("Saved generated README to: %s", readme_path)
+        tags_path = os.path.join(repo_dir, "TAGS.json")
+        save_text(tags_path, json.dumps({"tags": tags}, ensure_ascii=False, indent=2))
+        logger.info("Saved tags output to: %s", tags_path)
+        return True
+    except Exception as e:
+        logger.warning("[%s] single-call generation failed, falling back: %s", repo, e)
+        return False
+    finally:
+        if not analysis.done():
+            analysis.set_result(None)
+        record_stage(summary, "combined", stage_start)
+
+
+def run_text_stages(repo, args, readme, repo_dir, summary, analysis, concurrent):
+    """README와 태그 단계를 실행합니다.
+
+    --single-call이면 한 번의 호출을 먼저 시도하고, 실패했을 때만 단계별 호출로 대체합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        readme (str | Future | None): 미리 받은 README
+        repo_dir (str): 저장소별 결과 디렉터리
+        summary (dict): 단계별 시간과 오류를 기록할 요약
+        analysis (Future | None): 코드 분석 결과를 공유할 Future
+        concurrent (bool): README와 태그 단계를 동시에 실행할지 여부
+    """
+    if args.single_call and not (args.no_readme or args.no_tags):
+        if run_combined_stage(repo, args, readme, repo_dir, summary, analysis):
+            return
+
+    stages = []
+    if not args.no_readme:
+        stages.append((run_readme_stage, (repo, args, repo_dir, summary, analysis)))
+    if not args.no_tags:
+        stages.append(
+            (run_tags_stage, (repo, args, readme, repo_dir, summary, analysis))
+        )
+
+    if not concurrent:
+        for stage, stage_args in stages:
+            stage(*stage_args)
+        return
+    with ThreadPoolExecutor(max_workers=max(1, len(stages))) as executor:
+        for future in [executor.submit(stage, *a) for stage, a in stages]:
+            future.result()
+
+
+def repo_output_dir(repo, outdir):
+    """저장소별 결과 디렉터리 경로를 반환합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        outdir (str): 결과를 저장할 최상위 디렉터리
+
+    Returns:
+        str: outdir 아래의 owner__repo 경로
+    """
+    # 저장할 폴더 이름을 정규화 (owner/repo -> owner__repo)
+    repo_name = (
+        repo.rstrip("/\n").replace("https://github.com/", "").replace(".git", "")
+    )
+    return os.path.join(outdir, repo_name.replace("/", "__"))
+
+
+def process_repo(repo, args, outdir):
+    """저장소 하나에 대해 README 생성, 태그 추출, 이미지 선택을 실행합니다.
+
+    각 단계의 실패는 다른 단계를 막지 않으며, 결과는 요약으로 반환됩니다.
+    --pipeline이면 README 생성을 먼저 시작하고, 그동안 README를 한 번만 가져와
+    태그/이미지 단계와 공유하여 전체 시간이 가장 느린 단계에 가까워지도록 합니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+        args (argparse.Namespace): 명령행 옵션
+        outdir (str): 결과를 저장할 최상위 디렉터리
+
+    Returns:
+        dict: 저장소, 성공 여부, 소요 시간, 단계별 시간과 오류를 담은 요약
+    """
+    started = time.perf_counter()
+    summary = {"repo": repo, "ok": True, "seconds": 0.0, "stages": {}, "errors": {}}
+
+    repo_dir = repo_output_dir(repo, outdir)
+    ensure_dir(repo_dir)
+
+    if args.no_readme:
+        logger.info("Skipping README generation.")
+    if args.no_tags:
+        logger.info("Skipping tag extraction.")
+    if args.no_image:
+        logger.info("Skipping image fetching.")
+
+    # README 단계의 코드 분석 결과(import)를 정적 태그 계산/한 번 호출 대체 경로에 재사용
+    analysis = None
+    if not (args.no_readme or args.no_tags) and (
+        args.single_call or not args.no_static_tags
+    ):
+        analysis = Future()
+
+    if not args.pipeline:
+        run_text_stages(repo, args, None, repo_dir, summary, analysis, False)
+        if not args.no_image:
+            run_image_stage(repo, None, repo_dir, summary)
+    else:
+        # README 생성(파일 다운로드, 분석, LLM 호출)을 먼저 시작하고, 그동안 README를
+        # 한 번만 받아 태그/이미지 단계와 공유 (태그 단계는 README가 필요할 때만 기다림)
+        readme = Future()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stages = [
+                executor.submit(
+                    run_text_stages,
+                    repo,
+                    args,
+                    readme,
+                    repo_dir,
+                    summary,
+                    analysis,
+                    True,
+                )
+            ]
+            text = None
             try:
-                tags_json = json.loads(tags_text)
-            except Exception:
-                tags_json = {"raw": tags_text}
+                if not (args.no_tags and args.no_image):
+                    text = fetch_readme(repo)
+            finally:
+                readme.set_result(text)
+            if not args.no_image:
+                stages.append(
+                    executor.submit(run_image_stage, repo, text, repo_dir, summary)
+                )
+            for stage in stages:
+                stage.result()
 
-            save_text(tags_path, json.dumps(tags_json, ensure_ascii=False, indent=2))
-            print(f"Saved tags output to: {tags_path}")
-        except Exception as e:
-            print(f"Tag extraction failed: {e}")
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def read_repo_list(path):
+    """배치 파일에서 저장소 URL 목록을 읽습니다.
+
+    빈 줄과 '#'으로 시작하는 줄은 건너뛰며, 중복 URL은 한 번만 처리합니다.
+
+    Args:
+        path (str): 저장소 목록 파일 경로 ('-'이면 표준 입력)
+
+    Returns:
+        list[str]: 저장소 URL 목록
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
     else:
-        print("Skipping tag extraction.")
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+    repos = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#") and line not in repos:
+            repos.append(line)
+    return repos
+
+
+def run_batch(repos, args, outdir):
+    """여러 저장소를 동시에 처리하고 요약을 JSONL로 저장합니다.
+
+    외부 서비스 호출 수는 저장소 수와 관계없이 공유 스케줄러의 제한을 따릅니다.
+
+    Args:
+        repos (list[str]): 처리할 저장소 URL 목록
+        args (argparse.Namespace): 명령행 옵션
+        outdir (str): 결과를 저장할 최상위 디렉터리
+
+    Returns:
+        list[dict]: 입력 순서대로 정렬된 저장소별 요약
+    """
+    summaries = [None] * len(repos)
+    workers = max(1, min(args.batch_workers, len(repos)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_repo, repo, args, outdir): index
+            for index, repo in enumerate(repos)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                summaries[index] = future.result()
+            except Exception as e:
+                summaries[index] = {
+                    "repo": repos[index],
+                    "ok": False,
+                    "seconds": 0.0,
+                    "stages": {},
+                    "errors": {"batch": str(e)},
+                }
+            status = "ok" if summaries[index]["ok"] else "failed"
+            logger.info("[%s/%s] %s: %s", index + 1, len(repos), repos[index], status)
+
+    summary_path = os.path.join(outdir, "batch_summary.jsonl")
+    save_text(
+        summary_path,
+        "".join(json.dumps(s, ensure_ascii=False) + "\n" for s in summaries),
+    )
+    logger.info("Saved batch summary to: %s", summary_path)
+    return summaries
+
+
+def configure(args):
+    """로그, 캐시, GitHub 클라이언트, 동시 호출 수 제한을 설정합니다.
+
+    CLI 실행과 서비스 모드가 같은 설정을 사용하며, 프로세스에서 한 번만 호출합니다.
+
+    Args:
+        args (argparse.Namespace): 명령행 옵션
+
+    Returns:
+        str: 결과를 저장할 최상위 디렉터리 (절대 경로)
+    """
+    logging.basicConfig(
+        level=args.log_level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    # 입력값 및 출력 디렉터리 준비
+    outdir = os.path.abspath(args.out)
+    ensure_dir(outdir)
+
+    # 다운로드 캐시 설정 (커밋/blob SHA 기준으로 재사용)
+    if not args.no_cache:
+        cache_dir = args.cache_dir or os.path.join(outdir, ".cache")
+        ConfigureCache(cache_dir, args.cache_max_mb * 1024 * 1024)
+
+        # LLM 응답 캐시 (같은 모델/프롬프트면 API를 다시 호출하지 않음)
+        if not args.no_llm_cache:
+            ConfigureLLMCache(
+                os.path.join(cache_dir, "llm", "responses.sqlite3"),
+                ttl=args.llm_cache_ttl_hours * 3600,
+            )
+
+    # GitHub 토큰 순환과 초당 요청 수 제한 (모든 저장소가 공유)
+    ConfigureGithub(
+        EnvTokens(),
+        rate=args.github_rate,
+        burst=args.github_burst,
+        graphql=not args.no_graphql,
+    )
+
+    # 외부 서비스별 동시 호출 수 제한 (모든 저장소가 공유)
+    ConfigureLimits(
+        github=args.github_concurrency,
+        groq=args.groq_concurrency,
+        gemini=args.gemini_concurrency,
+    )
+    return outdir
+
+
+def resolve_repo_key(repo):
+    """저장소 URL을 기본 브랜치의 최신 커밋 기준 키(owner/repo@SHA)로 바꿉니다.
+
+    같은 커밋에 대한 요청은 같은 키가 되어 서비스에서 하나의 작업으로 합쳐집니다.
+
+    Args:
+        repo (str): GitHub 저장소 URL
+
+    Returns:
+        str: owner/repo@커밋 SHA
+
+    Raises:
+        ValueError: GitHub 저장소 URL이 아닌 경우
+        GithubError: GitHub가 저장소 정보나 커밋을 반환하지 않은 경우
+    """
+    if not repo.startswith("https://github.com/"):
+        raise ValueError("repository URL must start with https://github.com/")
+    repo_path = GetRepoPath(repo)
+    if repo_path.count("/") != 1:
+        raise ValueError("repository URL must look like https://github.com/owner/repo")
+    return f"{repo_path}@{GetCommitSha(repo_path, GetDefaultBranch(repo_path))}"
+
+
+def read_job_result(summary, repo_dir):
+    """작업 디렉터리에 저장된 README, 태그, 이미지 파일 이름을 읽어 결과로 묶습니다.
+
+    Args:
+        summary (dict): process_repo가 반환한 요약
+        repo_dir (str): 저장소별 결과 디렉터리
+
+    Returns:
+        dict: summary, readme, tags, image(파일 경로 또는 None)
+    """
+    result = {"summary": summary, "readme": None, "tags": None, "image": None}
+    readme_path = os.path.join(repo_dir, "GENERATED_README.md")
+    if os.path.exists(readme_path):
+        with open(readme_path, "r", encoding="utf-8") as fh:
+            result["readme"] = fh.read()
+    tags_path = os.path.join(repo_dir, "TAGS.json")
+    if os.path.exists(tags_path):
+        with open(tags_path, "r", encoding="utf-8") as fh:
+            result["tags"] = json.load(fh)
+    for name in sorted(os.listdir(repo_dir)):
+        if name.startswith("repo_image"):
+            result["image"] = os.path.join(repo_dir, name)
+    return result
+
+
+def job_dir(outdir, job_id):
+    """서비스 작업별 결과 디렉터리 경로를 반환합니다.
+
+    Args:
+        outdir (str): 결과를 저장할 최상위 디렉터리
+        job_id (str): 작업 ID
+
+    Returns:
+        str: outdir/jobs/<작업 ID>
+    """
+    return os.path.join(outdir, "jobs", job_id)
+
+
+def run_service_job(job_id, payload, args, outdir):
+    """서비스 worker에서 저장소 하나를 처리하고 결과를 반환합니다.
+
+    LLM 클라이언트, GitHub 세션과 캐시는 프로세스 안에서 작업 사이에 재사용됩니다.
+
+    Args:
+        job_id (str): 작업 ID (결과 디렉터리 이름)
+        payload (dict): {"repo": 저장소 URL}
+        args (argparse.Namespace): 서비스 시작 시 받은 옵션
+        outdir (str): 결과를 저장할 최상위 디렉터리
+
+    Returns:
+        dict: read_job_result의 결과
+    """
+    repo = payload["repo"]
+    out = job_dir(outdir, job_id)
+    summary = process_repo(repo, args, out)
+    EvictCache()
+    return read_job_result(summary, repo_output_dir(repo, out))
+
+
+def create_app(args=None):
+    """작업 대기열을 가진 FastAPI 서비스를 만듭니다.
+
+    POST /jobs로 저장소를 제출하면 즉시 작업 ID를 반환하고, 제한된 수의 worker가
+    대기열에서 작업을 꺼내 처리합니다. 같은 저장소@커밋의 진행 중인 작업은 하나로
+    합쳐지며, 대기열이 가득 차면 429와 Retry-After로 응답합니다.
+
+    Args:
+        args (argparse.Namespace | None): 옵션 (None이면 README_CREATER_ARGS 환경 변수를 파싱)
+
+    Returns:
+        fastapi.FastAPI: 서비스 앱
+    """
+    # 서비스 모드에서만 필요한 라이브러리 (CLI 시작 시간에 영향을 주지 않도록 여기서 import)
+    from contextlib import asynccontextmanager
+
+    from fastapi import FastAPI, HTTPException
+    from fastapi.responses import FileResponse, JSONResponse
+    from prometheus_fastapi_instrumentator import Instrumentator
+    from pydantic import BaseModel
+
+    if args is None:
+        args = build_parser().parse_args(shlex.split(os.getenv(SERVICE_ARGS_ENV, "")))
+    outdir = configure(args)
+
+    jobs = NewJobQueue(
+        lambda job_id, payload: run_service_job(job_id, payload, args, outdir),
+        workers=args.service_workers,
+        maxQueued=args.max_queued_jobs,
+        onEvict=lambda job: shutil.rmtree(
+            job_dir(outdir, job["id"]), ignore_errors=True
+        ),
+    )
+
+    class JobRequest(BaseModel):
+        repo: str
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        # 대기 중인 작업은 취소하고 실행 중인 작업이 끝나면 종료한 뒤 캐시 크기를 정리
+        StopJobQueue(jobs)
+        EvictCache()
+
+    app = FastAPI(title="README Creater", lifespan=lifespan)
+    Instrumentator(registry=REGISTRY).instrument(app).expose(
+        app, include_in_schema=False
+    )
+
+    def find_job(job_id):
+        job = GetJob(jobs, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="job not found")
+        return job
+
+    def job_status(job):
+        return {name: value for name, value in job.items() if name != "result"}
+
+    def queue_full():
+        return JSONResponse(
+            status_code=429,
+            content={"detail": "job queue is full"},
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+    @app.post("/jobs", status_code=202)
+    def submit_job(request: JobRequest):
+        # 대기열이 가득 차 있으면 GitHub 요청 없이 바로 거절
+        if QueueFull(jobs):
+            return queue_full()
 
-    # 저장소에서 대표 이미지 선택 및 다운로드
-    if not args.no_image:
         try:
-            print("Choosing image from repository (README or repo files)...")
-            img_url = GetImageInGithub(repo)
-            if img_url:
-                ext = os.path.splitext(img_url)[1].split("?")[0] or ".jpg"
-                img_dest = os.path.join(repo_dir, f"repo_image{ext}")
-                ok = download_file(img_url, img_dest)
-                if ok:
-                    print(f"Saved image to: {img_dest}")
-                else:
-                    print("Image download failed.")
+            key = resolve_repo_key(request.repo.strip())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except GithubError as e:
+            # 저장소가 없으면 404, rate limit은 503, 그 밖의 GitHub 오류는 502
+            if e.status == 404:
+                status_code = 404
+            elif e.status in (403, 429):
+                status_code = 503
             else:
-                print("No image found for repository.")
-        except Exception as e:
-            print(f"Image fetching failed: {e}")
+                status_code = 502
+            raise HTTPException(
+                status_code=status_code, detail=f"cannot resolve repository: {e}"
+            )
+        except requests.RequestException as e:
+            raise HTTPException(status_code=503, detail=f"GitHub unavailable: {e}")
+
+        job, coalesced = SubmitJob(jobs, key, {"repo": request.repo.strip()})
+        if job is None:
+            return queue_full()
+        return {**job_status(job), "coalesced": coalesced}
+
+    @app.get("/jobs/{job_id}")
+    def get_job(job_id: str):
+        return job_status(find_job(job_id))
+
+    @app.get("/jobs/{job_id}/result")
+    def get_job_result(job_id: str):
+        job = find_job(job_id)
+        if job["status"] == "failed":
+            raise HTTPException(status_code=500, detail=job["error"])
+        if job["status"] != "done":
+            return JSONResponse(status_code=409, content=job_status(job))
+        result = dict(job["result"])
+        if result["image"]:
+            result["image"] = f"/jobs/{job_id}/image"
+        return result
+
+    @app.get("/jobs/{job_id}/image")
+    def get_job_image(job_id: str):
+        job = find_job(job_id)
+        if job["status"] != "done" or not job["result"]["image"]:
+            raise HTTPException(status_code=404, detail="no image for this job")
+        return FileResponse(job["result"]["image"])
+
+    @app.get("/health")
+    def health():
+        return QueueStats(jobs)
+
+    return app
+
+
+def __getattr__(name):
+    """`uvicorn main:app`으로 실행할 때 서비스 앱을 처음 접근하는 시점에 만듭니다.
+
+    CLI 실행에서는 FastAPI를 import하지 않도록 모듈 속성을 지연 생성합니다.
+    """
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main():
+    args = build_parser().parse_args()
+    if args.serve:
+        import uvicorn
+
+        uvicorn.run(
+            create_app(args),
+            host=args.host,
+            port=args.port,
+            log_level=args.log_level.lower(),
+        )
+        return
+    if bool(args.repo) == bool(args.batch):
+        build_parser().error("provide either a repository URL or --batch FILE")
+
+    outdir = configure(args)
+    if args.metrics_port:
+        StartMetricsServer(args.metrics_port)
+
+    if args.batch:
+        repos = read_repo_list(args.batch)
+        logger.info("Processing %s repositories...", len(repos))
+        run_batch(repos, args, outdir)
     else:
-        print("Skipping image fetching.")
+        process_repo(args.repo, args, outdir)
+
+    # 캐시 크기가 제한을 넘었으면 오래된 항목 정리
+    EvictCache()
+
+    # 실행별 지표 저장 (단계/요청/캐시/LLM 토큰)
+    metrics_path = args.metrics_json or os.path.join(outdir, "metrics.json")
+    WriteMetricsJson(metrics_path)
+    logger.info("Saved metrics to: %s", metrics_path)
 
-    print("Done.")
+    logger.info("Done.")
 
 
 if __name__ == "__main__":
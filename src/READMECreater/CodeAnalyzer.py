@@ -1,35 +1,290 @@
 import re
 import ast
-from collections import Counter
-from src.READMECreater.GithubFetcher import GetLanguageExtensions
-
-
-# 공통 주석 추출 함수
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from collections import Counter, deque
+from src.READMECreater.LanguageRegistry import (
+    GetAnalyzer,
+    GetLanguage,
+    RegisterAnalyzer,
+)
+from src.Utils.Cache import BlobSha, GetCacheDir, ReadJson, WriteJson
+from src.Utils.Metrics import ANALYZER_SECONDS, FILES_ANALYZED, RecordCache
+
+# 분석 결과 캐시 버전 (분석 로직이 바뀌면 올려서 이전 결과를 무효화)
+ANALYZER_VERSION = 4
+
+# 병렬 분석 시 worker 하나에 한 번에 넘기는 파일 수
+ANALYZE_CHUNK_SIZE = 32
+
+# 비정상 입력 방지: 이보다 긴 줄이 있으면 minified/생성 파일로 보고 분석하지 않음
+MAX_LINE_LENGTH = 4000
+# 이보다 큰 파일은 분석하지 않음
+MAX_CODE_CHARS = 2_000_000
+WORD_PATTERN = re.compile(r"\b\w+\b")
+
+# 함수 이름으로 잡히면 안 되는 제어문 키워드
+CONTROL_KEYWORDS = {
+    "if",
+    "for",
+    "while",
+    "switch",
+    "catch",
+    "return",
+    "else",
+    "do",
+    "try",
+    "synchronized",
+    "sizeof",
+    "new",
+}
+
+# 여러 언어에서 공통으로 쓰는 토큰 패턴
+DOUBLE_QUOTED = r'"(?:[^"\\\n]|\\.)*"'
+SINGLE_QUOTED = r"'(?:[^'\\\n]|\\.)*'"
+# 닫히지 않은 여러 줄 주석은 파일 끝까지 주석으로 봄
+# (끝을 찾지 못한 "/*"마다 파일 끝까지 다시 훑으면 시간이 제곱으로 늘어남)
+C_BLOCK_COMMENT = r"(?s:/\*.*?(?:\*/|\Z))"
+C_LINE_COMMENT = r"//(.*)"
+
+
+# (종류, 패턴) 목록을 하나의 정규식으로 합치는 함수
+# 각 패턴을 그룹으로 감싸 두고, 매치된 바깥 그룹 번호로 종류를 찾음
+# - triggerChars : 규칙이 시작될 수 있는 문자 (주석/문자열 시작 등)
+# - triggerWords : 규칙이 시작되는 키워드 (import, def 등)
+# - nameFollowers : 이름 뒤에 오면 규칙이 시작될 수 있는 문자 (함수 정의의 "(" 등)
+# 나머지 구간과 "skip" 규칙(문자열 리터럴)은 되돌아가지 않는(possessive) 반복으로
+# 한 번에 건너뛰어 위치마다 모든 규칙을 시도하지 않도록 함
+def CompileScanner(
+    rules, triggerChars=None, triggerWords=(), nameFollowers="", flags=re.MULTILINE
+):
+    skips = []
+    if triggerChars is not None:
+        skips = [pattern for kind, pattern in rules if kind == "skip"]
+        rules = [(kind, pattern) for kind, pattern in rules if kind != "skip"]
+
+    # 어떤 규칙에도 맞지 않는 단어/문자는 한 번에 소비하여 같은 위치를 다시 보지 않음
+    rules = list(rules) + [("skip", r"\w+|(?s:.)|\Z")]
+
+    parts, groups, index = [], {}, 1
+    for kind, pattern in rules:
+        inner = re.compile(pattern, flags).groups
+        parts.append(f"({pattern})")
+        groups[index] = (kind, range(index + 1, index + 1 + inner))
+        index += 1 + inner
+
+    prefix = ""
+    if triggerChars is not None:
+        word = r"\w++"
+        if triggerWords:
+            word = f"(?!(?:{'|'.join(triggerWords)})\\b){word}"
+        if nameFollowers:
+            word += f"(?!\\s*[{re.escape(nameFollowers)}])"
+        plain = [f"[^\\w{re.escape(triggerChars)}]++", word] + skips
+        prefix = f"(?:{'|'.join(plain)})*+"
+
+    return re.compile(prefix + "(?:" + "|".join(parts) + ")", flags), groups
+
+
+# 코드를 한 번만 훑으면서 import, 함수, 주석을 함께 추출하는 함수
+# - skip : 문자열 리터럴 (안의 // 나 # 를 주석으로 잡지 않기 위함)
+# - block : 여러 줄 주석 (앞뒤 공백 제거)
+def ScanCode(scanner, code):
+    regex, groups = scanner
+    found = {"import": [], "function": [], "comment": []}
+
+    for match in regex.finditer(code):
+        kind, inner = groups[match.lastindex]
+        if kind == "skip":
+            continue
+
+        value = next(
+            (match.group(i) for i in inner if match.group(i) is not None),
+            match.group(match.lastindex),
+        )
+        if kind == "block":
+            found["comment"].append(value.strip())
+        elif kind == "importblock":
+            found["import"].extend(GO_IMPORT_PATH.findall(value))
+        elif kind == "function" and value in CONTROL_KEYWORDS:
+            continue
+        else:
+            found[kind].append(value)
+
+    return found["import"], found["function"], found["comment"]
+
+
+# minified 번들이나 거대한 생성 파일처럼 분석이 오래 걸릴 입력인지 확인하는 함수
+def IsPathological(code):
+    if len(code) > MAX_CODE_CHARS:
+        return True
+    return max(map(len, code.splitlines()), default=0) > MAX_LINE_LENGTH
+
+
+# 주석 패턴 조합별 스캐너를 한 번만 컴파일하여 재사용
+@lru_cache(maxsize=32)
+def CommentScanner(singleComment, multiComment):
+    return CompileScanner(
+        [("block", f"(?s:{multiComment})"), ("comment", singleComment)]
+    )
+
+
+# 공통 주석 추출 함수 (단일/다중 주석을 한 번의 스캔으로 추출)
 def ExtractComments(code, singleComment, multiComment):
-    # 단일 주석 추출
-    singleLineComments = re.findall(singleComment, code, re.MULTILINE)
-    # 다중 주석 추출
-    MultiLineComments = re.findall(multiComment, code, re.DOTALL)
-    return singleLineComments + [c.strip() for c in MultiLineComments]
+    return ScanCode(CommentScanner(singleComment, multiComment), code)[2]
+
+
+# 언어별 스캐너 (모듈 로드 시 한 번만 컴파일)
+PYTHON_COMMENT_RULES = [
+    ("block", r'(?s:""".*?(?:"""|\Z)|\'\'\'.*?(?:\'\'\'|\Z))'),
+    # 따옴표 세 개는 docstring이므로 일반 문자열로 건너뛰지 않음
+    ("skip", r'(?!""")' + DOUBLE_QUOTED),
+    ("skip", r"(?!''')" + SINGLE_QUOTED),
+    ("comment", r"#(.*)"),
+]
+PYTHON_COMMENT_SCANNER = CompileScanner(PYTHON_COMMENT_RULES, triggerChars="#\"'")
+
+# 문법 오류로 AST를 만들 수 없는 Python 파일용 정규식 스캐너
+PYTHON_FALLBACK_SCANNER = CompileScanner(
+    PYTHON_COMMENT_RULES
+    + [
+        ("import", r"^[ \t]*import[ \t]+([\w.]+)"),
+        ("import", r"^[ \t]*from[ \t]+([\w.]+)[ \t]+import\b"),
+        ("function", r"\bdef[ \t]+(\w+)"),
+    ],
+    triggerChars="#\"'",
+    triggerWords=("import", "from", "def"),
+)
+
+JAVA_SCANNER = CompileScanner(
+    [
+        ("block", C_BLOCK_COMMENT),
+        ("comment", C_LINE_COMMENT),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        ("import", r"\bimport\s+(?:static\s+)?([\w.]+(?:\.\*)?)\s*;"),
+        (
+            "function",
+            r"\b(\w+)\s*\([^()\n;]*\)\s*(?:throws\s+[\w.,\s]+)?\{",
+        ),
+    ],
+    triggerChars="/\"'",
+    triggerWords=("import",),
+    nameFollowers="(",
+)
+
+JS_SCANNER = CompileScanner(
+    [
+        ("block", C_BLOCK_COMMENT),
+        ("comment", C_LINE_COMMENT),
+        (
+            "import",
+            r"\bimport\s+(?:[\w$*,\s]|\{[^{}]*\})*?\bfrom\s*['\"]([^'\"\n]+)['\"]",
+        ),
+        ("import", r"\bimport\s*['\"]([^'\"\n]+)['\"]"),
+        ("import", r"\brequire\s*\(\s*['\"]([^'\"\n]+)['\"]\s*\)"),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        ("skip", r"`(?:[^`\\]|\\.)*`"),
+        ("function", r"\bfunction\s*\*?\s*(\w+)\s*\("),
+        (
+            "function",
+            r"\b(\w+)\s*=\s*(?:async\s+)?(?:\([^()\n]*\)|\w+)\s*=>",
+        ),
+    ],
+    triggerChars="/\"'`",
+    triggerWords=("import", "require", "function"),
+    nameFollowers="=",
+)
+
+C_SCANNER = CompileScanner(
+    [
+        ("block", C_BLOCK_COMMENT),
+        ("comment", C_LINE_COMMENT),
+        ("import", r"#\s*include\s*<([^>\n]*)>"),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        (
+            "function",
+            r"\b(\w+)\s*\([^()\n;]*\)\s*(?:const\s*)?\{",
+        ),
+    ],
+    triggerChars="/\"'#",
+    nameFollowers="(",
+)
+
+GO_IMPORT_PATH = re.compile(r'"([^"\n]*)"')
+GO_SCANNER = CompileScanner(
+    [
+        ("block", C_BLOCK_COMMENT),
+        ("comment", C_LINE_COMMENT),
+        ("import", r'\bimport\s+(?:[\w.]+\s+)?"([^"\n]*)"'),
+        ("importblock", r"\bimport\s*\(([^)]*)\)"),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        ("skip", r"`[^`]*`"),
+        ("function", r"\bfunc\s+(?:\([^()\n]*\)\s*)?(\w+)\s*[\[(]"),
+    ],
+    triggerChars="/\"'`",
+    triggerWords=("import", "func"),
+)
+
+PHP_SCANNER = CompileScanner(
+    [
+        ("block", C_BLOCK_COMMENT),
+        ("comment", C_LINE_COMMENT),
+        (
+            "import",
+            r"\b(?:require|include)(?:_once)?\s*\(?\s*['\"]([^'\"\n]*)['\"]\s*\)?\s*;",
+        ),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        ("function", r"\bfunction\s+&?\s*(\w+)\s*\("),
+    ],
+    triggerChars="/\"'",
+    triggerWords=("(?:require|include)(?:_once)?", "function"),
+)
+
+RUBY_SCANNER = CompileScanner(
+    [
+        ("block", r"(?s:^=begin\b(.*?)(?:^=end\b|\Z))"),
+        ("comment", r"#(.*)"),
+        ("import", r"\brequire(?:_relative)?\s*\(?\s*['\"]([^'\"\n]*)['\"]"),
+        ("skip", DOUBLE_QUOTED),
+        ("skip", SINGLE_QUOTED),
+        ("function", r"\bdef\s+(?:self\.)?(\w+)"),
+    ],
+    triggerChars="#\"'=",
+    triggerWords=("require(?:_relative)?", "def"),
+)
 
 
 # Python 코드 분석
 def AnalyzePythonCode(code):
+    if IsPathological(code):
+        return [], [], []
+
     # Python AST를 사용하여 코드 분석
-    tree = ast.parse(code)
-    # import 및 from import 구문 추출
-    imports = [
-        node.names[0].name for node in ast.walk(tree) if isinstance(node, ast.Import)
-    ]
-    froms = [node.module for node in ast.walk(tree) if isinstance(node, ast.ImportFrom)]
+    # Python 2 문법 등으로 파싱에 실패하면 정규식 스캐너로 대체
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError, RecursionError):
+        return ScanCode(PYTHON_FALLBACK_SCANNER, code)
+
+    # import, from import, 함수 정의를 한 번의 순회로 추출
+    imports, froms, functions = [], [], []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.append(node.names[0].name)
+        elif isinstance(node, ast.ImportFrom):
+            froms.append(node.module)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append(node.name)
     imports.extend(froms)
 
-    # 함수 정의 추출
-    functions = [
-        node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)
-    ]
     # 주석 추출
-    comments = ExtractComments(code, r"#(.*)", r'""".*?"""|\'\'\'.*?\'\'\'')
+    comments = ScanCode(PYTHON_COMMENT_SCANNER, code)[2]
 
     return imports, functions, comments
 
@@ -37,56 +292,45 @@ def AnalyzePythonCode(code):
 """ Python을 제외하곤 AST를 사용하지 않고 정규 표현식으로 분석합니다.
     - 이유 : Python은 AST를 사용하여 코드 구조를 더 정확하게 분석할 수 있지만,
     나머지 언어들은 외부 라이브러리 사용 시 설치가 필요하고, 복잡도가 증가합니다.
+    - 언어마다 미리 컴파일한 스캐너로 한 번만 훑어 import, 함수, 주석을 함께 추출합니다.
 """
 
 
+# 스캐너 기반 분석 공통 함수 (비정상 입력은 건너뜀)
+def AnalyzeWithScanner(scanner, code):
+    if IsPathological(code):
+        return [], [], []
+    return ScanCode(scanner, code)
+
+
 # Java 코드 분석
 def AnalyzeJavaCode(code):
-    imports = re.findall(r"import\s+([\w.]+);", code)
-    functions = re.findall(r"\s+(\w+)\s*\(.*\)\s*\{", code)
-    comments = ExtractComments(code, r"//(.*)", r"/\*.*?\*/")
-    return imports, functions, comments
+    return AnalyzeWithScanner(JAVA_SCANNER, code)
 
 
 # JavaScript/TypeScript 코드 분석
 def AnalyzeJSCode(code):
-    imports = re.findall(r"import\s+.*?from\s+['\"](.*?)['\"]", code)
-    functions = re.findall(r"function\s+(\w+)|(\w+)\s*=\s*\(?.*?\)?\s*=>", code)
-    functions = [f[0] if f[0] else f[1] for f in functions]
-    comments = ExtractComments(code, r"//(.*)", r"/\*.*?\*/")
-    return imports, functions, comments
+    return AnalyzeWithScanner(JS_SCANNER, code)
 
 
 # C, C++, C# 코드 분석
 def AnalyzeCCode(code):
-    imports = re.findall(r"#include\s+<(.*?)>", code)
-    functions = re.findall(r"\b\w+\s+(\w+)\s*\(.*?\)\s*\{", code)
-    comments = ExtractComments(code, r"//(.*)", r"/\*.*?\*/")
-    return imports, functions, comments
+    return AnalyzeWithScanner(C_SCANNER, code)
 
 
 # Go 코드 분석
 def AnalyzeGoCode(code):
-    imports = re.findall(r"import\s+\"(.*?)\"", code)
-    functions = re.findall(r"func\s+(\w+)\s*\(", code)
-    comments = ExtractComments(code, r"//(.*)", r"/\*.*?\*/")
-    return imports, functions, comments
+    return AnalyzeWithScanner(GO_SCANNER, code)
 
 
 # PHP 코드 분석
 def AnalyzePhpCode(code):
-    imports = re.findall(r"require(_once)?\s*\(?['\"](.*?)['\"]\)?;", code)
-    functions = re.findall(r"function\s+(\w+)\s*\(", code)
-    comments = ExtractComments(code, r"//(.*)", r"/\*.*?\*/")
-    return [imp[1] for imp in imports], functions, comments
+    return AnalyzeWithScanner(PHP_SCANNER, code)
 
 
 # Ruby 코드 분석
 def AnalyzeRubyCode(code):
-    imports = re.findall(r"require\s+['\"](.*?)['\"]", code)
-    functions = re.findall(r"def\s+(\w+)", code)
-    comments = ExtractComments(code, r"#(.*)", r"=begin(.*?)=end")
-    return imports, functions, comments
+    return AnalyzeWithScanner(RUBY_SCANNER, code)
 
 
 # 키워드 기반 요약 함수 중복 제거 및 요약 (n개 선택)
@@ -97,7 +341,7 @@ def SummarizeKeywords(items, maxCategories=30):
     keywordCount = Counter()
 
     for item in items:
-        words = re.findall(r"\b\w+\b", item)  # 단어 추출
+        words = WORD_PATTERN.findall(item)  # 단어 추출
         for word in words:
             keywordCount[word.lower()] += 1  # 빈도수 계산
 
@@ -112,35 +356,148 @@ def SummarizeKeywords(items, maxCategories=30):
     return [summary]
 
 
-# 저장소 파일 분석 함수
-def AnalyzeRepository(repoName, repoFiles):
-    allImports, allFunctions, allComments = set(), set(), set()
-    langExts = GetLanguageExtensions()
-
-    for fileName, fileContent in repoFiles:
-        for lang, extensions in langExts.items():
-            if isinstance(extensions, str):
-                extensions = [extensions]
-            if any(fileName.endswith(ext) for ext in extensions):
-                if lang == "python":
-                    imports, functions, comments = AnalyzePythonCode(fileContent)
-                elif lang == "java":
-                    imports, functions, comments = AnalyzeJavaCode(fileContent)
-                elif lang in ["javascript", "typescript"]:
-                    imports, functions, comments = AnalyzeJSCode(fileContent)
-                elif lang in ["c", "cpp", "csharp"]:
-                    imports, functions, comments = AnalyzeCCode(fileContent)
-                elif lang == "go":
-                    imports, functions, comments = AnalyzeGoCode(fileContent)
-                elif lang == "php":
-                    imports, functions, comments = AnalyzePhpCode(fileContent)
-                elif lang == "ruby":
-                    imports, functions, comments = AnalyzeRubyCode(fileContent)
-                else:
-                    continue
-
-                allImports.update(imports)
-                allFunctions.update(functions)
-                allComments.update(comments)
+# 언어에 등록된 분석 함수로 파일 하나를 분석하는 함수
+def AnalyzeFile(lang, fileContent):
+    analyzer = GetAnalyzer(lang)
+    return analyzer(fileContent) if analyzer else None
+
+
+# 파일 묶음을 분석하는 함수 (병렬 분석 시 worker 프로세스에서 실행)
+# 지표는 부모 프로세스에서 기록하도록 파일별 분석 시간을 함께 반환
+def AnalyzeChunk(chunk):
+    results = []
+    for lang, fileContent in chunk:
+        start = time.perf_counter()
+        result = AnalyzeFile(lang, fileContent)
+        results.append((result, time.perf_counter() - start))
+    return results
+
+
+# 분석 결과 캐시 키 (캐시가 꺼져 있으면 None)
+def AnalysisCacheKey(lang, fileContent):
+    if not GetCacheDir():
+        return None
+    return f"v{ANALYZER_VERSION}-{lang}-{BlobSha(fileContent)}"
+
+
+# 캐시된 파일 분석 결과를 읽는 함수
+def ReadAnalysis(key):
+    cached = ReadJson("analysis", key) if key else None
+    if cached is None:
+        return None
+    return cached["imports"], cached["functions"], cached["comments"]
+
+
+# 파일 분석 결과를 캐시에 저장하는 함수
+def WriteAnalysis(key, result):
+    if not key:
+        return
+    imports, functions, comments = result
+    WriteJson(
+        "analysis",
+        key,
+        {
+            "imports": list(imports),
+            "functions": list(functions),
+            "comments": list(comments),
+        },
+    )
+
+
+# 파일별 분석 결과를 하나로 합치는 함수
+# merged를 넘기면 기존 결과에 이어서 합침
+# import는 프롬프트에서 중요도를 매길 수 있도록 사용한 파일 수를 셈
+def MergeAnalysis(results, merged=None):
+    allImports, allFunctions, allComments = merged or (Counter(), set(), set())
+    for imports, functions, comments in results:
+        allImports.update(set(imports))
+        allFunctions.update(functions)
+        allComments.update(comments)
+    return allImports, allFunctions, allComments
+
+
+# 분석이 끝난 묶음의 결과를 캐시에 저장하고 요약에 합치는 함수
+def CollectChunk(keys, langs, chunkResult, merged):
+    results = []
+    for key, lang, (result, seconds) in zip(keys, langs, chunkResult):
+        FILES_ANALYZED.labels(language=lang, source="analyzed").inc()
+        ANALYZER_SECONDS.labels(language=lang).observe(seconds)
+        if result is None:
+            continue
+        WriteAnalysis(key, result)
+        results.append(result)
+    MergeAnalysis(results, merged)
+
+
+# 모인 묶음을 분석하는 함수
+# 프로세스 풀이 있으면 제출만 하고, 대기 중인 묶음 수를 제한하여 파일 내용이 메모리에 쌓이지 않도록 함
+def SubmitChunk(chunk, pool, inFlight, merged, workers):
+    keys = [key for key, _, _ in chunk]
+    langs = [lang for _, lang, _ in chunk]
+    job = [(lang, fileContent) for _, lang, fileContent in chunk]
+    if pool is None:
+        CollectChunk(keys, langs, AnalyzeChunk(job), merged)
+        return
+
+    inFlight.append((keys, langs, pool.submit(AnalyzeChunk, job)))
+    while len(inFlight) > workers * 2:
+        doneKeys, doneLangs, future = inFlight.popleft()
+        CollectChunk(doneKeys, doneLangs, future.result(), merged)
+
 
+# 저장소 파일 분석 함수
+# - repoFiles는 리스트뿐 아니라 파일을 받는 대로 내보내는 iterator도 가능하며,
+#   파일 내용은 분석이 끝나면 바로 버리고 import/함수/주석 요약만 유지
+# - 바뀌지 않은 파일은 blob 해시로 캐시된 결과를 사용하므로 변경된 파일만 다시 분석
+# - workers가 2 이상이면 파일을 묶음 단위로 나눠 여러 프로세스에서 분석
+# - import는 {이름: 사용한 파일 수} Counter로 반환
+def AnalyzeRepository(repoName, repoFiles, workers=1):
+    merged = (Counter(), set(), set())
+    pool, inFlight, chunk = None, deque(), []
+
+    try:
+        for fileName, fileContent in repoFiles:
+            lang = GetLanguage(fileName)
+            if lang is None or GetAnalyzer(lang) is None:
+                continue
+            key = AnalysisCacheKey(lang, fileContent)
+            cached = ReadAnalysis(key)
+            if key:
+                RecordCache("analysis", cached is not None)
+            if cached is not None:
+                FILES_ANALYZED.labels(language=lang, source="cache").inc()
+                MergeAnalysis([cached], merged)
+                continue
+
+            chunk.append((key, lang, fileContent))
+            if len(chunk) >= ANALYZE_CHUNK_SIZE:
+                # 묶음이 하나 이상 찰 만큼 파일이 많을 때만 프로세스 풀 생성
+                if workers > 1 and pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                SubmitChunk(chunk, pool, inFlight, merged, workers)
+                chunk = []
+
+        if chunk:
+            SubmitChunk(chunk, pool, inFlight, merged, workers)
+        while inFlight:
+            keys, langs, future = inFlight.popleft()
+            CollectChunk(keys, langs, future.result(), merged)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    allImports, allFunctions, allComments = merged
     return repoName, allImports, allFunctions, allComments
+
+
+# 언어별 분석 함수 등록
+RegisterAnalyzer("python", AnalyzePythonCode)
+RegisterAnalyzer("java", AnalyzeJavaCode)
+RegisterAnalyzer("javascript", AnalyzeJSCode)
+RegisterAnalyzer("typescript", AnalyzeJSCode)
+RegisterAnalyzer("c", AnalyzeCCode)
+RegisterAnalyzer("cpp", AnalyzeCCode)
+RegisterAnalyzer("csharp", AnalyzeCCode)
+RegisterAnalyzer("go", AnalyzeGoCode)
+RegisterAnalyzer("php", AnalyzePhpCode)
+RegisterAnalyzer("ruby", AnalyzeRubyCode)
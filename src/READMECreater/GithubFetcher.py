@@ -1,74 +1,476 @@
 import os
 import re
-import requests
-from dotenv import load_dotenv
-
-# Github API Token을 사용하여 요청 헤더 설정
-envPath = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
-load_dotenv(dotenv_path=os.path.abspath(envPath))
-
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-
-# 지원하는 프로그래밍 언어별 확장자
-LANGUAGE_EXTENSIONS = {
-    "java": ".java",
-    "c": ".c",
-    "go": ".go",
-    "typescript": ".ts",
-    "javascript": ".js",
-    "ruby": ".rb",
-    "csharp": ".cs",
-    "cpp": [".cpp", ".hpp", ".cc", ".cxx"],
-    "php": ".php",
-    "python": ".py",
-}
+import json
+import time
+import logging
+import tarfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
+
+from src.Utils.GithubClient import (
+    GITHUB_API_URL,
+    GITHUB_RAW_URL,
+    GetWithRetry,
+    GithubError,
+    GraphQL,
+    GraphQLEnabled,
+)
+from src.Utils.Metrics import RecordCache
+from src.READMECreater.LanguageRegistry import GetLanguage, LANGUAGE_EXTENSIONS
+from src.Utils.Cache import (
+    BlobSha,
+    CachedGet,
+    CachePath,
+    HashKey,
+    ReadCache,
+    ReadJson,
+    WriteCache,
+    WriteJson,
+)
+
+logger = logging.getLogger(__name__)
+
+# 저장소 파일을 가져오는 방식
+# - contents : 디렉토리마다 contents API를 호출 (기존 방식)
+# - tree : Git Trees API로 전체 목록을 한 번에 받은 뒤 raw 파일 다운로드
+# - tarball : 기본 브랜치 tarball을 스트리밍하며 코드 파일만 추출
+FETCH_MODES = ("contents", "tree", "tarball")
+
+# 동시 다운로드 설정
+DOWNLOAD_WORKERS = 8
+
+# 파일 크기 제한 기본값 (거대한 생성 파일은 메모리에 올리지 않고 건너뜀)
+MAX_FILE_BYTES = 1024 * 1024
+MAX_TOTAL_BYTES = None
+
+# GraphQL로 가져오는 트리 깊이 (더 깊은 디렉터리가 있으면 Trees API로 다시 가져옴)
+GRAPHQL_TREE_DEPTH = 4
+# README 후보 파일 이름 (GraphQL은 REST /readme처럼 이름을 찾아주지 않음)
+README_NAMES = ("README.md", "readme.md", "Readme.md", "README.rst", "README")
+# 같은 저장소의 스냅샷을 재사용하는 시간(초)과 최대 개수
+SNAPSHOT_TTL = 300
+SNAPSHOT_CACHE_SIZE = 64
+
+# 저장소별 스냅샷 {경로: (요청한 시각, 스냅샷(없으면 None)을 담을 Future)}
+SNAPSHOTS = {}
+SNAPSHOT_LOCK = threading.Lock()
 
 
 # 파일 확장자가 지원하는 언어 목록에 포함되는지 확인하는 함수
 def IsValidExtension(fileName):
-    return any(
-        (
-            fileName.endswith(ext)
-            if isinstance(ext, str)
-            else any(fileName.endswith(e) for e in ext)
-        )
-        for ext in LANGUAGE_EXTENSIONS.values()
-    )
+    return GetLanguage(fileName) is not None
 
 
-# GitHub 저장소의 모든 코드 파일을 재귀적으로 가져오는 함수
-def FetchFiles(url):
-    print(f"[FetchFiles] 요청 URL: {url}")  # 디버깅용
-    response = requests.get(url, headers=HEADERS)
-    print(f"[FetchFiles] 응답 status: {response.status_code}")  # 디버깅용
+# 파일 하나의 내용을 텍스트로 다운로드하는 함수 (실패 시 None)
+def DownloadText(url):
+    response = GetWithRetry(url)
     if response.status_code != 200:
-        print(f"[FetchFiles] 오류 응답 내용: {response.text}")  # 디버깅용
-        raise Exception(f"Failed to fetch repository contents: {response.text}")
+        logger.warning("Download failed (%s): %s", response.status_code, url)
+        return None
+    return response.text
 
-    files = []
-    for item in response.json():
-        print(
-            f"[FetchFiles] item: {item.get('name')} / type: {item.get('type')}"
-        )  # 디버깅용
+
+# 입력 순서대로 결과를 내보내면서 최대 workers * 2개까지만 동시에 진행하는 함수
+# 앞선 결과를 소비해야 다음 작업을 시작하므로 메모리에 쌓이는 결과 수가 제한됨
+def IterConcurrent(func, items, workers=DOWNLOAD_WORKERS):
+    if workers <= 1:
+        yield from map(func, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for item in items:
+            window.append(pool.submit(func, item))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+# blob SHA로 캐시를 먼저 확인하고, 없으면 다운로드 후 캐시에 저장하는 함수
+def FetchBlob(item):
+    sha, url = item
+    data = ReadCache("blobs", sha) if sha else None
+    RecordCache("blob", data is not None)
+    if data is not None:
+        return data.decode("utf-8", errors="replace")
+
+    content = DownloadText(url)
+    if content is not None and sha:
+        WriteCache("blobs", sha, content.encode("utf-8"))
+    return content
+
+
+# 파일 크기 제한 (파일 하나 / 전체 합계, None이면 제한 없음)
+def NewBudget(maxFileBytes=MAX_FILE_BYTES, maxTotalBytes=MAX_TOTAL_BYTES):
+    return {
+        "maxFileBytes": maxFileBytes,
+        "maxTotalBytes": maxTotalBytes,
+        "remaining": maxTotalBytes,
+    }
+
+
+# 크기가 제한 안에 들어오면 사용량에 반영하고 True를 반환하는 함수
+def TakeBudget(budget, size):
+    if budget["maxFileBytes"] is not None and size > budget["maxFileBytes"]:
+        return False
+    if budget["remaining"] is not None:
+        if size > budget["remaining"]:
+            return False
+        budget["remaining"] -= size
+    return True
+
+
+# GitHub 저장소의 모든 코드 파일을 재귀적으로 가져오는 함수 (받는 대로 하나씩 반환)
+def FetchFiles(url, workers=DOWNLOAD_WORKERS, budget=None):
+    budget = budget or NewBudget()
+    logger.debug("Listing %s", url)
+    status, body = CachedGet(url, get=GetWithRetry)
+    if status != 200:
+        raise Exception(f"Failed to fetch repository contents: {body}")
+
+    files, subDirs = [], []
+    for item in json.loads(body):
         if item["type"] == "file" and IsValidExtension(item["name"]):
-            print(f"[FetchFiles] 파일 다운로드: {item['download_url']}")  # 디버깅용
-            file_content = requests.get(item["download_url"], headers=HEADERS).text
-            files.append((item["name"], file_content))
+            if TakeBudget(budget, item.get("size", 0)):
+                files.append(item)
         elif item["type"] == "dir":
-            print(f"[FetchFiles] 디렉토리 진입: {item['url']}")  # 디버깅용
-            files.extend(FetchFiles(item["url"]))
+            subDirs.append(item)
+
+    # 현재 디렉토리의 파일은 동시에 다운로드
+    contents = IterConcurrent(
+        FetchBlob, [(item.get("sha"), item["download_url"]) for item in files], workers
+    )
+    for item, content in zip(files, contents):
+        if content is not None:
+            yield item["name"], content
+
+    for item in subDirs:
+        yield from FetchFiles(item["url"], workers, budget)
+
+
+# 저장소 URL을 owner/repo 형태의 경로로 변환하는 함수
+def GetRepoPath(repoURL):
+    return re.sub(r"https://github.com/|.git$", "", repoURL.strip("/"))
+
+
+# GraphQL로 가져올 트리 항목 선택 (depth 단계까지 하위 트리를 펼침)
+def TreeSelection(depth):
+    nested = f"... on Tree {{ {TreeSelection(depth - 1)} }}" if depth > 1 else ""
+    return (
+        f"entries {{ name type oid object {{ ... on Blob {{ byteSize }} {nested} }} }}"
+    )
+
+
+# 기본 브랜치, 최신 커밋, README, 트리를 한 번에 요청하는 GraphQL 쿼리
+def SnapshotQuery():
+    readmes = " ".join(
+        f'readme{index}: object(expression: "HEAD:{name}") {{ ... on Blob {{ text }} }}'
+        for index, name in enumerate(README_NAMES)
+    )
+    return (
+        "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { "
+        "defaultBranchRef { name target { oid ... on Commit { tree { "
+        f"{TreeSelection(GRAPHQL_TREE_DEPTH)} }} }} }} }} {readmes} }} }}"
+    )
+
+
+# GraphQL 트리 응답을 Trees API와 같은 [{"path", "sha", "size"}] 목록으로 펼치는 함수
+# 펼치지 못한 하위 트리가 있으면 None (목록이 불완전함)
+def FlattenTree(entries, prefix=""):
+    files = []
+    for entry in entries or []:
+        path = f"{prefix}{entry['name']}"
+        obj = entry.get("object") or {}
+        if entry["type"] == "blob":
+            files.append(
+                {"path": path, "sha": entry["oid"], "size": obj.get("byteSize", 0)}
+            )
+        elif entry["type"] == "tree":
+            if "entries" not in obj:
+                return None
+            subtree = FlattenTree(obj["entries"], f"{path}/")
+            if subtree is None:
+                return None
+            files.extend(subtree)
     return files
 
 
+# GraphQL 요청 한 번으로 저장소 스냅샷을 가져오는 함수
+# {"branch", "commit", "readme"(없으면 None), "tree"(불완전하면 None)}
+def GraphQLSnapshot(repoPath):
+    owner, name = repoPath.split("/", 1)
+    repository = GraphQL(SnapshotQuery(), {"owner": owner, "name": name})["repository"]
+    if not repository or not repository.get("defaultBranchRef"):
+        raise Exception(f"Repository not found or empty: {repoPath}")
+
+    branch = repository["defaultBranchRef"]
+    readme = next(
+        (
+            repository[f"readme{index}"]["text"]
+            for index in range(len(README_NAMES))
+            if (repository.get(f"readme{index}") or {}).get("text") is not None
+        ),
+        None,
+    )
+    return {
+        "branch": branch["name"],
+        "commit": branch["target"]["oid"],
+        "readme": readme,
+        "tree": FlattenTree(branch["target"]["tree"]["entries"]),
+    }
+
+
+# 저장소 스냅샷을 반환하는 함수 (GraphQL을 쓸 수 없거나 실패하면 None)
+# 트리나 README가 디스크 캐시에 없을 때만 호출하며, 잠시 재사용하므로
+# README/코드/태그/이미지 단계가 같은 요청을 반복하지 않음
+# 동시에 호출되면 첫 호출만 요청을 보내고 나머지는 그 결과를 기다림
+def RepoSnapshot(repoPath):
+    if not GraphQLEnabled():
+        return None
+
+    now = time.monotonic()
+    with SNAPSHOT_LOCK:
+        cached = SNAPSHOTS.get(repoPath)
+        if cached and now - cached[0] < SNAPSHOT_TTL:
+            waiting = cached[1]
+        else:
+            waiting = None
+            future = Future()
+            SNAPSHOTS[repoPath] = (now, future)
+            while len(SNAPSHOTS) > SNAPSHOT_CACHE_SIZE:
+                SNAPSHOTS.pop(next(iter(SNAPSHOTS)))
+    # 다른 저장소의 요청이 막히지 않도록 lock을 놓은 뒤에 기다림
+    if waiting is not None:
+        return waiting.result()
+
+    # 어떤 예외로 끝나더라도 기다리는 호출이 REST로 넘어갈 수 있도록 항상 결과를 채움
+    snapshot = None
+    try:
+        snapshot = GraphQLSnapshot(repoPath)
+    except Exception as e:
+        logger.warning("GraphQL snapshot failed, using REST: %s", e)
+    finally:
+        future.set_result(snapshot)
+    return snapshot
+
+
+# 저장소의 기본 브랜치 이름을 가져오는 함수
+# 브랜치와 커밋은 ETag로 재검증하는 REST 요청으로 확인 (변경이 없으면 304로 rate limit을 쓰지 않음)
+def GetDefaultBranch(repoPath):
+    status, body = CachedGet(f"{GITHUB_API_URL}/repos/{repoPath}", get=GetWithRetry)
+    if status != 200:
+        raise GithubError(f"Failed to fetch repository info: {body}", status)
+    return json.loads(body).get("default_branch", "main")
+
+
+# 브랜치가 가리키는 최신 커밋 SHA를 가져오는 함수
+def GetCommitSha(repoPath, branch):
+    status, body = CachedGet(
+        f"{GITHUB_API_URL}/repos/{repoPath}/commits/{quote(branch)}",
+        headers={"Accept": "application/vnd.github.sha"},
+        get=GetWithRetry,
+    )
+    if status != 200:
+        raise GithubError(f"Failed to fetch latest commit: {body}", status)
+    return body.strip()
+
+
+# Git Trees API로 저장소 전체 파일 목록을 한 번에 가져오는 함수
+# 커밋 SHA 기준 목록은 바뀌지 않으므로 캐시에 저장하며, 잘린(truncated) 경우 None을 반환
+# 캐시에 없으면 GraphQL 스냅샷(README도 함께 받음)을 먼저 사용
+def FetchTree(repoPath, commitSha):
+    cacheKey = HashKey(f"{repoPath}@{commitSha}")
+    tree = ReadJson("trees", cacheKey)
+    RecordCache("tree", tree is not None)
+    if tree is not None:
+        return tree
+
+    snapshot = RepoSnapshot(repoPath)
+    if snapshot and snapshot["commit"] == commitSha and snapshot["tree"] is not None:
+        WriteJson("trees", cacheKey, snapshot["tree"])
+        return snapshot["tree"]
+
+    url = f"{GITHUB_API_URL}/repos/{repoPath}/git/trees/{commitSha}?recursive=1"
+    response = GetWithRetry(url)
+    if response.status_code != 200:
+        raise Exception(f"Failed to fetch repository tree: {response.text}")
+
+    data = response.json()
+    if data.get("truncated"):
+        return None
+    tree = [
+        {"path": item["path"], "sha": item["sha"], "size": item.get("size", 0)}
+        for item in data["tree"]
+        if item["type"] == "blob"
+    ]
+    WriteJson("trees", cacheKey, tree)
+    return tree
+
+
+# GraphQL 스냅샷의 README를 커밋 SHA별로 캐시해서 반환하는 함수
+# 스냅샷을 쓸 수 없거나 README를 찾지 못하면 None (REST /readme로 다시 확인)
+def SnapshotREADME(repoPath):
+    if not GraphQLEnabled():
+        return None
+
+    commitSha = GetCommitSha(repoPath, GetDefaultBranch(repoPath))
+    cacheKey = HashKey(f"{repoPath}@{commitSha}")
+    cached = ReadJson("readmes", cacheKey)
+    RecordCache("readme", cached is not None)
+    if cached is not None:
+        return cached["readme"]
+
+    snapshot = RepoSnapshot(repoPath)
+    if not snapshot or snapshot["commit"] != commitSha:
+        return None
+    WriteJson("readmes", cacheKey, {"readme": snapshot["readme"]})
+    return snapshot["readme"]
+
+
+# 트리 목록에서 코드 파일만 골라 raw URL로 다운로드하는 함수 (받는 대로 하나씩 반환)
+# blob SHA가 캐시에 있는 파일은 다시 받지 않음
+def FetchTreeFiles(repoPath, workers=DOWNLOAD_WORKERS, budget=None):
+    budget = budget or NewBudget()
+    commitSha = GetCommitSha(repoPath, GetDefaultBranch(repoPath))
+    tree = FetchTree(repoPath, commitSha)
+    # 트리가 너무 커서 잘린 경우 tarball로 대체
+    if tree is None:
+        yield from FetchTarballFiles(repoPath, commitSha, budget)
+        return
+
+    # 목록에 크기가 있으므로 제한을 넘는 파일은 다운로드 전에 제외
+    items = [
+        item
+        for item in tree
+        if IsValidExtension(item["path"]) and TakeBudget(budget, item["size"])
+    ]
+    blobs = (
+        (
+            item["sha"],
+            f"{GITHUB_RAW_URL}/{repoPath}/{commitSha}/{quote(item['path'])}",
+        )
+        for item in items
+    )
+    for item, content in zip(items, IterConcurrent(FetchBlob, blobs, workers)):
+        if content is not None:
+            yield item["path"], content
+
+
+# 저장소에서 파일 이름이 names에 있는 파일(manifest 등)만 받는 함수
+# 얕은 경로의 파일을 우선하며, 트리가 잘린 경우 최상위 경로만 확인
+def FetchNamedFiles(repoURL, names, limit=20, workers=DOWNLOAD_WORKERS):
+    repoPath = GetRepoPath(repoURL)
+    commitSha = GetCommitSha(repoPath, GetDefaultBranch(repoPath))
+    tree = FetchTree(repoPath, commitSha)
+    if tree is None:
+        tree = [{"path": name, "sha": None, "size": 0} for name in names]
+
+    items = sorted(
+        (
+            item
+            for item in tree
+            if os.path.basename(item["path"]) in names
+            and item["size"] <= MAX_FILE_BYTES
+        ),
+        key=lambda item: (item["path"].count("/"), item["path"]),
+    )[:limit]
+    blobs = (
+        (
+            item["sha"],
+            f"{GITHUB_RAW_URL}/{repoPath}/{commitSha}/{quote(item['path'])}",
+        )
+        for item in items
+    )
+    return [
+        (item["path"], content)
+        for item, content in zip(items, IterConcurrent(FetchBlob, blobs, workers))
+        if content is not None
+    ]
+
+
+# 기본 브랜치 tarball을 스트리밍하면서 코드 파일만 추출하는 함수 (받는 대로 하나씩 반환)
+# 같은 커밋을 이미 받은 적이 있으면 캐시된 blob으로 재구성
+def FetchTarballFiles(repoPath, commitSha=None, budget=None):
+    budget = budget or NewBudget()
+    if commitSha is None:
+        commitSha = GetCommitSha(repoPath, GetDefaultBranch(repoPath))
+
+    # 같은 커밋이라도 크기 제한이 다르면 받은 파일 목록이 달라지므로 키에 포함
+    snapshotKey = HashKey(
+        f"{repoPath}@{commitSha}:{budget['maxFileBytes']}:{budget['maxTotalBytes']}"
+    )
+    snapshot = ReadJson("snapshots", snapshotKey)
+    if snapshot is not None and all(
+        os.path.exists(CachePath("blobs", sha)) for _, sha in snapshot
+    ):
+        for path, sha in snapshot:
+            data = ReadCache("blobs", sha)
+            if data is not None and TakeBudget(budget, len(data)):
+                yield path, data.decode("utf-8", errors="replace")
+        return
+
+    url = f"{GITHUB_API_URL}/repos/{repoPath}/tarball/{commitSha}"
+    snapshot = []
+    with GetWithRetry(url, stream=True) as response:
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch repository tarball: {response.text}")
+
+        # "r|gz" 모드는 전체를 메모리에 올리지 않고 순차적으로 읽음
+        with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+            for member in tar:
+                # 최상위 "owner-repo-sha/" 디렉토리 제거
+                path = member.name.split("/", 1)[-1]
+                if not member.isfile() or not IsValidExtension(path):
+                    continue
+                # 제한을 넘는 파일은 읽지 않고 건너뜀
+                if not TakeBudget(budget, member.size):
+                    continue
+                content = tar.extractfile(member).read()
+                sha = BlobSha(content)
+                WriteCache("blobs", sha, content)
+                snapshot.append((path, sha))
+                yield path, content.decode("utf-8", errors="replace")
+
+    WriteJson("snapshots", snapshotKey, snapshot)
+
+
+# GitHub 저장소의 코드 파일을 받는 대로 하나씩 반환하는 함수
+# 전체 목록을 메모리에 만들지 않으므로 바로 분석기에 넘겨 스트리밍 처리할 수 있음
+def IterRepoFiles(
+    repoURL,
+    mode="tree",
+    workers=DOWNLOAD_WORKERS,
+    maxFileBytes=MAX_FILE_BYTES,
+    maxTotalBytes=MAX_TOTAL_BYTES,
+):
+    if mode not in FETCH_MODES:
+        raise ValueError(f"Unknown fetch mode: {mode}")
+
+    repoPath = GetRepoPath(repoURL)
+    logger.debug("Fetching %s with mode=%s", repoPath, mode)
+    budget = NewBudget(maxFileBytes, maxTotalBytes)
+
+    if mode == "tree":
+        return FetchTreeFiles(repoPath, workers, budget)
+    if mode == "tarball":
+        return FetchTarballFiles(repoPath, budget=budget)
+
+    apiURL = f"{GITHUB_API_URL}/repos/{repoPath}/contents/"
+    return FetchFiles(apiURL, workers, budget)
+
+
 # GitHub 저장소의 모든 코드 파일을 가져오는 함수
-def DownloadRepoFiles(repoURL):
-    print(f"[DownloadRepoFiles] 입력 repoURL: {repoURL}")  # 디버깅용
-    repoPath = re.sub(r"https://github.com/|.git$", "", repoURL.strip("/"))
-    print(f"[DownloadRepoFiles] 변환된 repoPath: {repoPath}")  # 디버깅용
-    apiURL = f"https://api.github.com/repos/{repoPath}/contents/"
-    print(f"[DownloadRepoFiles] 호출할 apiURL: {apiURL}")  # 디버깅용
-    return FetchFiles(apiURL)
+def DownloadRepoFiles(
+    repoURL,
+    mode="tree",
+    workers=DOWNLOAD_WORKERS,
+    maxFileBytes=MAX_FILE_BYTES,
+    maxTotalBytes=MAX_TOTAL_BYTES,
+):
+    return list(IterRepoFiles(repoURL, mode, workers, maxFileBytes, maxTotalBytes))
 
 
 # 지원하는 프로그래밍 언어별 확장자를 반환하는 함수
@@ -0,0 +1,55 @@
+import os
+
+# 지원하는 프로그래밍 언어별 확장자
+LANGUAGE_EXTENSIONS = {
+    "java": ".java",
+    "c": ".c",
+    "go": ".go",
+    "typescript": ".ts",
+    "javascript": ".js",
+    "ruby": ".rb",
+    "csharp": ".cs",
+    "cpp": [".cpp", ".hpp", ".cc", ".cxx"],
+    "php": ".php",
+    "python": ".py",
+}
+
+# 확장자 -> 언어 조회 테이블 (파일마다 dict 조회 한 번으로 판별)
+EXTENSION_LANGUAGES = {}
+# 언어 -> 분석 함수
+ANALYZERS = {}
+
+
+# 언어의 확장자를 조회 테이블에 등록하는 함수
+def RegisterExtensions(lang, extensions):
+    if isinstance(extensions, str):
+        extensions = [extensions]
+    for ext in extensions:
+        EXTENSION_LANGUAGES[ext] = lang
+
+    known = LANGUAGE_EXTENSIONS.get(lang, [])
+    known = [known] if isinstance(known, str) else list(known)
+    known += [ext for ext in extensions if ext not in known]
+    LANGUAGE_EXTENSIONS[lang] = known[0] if len(known) == 1 else known
+
+
+# 언어별 분석 함수를 등록하는 함수
+# 새 언어는 확장자와 함께 등록하면 GithubFetcher와 CodeAnalyzer 모두에 반영됨
+def RegisterAnalyzer(lang, analyzer, extensions=None):
+    if extensions:
+        RegisterExtensions(lang, extensions)
+    ANALYZERS[lang] = analyzer
+
+
+# 파일 이름으로 언어를 판별하는 함수 (지원하지 않으면 None)
+def GetLanguage(fileName):
+    return EXTENSION_LANGUAGES.get(os.path.splitext(fileName)[1])
+
+
+# 언어에 등록된 분석 함수를 반환하는 함수 (없으면 None)
+def GetAnalyzer(lang):
+    return ANALYZERS.get(lang)
+
+
+for _lang, _extensions in list(LANGUAGE_EXTENSIONS.items()):
+    RegisterExtensions(_lang, _extensions)
@@ -1,16 +1,30 @@
-import os
 import re
-from groq import Groq
-from dotenv import load_dotenv
+import time
+import logging
+from pydantic import BaseModel, Field, ValidationError
 from src.READMECreater.CodeAnalyzer import SummarizeKeywords
 from src.READMECreater.CodeAnalyzer import AnalyzeRepository
+from src.Utils.Clients import GetGroqClient, ResponseUsage
+from src.Utils.LLMCache import CachedCompletion, DeleteResponse, LLMCacheKey
+from src.Utils.PromptBuilder import (
+    PROMPT_TOKEN_BUDGET,
+    BuildPrompt,
+    CompactReadme,
+    RankComments,
+    RankImports,
+)
+from src.Utils.Metrics import RecordLLMCall
+from src.Utils.Scheduler import BackendSlot
 
-envPath = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
-load_dotenv(dotenv_path=os.path.abspath(envPath))
+logger = logging.getLogger(__name__)
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-# GROQ API를 사용하여 README 생성
-client = Groq(api_key=GROQ_API_KEY)
+README_MODEL = "qwen-qwq-32b"
+
+
+# README와 태그를 한 번에 생성할 때 기대하는 응답 형식
+class CombinedOutput(BaseModel):
+    readme: str = Field(min_length=1)
+    tags: list[str]
 
 
 # <think>와 </think> 사이의 내용을 포함하여 모두 제거
@@ -19,46 +33,123 @@ def RemoveThink(text):
     return cleaned
 
 
-# README 생성 프롬프트 생성 함수
-def GeneratePrompt(repoName, imports, functions, comments):
-    # None 값이 포함되지 않도록 필터링
-    imports = [imp for imp in imports if imp]
-    functions = [func for func in functions if func]
-    comments = [cmt for cmt in comments if cmt]
+# 분석 결과를 프롬프트 섹션으로 정리하는 함수
+# - import는 많은 파일에서 쓰인 순서로, 주석은 라이선스 헤더를 빼고 정보량 순으로 정렬
+def PromptSections(imports, functions, comments):
+    # import 목록만 넘어온 경우 파일 수를 1로 간주
+    if not isinstance(imports, dict):
+        imports = {imp: 1 for imp in imports}
+    return [
+        ("Used Libraries", RankImports(imports), "No external libraries found."),
+        (
+            "Function Overview",
+            SummarizeKeywords(sorted(func for func in functions if func)),
+            "",
+        ),
+        ("Comment Summary", RankComments(comments), ""),
+    ]
 
-    # 중복 제거
-    imports = list(set(imports))
-    functions = SummarizeKeywords(functions)
-    comments = sorted(comments, key=len, reverse=True)[:5]
 
+# README 생성 프롬프트 생성 함수
+# 토큰 예산을 넘는 항목은 잘라내며, 입력이 같으면 항상 같은 프롬프트를 생성 (응답 캐시용)
+def GeneratePrompt(
+    repoName, imports, functions, comments, tokenBudget=PROMPT_TOKEN_BUDGET
+):
     # 프롬프트 생성
-    prompt = f"""You are an AI that reviews GitHub repositories and generates README files.
+    header = f"""You are an AI that reviews GitHub repositories and generates README files.
 Analyze the following repository and generate a concise README.
 
 Repository : {repoName}
+"""
+    footer = "Generate a structured README based on the provided information.\n"
+    sections = PromptSections(imports, functions, comments)
+    return BuildPrompt(header, sections, footer, tokenBudget)
 
-## Used Libraries
-{", ".join(imports) if imports else "No external libraries found."}
 
-## Function Overview
-{", ".join(functions)}
+# README와 태그를 한 번에 요청하는 프롬프트 생성 함수
+def GenerateCombinedPrompt(
+    repoName, imports, functions, comments, readmeContent, tokenBudget
+):
+    excerpt = CompactReadme(readmeContent) if readmeContent else ""
+    header = f"""You are an AI that reviews GitHub repositories and generates README files.
+Analyze the following repository, generate a concise README and extract its key technologies.
 
-## Comment Summary
-{", ".join(comments)}
+Repository : {repoName}
 
-Generate a structured README based on the provided information.
+## Existing README Excerpt
+{excerpt or "No README found."}
+"""
+    footer = """Return only a JSON object with this format. No explanation.
+{ "readme": "<structured README in Markdown>", "tags": ["tech1", "tech2", ...] }
 """
-    return prompt
+    sections = PromptSections(imports, functions, comments)
+    return BuildPrompt(header, sections, footer, tokenBudget)
 
 
-# README 생성 함수
-def GenerateREADME(repoURL, repoFiles):
-    repoName, imports, funcs, comments = AnalyzeRepository(repoURL, repoFiles)
-    prompt = GeneratePrompt(repoName, imports, funcs, comments)
+# 응답에서 JSON 객체를 꺼내 형식을 검증하는 함수 (형식이 맞지 않으면 None)
+def ParseCombined(text):
+    text = RemoveThink(text or "")
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        return CombinedOutput.model_validate_json(text[start : end + 1])
+    except ValidationError as e:
+        logger.warning("Combined output failed validation: %d errors", e.error_count())
+        return None
 
-    chat = client.chat.completions.create(
-        messages=[{"role": "user", "content": prompt}], model="qwen-qwq-32b"
-    )
 
-    ReadmeText = RemoveThink(chat.choices[0].message.content)
+# README 생성 함수
+def GenerateREADME(repoURL, repoFiles, workers=1, tokenBudget=PROMPT_TOKEN_BUDGET):
+    analysis = AnalyzeRepository(repoURL, repoFiles, workers=workers)
+    return GenerateREADMEFromAnalysis(analysis, tokenBudget)
+
+
+# 분석 결과로 README를 생성하는 함수 (분석 결과를 다른 단계와 공유할 때 사용)
+def GenerateREADMEFromAnalysis(analysis, tokenBudget=PROMPT_TOKEN_BUDGET):
+    repoName, imports, funcs, comments = analysis
+    prompt = GeneratePrompt(repoName, imports, funcs, comments, tokenBudget)
+
+    messages = [{"role": "user", "content": prompt}]
+
+    def Request():
+        start = time.monotonic()
+        with BackendSlot("groq"):
+            # GROQ API를 사용하여 README 생성 (공유 클라이언트)
+            chat = GetGroqClient().chat.completions.create(
+                messages=messages, model=README_MODEL
+            )
+        RecordLLMCall(README_MODEL, time.monotonic() - start, *ResponseUsage(chat))
+        return chat.choices[0].message.content
+
+    # 저장소가 바뀌지 않아 프롬프트가 같으면 캐시된 응답을 사용
+    content = CachedCompletion(README_MODEL, messages, None, Request)
+    ReadmeText = RemoveThink(content)
     return ReadmeText
+
+
+# 한 번의 호출로 README와 태그를 함께 생성하는 함수
+# 응답이 형식에 맞지 않으면 None을 반환하므로 호출한 쪽에서 기존 방식으로 대체
+def GenerateCombined(analysis, readmeContent=None, tokenBudget=PROMPT_TOKEN_BUDGET):
+    repoName, imports, funcs, comments = analysis
+    prompt = GenerateCombinedPrompt(
+        repoName, imports, funcs, comments, readmeContent, tokenBudget
+    )
+    messages = [{"role": "user", "content": prompt}]
+
+    def Request():
+        start = time.monotonic()
+        with BackendSlot("groq"):
+            chat = GetGroqClient().chat.completions.create(
+                messages=messages, model=README_MODEL, temperature=0
+            )
+        RecordLLMCall(README_MODEL, time.monotonic() - start, *ResponseUsage(chat))
+        return chat.choices[0].message.content
+
+    key = (README_MODEL, messages, 0)
+    output = ParseCombined(CachedCompletion(*key, Request))
+    if output is None:
+        # 잘못된 응답이 캐시에 남아 계속 실패하지 않도록 삭제
+        DeleteResponse(LLMCacheKey(*key))
+        return None
+    return output.readme.strip(), [tag.strip() for tag in output.tags if tag.strip()]
@@ -1,17 +1,40 @@
 import json
 import re
-import os
-from dotenv import load_dotenv
 import threading
 import json
-import google.generativeai as genai
-from groq import Groq
+import time
+import logging
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from src.TagCreater.READMEFetcher import GetREADME
-from src.TagCreater.TagMerger import MergeCleanTags
+from src.TagCreater.StaticTagger import ConfidentTags, MIN_STATIC_TAGS
+from src.TagCreater.TagMerger import AddTags, NewTagIndex, ScoredTags
+from src.Utils.Clients import GetGeminiModel, GetGroqClient, ResponseUsage
+from src.Utils.LLMCache import CachedCompletion
+from src.Utils.Metrics import RecordLLMCall
+from src.Utils.PromptBuilder import CompactReadme
+from src.Utils.Scheduler import BackendSlot
 
+logger = logging.getLogger(__name__)
 
-results = {}
+GEMINI_MODEL = "gemini-2.0-flash-thinking-exp-01-21"
+
+# 모델 호출별 제한 시간(초), 이 시간이 지나면 응답을 기다리지 않음
+MODEL_TIMEOUT = 30
+# 이 수만큼의 모델이 응답하면 나머지를 기다리지 않고 진행 (None이면 전부)
+TAG_QUORUM = None
+# 응답이 p95 지연 시간보다 늦으면 같은 요청을 보낼 백업 모델
+HEDGE_MODELS = {
+    "gemma2-9b-it": "llama-3.1-8b-instant",
+    "llama-3.3-70b-versatile": "llama-3.1-8b-instant",
+}
+# p95를 계산하기 위한 최소 표본 수
+HEDGE_MIN_SAMPLES = 5
+
+# 모델별 최근 응답 시간 (hedge 기준 계산용)
+LATENCIES = defaultdict(lambda: deque(maxlen=100))
+LATENCY_LOCK = threading.Lock()
 
 
 # <think>와 </think> 사이의 내용을 포함하여 모두 제거
@@ -27,111 +50,247 @@ def ExtractJson(text):
         try:
             return json.loads(match.group(1))["tags"]
         except json.JSONDecodeError:
-            print("JSON parsing failed.")
+            logger.warning("JSON parsing failed.")
             return []
     raise ValueError("Valid JSON format not found.")
 
 
-# LLM 호출 함수
-def CallLLM(modelName, readmeContent, client):
+# 마감 시각(time.monotonic 기준)까지 남은 시간을 SDK 요청 timeout으로 반환하는 함수
+# 마감이 지났으면 요청하지 않도록 예외를 발생 (deadline이 None이면 timeout 그대로)
+def RemainingTimeout(deadline, timeout):
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("model deadline passed before the request started")
+    return min(timeout, remaining)
+
+
+# LLM 호출 함수 (추출한 태그 목록을 반환, 실패하면 None)
+# deadline이 있으면 남은 시간만큼만 SDK 요청을 기다리므로, FanOut이 버린 호출도 slot을 바로 반납함
+def CallLLM(modelName, readmeContent, client, timeout=MODEL_TIMEOUT, deadline=None):
     if not readmeContent:
-        print(f"README.md not found. ({modelName})")
-        return
+        logger.info("README.md not found. (%s)", modelName)
+        return None
 
-    try:
-        chatCompletion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "Extract key technologies in JSON format with this format only:\n"
-                        '{ "tags": ["tech1", "tech2", ...] }\n'
-                        "Return only JSON. No explanation."
-                    ),
-                },
-                {"role": "user", "content": readmeContent[:1000]},  # 1000자 제한
-            ],
-            model=modelName,
-            temperature=0,
-        )
+    messages = [
+        {
+            "role": "system",
+            "content": (
+                "Extract key technologies in JSON format with this format only:\n"
+                '{ "tags": ["tech1", "tech2", ...] }\n'
+                "Return only JSON. No explanation."
+            ),
+        },
+        {"role": "user", "content": CompactReadme(readmeContent)},  # 토큰 예산 제한
+    ]
+
+    def Request():
+        start = time.monotonic()
+        with BackendSlot("groq"):
+            chatCompletion = client.chat.completions.create(
+                messages=messages,
+                model=modelName,
+                temperature=0,
+                timeout=RemainingTimeout(deadline, timeout),
+            )
+        seconds = time.monotonic() - start
+        RecordLatency(modelName, seconds)
+        RecordLLMCall(modelName, seconds, *ResponseUsage(chatCompletion))
+        return chatCompletion.choices[0].message.content
 
-        content = chatCompletion.choices[0].message.content
-        print(f"\n[{modelName}] Raw Output:\n{content}\n{'-'*50}")
+    try:
+        content = CachedCompletion(modelName, messages, 0, Request)
+        logger.debug("[%s] Raw Output:\n%s", modelName, content)
 
-        results[modelName] = ExtractJson(RemoveThink(content))
+        return ExtractJson(RemoveThink(content))
 
     except Exception as e:
-        print(f"Exception in {modelName}: {e}")
+        logger.warning("Exception in %s: %s", modelName, e)
+        return None
 
 
-# Gemini 호출 함수
-def CallGemini(readme_content, gemini_model):
+# Gemini 호출 함수 (추출한 태그 목록을 반환, 실패하면 None)
+def CallGemini(readme_content, gemini_model, timeout=MODEL_TIMEOUT, deadline=None):
     if not readme_content:
-        print("README.md not found. (Gemini)")
-        return
+        logger.info("README.md not found. (Gemini)")
+        return None
 
-    try:
-        prompt = (
-            "Extract key technologies in JSON format like:\n"
-            '{ "tags": ["tech1", "tech2", ...] }\n'
-            "Return only JSON. No explanation."
-        )
-        response = gemini_model.generate_content(
-            f"{prompt}\n\nUser: {readme_content[:1000]}"  # 1000자 제한
-        )
+    prompt = (
+        "Extract key technologies in JSON format like:\n"
+        '{ "tags": ["tech1", "tech2", ...] }\n'
+        "Return only JSON. No explanation."
+    )
+    prompt = f"{prompt}\n\nUser: {CompactReadme(readme_content)}"  # 토큰 예산 제한
+
+    def Request():
+        start = time.monotonic()
+        with BackendSlot("gemini"):
+            response = gemini_model.generate_content(
+                prompt, request_options={"timeout": RemainingTimeout(deadline, timeout)}
+            )
+        seconds = time.monotonic() - start
+        RecordLatency("gemini", seconds)
+        RecordLLMCall(gemini_model.model_name, seconds, *ResponseUsage(response))
+        return response.text
 
-        print(f"\n[Gemini] Raw Output:\n{response.text}\n{'-'*50}")
+    try:
+        content = CachedCompletion(gemini_model.model_name, prompt, None, Request)
+        logger.debug("[Gemini] Raw Output:\n%s", content)
 
-        results["gemini"] = ExtractJson(RemoveThink(response.text))
+        return ExtractJson(RemoveThink(content))
 
     except Exception as e:
-        print(f"Gemini exception: {e}")
+        logger.warning("Gemini exception: %s", e)
+        return None
+
+
+# 모델 응답 시간을 기록하는 함수
+def RecordLatency(modelName, seconds):
+    with LATENCY_LOCK:
+        LATENCIES[modelName].append(seconds)
+
+
+# 모델의 p95 응답 시간을 반환하는 함수 (표본이 부족하면 None)
+def HedgeDelay(modelName):
+    with LATENCY_LOCK:
+        samples = sorted(LATENCIES[modelName])
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return None
+    return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+# 여러 모델을 동시에 호출하고 결과를 모으는 함수
+# calls: {이름: (모델, 함수, 인자)}, hedges: {이름: (백업 모델, 함수, 인자)}
+# quorum개가 응답하거나 timeout이 지나면 남은 호출은 기다리지 않고 취소
+def FanOut(calls, timeout=MODEL_TIMEOUT, quorum=None, hedges=None):
+    hedges = dict(hedges or {})
+    quorum = min(quorum or len(calls), len(calls))
+    executor = ThreadPoolExecutor(max_workers=len(calls) + len(hedges) or 1)
+    started = time.monotonic()
+    deadline = started + timeout
+
+    pending = {
+        executor.submit(func, *args): name for name, (_, func, args) in calls.items()
+    }
+    answered = {}
+    try:
+        while pending and len(answered) < quorum:
+            now = time.monotonic()
+            if now >= deadline:
+                logger.warning("Model timeout: %s", sorted(set(pending.values())))
+                break
+
+            # p95보다 늦어진 모델은 백업 모델로 한 번 더 요청
+            wakeup = deadline
+            for name in list(hedges):
+                delay = HedgeDelay(calls[name][0])
+                if name in answered or delay is None:
+                    hedges.pop(name)
+                elif now - started >= delay:
+                    model, func, args = hedges.pop(name)
+                    logger.info("Hedging %s with %s", name, model)
+                    pending[executor.submit(func, *args)] = name
+                else:
+                    wakeup = min(wakeup, started + delay)
+
+            done, _ = wait(pending, timeout=wakeup - now, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                tags = future.result()
+                if tags is not None and name not in answered:
+                    answered[name] = tags
+    finally:
+        # 늦은 호출은 결과를 버리고, 아직 시작하지 않은 호출은 취소
+        # (실행 중인 호출은 SDK timeout이 같은 마감 시각에 끝나도록 설정되어 있음)
+        executor.shutdown(wait=False, cancel_futures=True)
+    # 응답 순서와 관계없이 호출 순서대로 반환
+    return {name: answered[name] for name in calls if name in answered}
 
 
 # Model 실행 함수
-def ModelThreading(url):
-    envPath = os.path.join(os.path.dirname(__file__), "..", ".env")
-    load_dotenv(dotenv_path=os.path.abspath(envPath))
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-    GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+# 결과는 호출마다 따로 모으므로 여러 저장소를 동시에 처리해도 섞이지 않음
+# 이미 받은 README가 있으면 넘겨서 다시 가져오지 않도록 함
+# staticTags(StaticTagger 결과)로 충분한 태그가 확정되면 LLM을 호출하지 않음
+def ModelThreading(
+    url,
+    readmeContent=None,
+    timeout=MODEL_TIMEOUT,
+    quorum=TAG_QUORUM,
+    hedge=True,
+    staticTags=None,
+    minStaticTags=MIN_STATIC_TAGS,
+):
+    confident = ConfidentTags(staticTags)
+    if minStaticTags and len(confident) >= minStaticTags:
+        logger.info("Static tags are sufficient, skipping LLM calls: %s", confident)
+        return json.dumps({"tags": confident}, ensure_ascii=False)
 
     # Input
-    readmeContent = GetREADME(url, GITHUB_TOKEN)
+    if readmeContent is None:
+        readmeContent = GetREADME(url)
 
-    # 모델 부르기
-    client = Groq(api_key=GROQ_API_KEY)
-    genai.configure(api_key=GOOGLE_API_KEY)
-    gemini = genai.GenerativeModel("gemini-2.0-flash-thinking-exp-01-21")
+    # 모델 부르기 (프로세스 전체에서 공유하는 클라이언트)
+    client = GetGroqClient()
+    gemini = GetGeminiModel(GEMINI_MODEL)
 
-    # LLM Thread에서 호출
+    # LLM 동시 호출 (제한 시간/quorum 적용, 느린 모델은 백업 모델로 hedge)
+    # 모든 호출이 같은 마감 시각을 공유하므로 늦게 시작한 hedge도 남은 시간만 사용
+    deadline = time.monotonic() + timeout
     models = ["gemma2-9b-it", "llama-3.3-70b-versatile"]
-    threads = [
-        threading.Thread(target=CallLLM, args=(model, readmeContent, client))
+    calls = {
+        model: (model, CallLLM, (model, readmeContent, client, timeout, deadline))
         for model in models
-    ]
-    for thread in threads:
-        thread.start()
+    }
+    calls["gemini"] = ("gemini", CallGemini, (readmeContent, gemini, timeout, deadline))
 
-    geminiThread = threading.Thread(target=CallGemini, args=(readmeContent, gemini))
-    threads.append(geminiThread)
-    geminiThread.start()
+    hedges = {}
+    if hedge:
+        hedges = {
+            model: (
+                HEDGE_MODELS[model],
+                CallLLM,
+                (HEDGE_MODELS[model], readmeContent, client, timeout, deadline),
+            )
+            for model in models
+            if model in HEDGE_MODELS
+        }
 
-    for thread in threads:
-        thread.join()
+    results = FanOut(calls, timeout, quorum, hedges)
 
     # Output
     for model, tags in results.items():
-        print(f"Model: {model}")
-        print(tags)
-        print("-" * 50)
+        logger.info("Model %s: %s", model, tags)
+
+    # LLM이 모두 실패했으면 정적 분석 태그만 사용
+    if not results and confident:
+        return json.dumps({"tags": confident}, ensure_ascii=False)
+
+    # 모델 결과 병합 (신뢰도 = 태그를 낸 모델/정적 분석의 비율, 높은 순으로 정렬)
+    index = NewTagIndex()
+    for tags in results.values():
+        AddTags(index, tags)
+    if confident:
+        AddTags(index, confident)
+    scored = sorted(ScoredTags(index), key=lambda item: -item[1])
+    logger.info("Merged tags (confidence): %s", scored)
 
-    FinalTags = MergeCleanTags(*[results[m] for m in results])
+    FinalTags = [tag for tag, _ in scored]
     resultJson = {"tags": FinalTags}
 
-    refiner = genai.GenerativeModel("gemini-2.0-flash-thinking-exp-01-21")
-    response = refiner.generate_content(
-        f'{json.dumps(resultJson, ensure_ascii=False)} Extract only key technologies in JSON format as "tags": []'
-    )
+    refiner = GetGeminiModel(GEMINI_MODEL)
+    prompt = f'{json.dumps(resultJson, ensure_ascii=False)} Extract only key technologies in JSON format as "tags": []'
+
+    def Request():
+        start = time.monotonic()
+        with BackendSlot("gemini"):
+            response = refiner.generate_content(
+                prompt, request_options={"timeout": timeout}
+            )
+        RecordLLMCall(
+            refiner.model_name, time.monotonic() - start, *ResponseUsage(response)
+        )
+        return response.text
 
-    return response
+    # 정제 결과 텍스트를 반환 (같은 태그 목록이면 캐시된 응답 사용)
+    return CachedCompletion(refiner.model_name, prompt, None, Request)
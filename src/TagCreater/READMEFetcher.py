@@ -1,7 +1,14 @@
-import requests
+import json
+import logging
 from urllib.parse import urlparse
 import base64
 
+from src.Utils.Cache import CachedGet, HasCachedResponse
+from src.Utils.GithubClient import GITHUB_API_URL, GetWithRetry
+from src.READMECreater.GithubFetcher import SnapshotREADME
+
+logger = logging.getLogger(__name__)
+
 
 # URL에서 owner와 repo 이름을 추출하는 함수
 def RepoInfo(repoURL):
@@ -11,19 +18,26 @@ def RepoInfo(repoURL):
 
 
 # GitHub API를 사용하여 README.md 파일을 가져오는 함수
+# 인증은 공유 GitHub 클라이언트가 처리하며, gitToken을 넘기면 그 토큰을 사용
 def GetREADME(repoURL, gitToken=None):
     owner, repo = RepoInfo(repoURL)
     if not owner or not repo:
-        print("Invalid GitHub URL.")
+        logger.warning("Invalid GitHub URL: %s", repoURL)
         return None
 
-    apiURL = f"https://api.github.com/repos/{owner}/{repo}/readme"
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if gitToken:
-        headers = {"Authorization": f"Bearer {gitToken}"} if gitToken else {}
+    apiURL = f"{GITHUB_API_URL}/repos/{owner}/{repo}/readme"
+
+    # 캐시된 README 응답이 없으면 GraphQL 스냅샷(트리도 함께 받음)에 있는 README를 사용
+    # 캐시가 있으면 아래 REST 요청이 304로 재검증되므로 스냅샷을 요청하지 않음
+    if not HasCachedResponse(apiURL):
+        readme = SnapshotREADME(f"{owner}/{repo}")
+        if readme is not None:
+            return readme
+    headers = {"Authorization": f"Bearer {gitToken}"} if gitToken else None
 
-    response = requests.get(apiURL, headers=headers)
-    if response.status_code == 200:
-        return base64.b64decode(response.json()["content"]).decode("utf-8")
+    # ETag로 재검증하여 README가 바뀌지 않았으면 캐시된 내용을 사용
+    status, body = CachedGet(apiURL, headers=headers, get=GetWithRetry)
+    if status == 200:
+        return base64.b64decode(json.loads(body)["content"]).decode("utf-8")
 
     return None
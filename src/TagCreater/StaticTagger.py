@@ -0,0 +1,278 @@
+import os
+import re
+import json
+import xml.etree.ElementTree as ET
+
+# 태그를 확정하는 최소 신뢰도
+# manifest에 적힌 의존성(0.9)은 혼자서 넘고, import는 세 파일 이상에서 써야 넘음
+STATIC_CONFIDENCE = 0.7
+# import 한 파일당 신뢰도 (IMPORT_BASE + IMPORT_STEP * 파일 수, 최대 0.9)
+IMPORT_BASE = 0.4
+IMPORT_STEP = 0.1
+# 신뢰도가 기준 이상인 태그가 이만큼 있으면 LLM을 호출하지 않음
+MIN_STATIC_TAGS = 5
+
+# 기술 스택 판별에 쓰는 manifest 파일
+MANIFEST_FILES = ("requirements.txt", "package.json", "go.mod", "pom.xml", "Dockerfile")
+
+# manifest 파일 자체가 가리키는 기술
+MANIFEST_TECHNOLOGIES = {
+    "requirements.txt": ["Python"],
+    "package.json": ["JavaScript", "Node.js"],
+    "go.mod": ["Go"],
+    "pom.xml": ["Java", "Maven"],
+    "Dockerfile": ["Docker"],
+}
+
+# 패키지/모듈 이름 -> 기술 이름
+# 키는 소문자이며, 없는 이름은 '.'이나 '/' 기준으로 앞부분을 잘라가며 다시 찾음
+# (예: "google.generativeai.types" -> "google.generativeai")
+PACKAGE_TECHNOLOGIES = {
+    # Python
+    "requests": "Requests",
+    "httpx": "HTTPX",
+    "aiohttp": "aiohttp",
+    "flask": "Flask",
+    "django": "Django",
+    "fastapi": "FastAPI",
+    "uvicorn": "Uvicorn",
+    "starlette": "Starlette",
+    "pydantic": "Pydantic",
+    "sqlalchemy": "SQLAlchemy",
+    "celery": "Celery",
+    "numpy": "NumPy",
+    "pandas": "pandas",
+    "scipy": "SciPy",
+    "matplotlib": "Matplotlib",
+    "seaborn": "seaborn",
+    "sklearn": "scikit-learn",
+    "scikit-learn": "scikit-learn",
+    "torch": "PyTorch",
+    "tensorflow": "TensorFlow",
+    "keras": "Keras",
+    "transformers": "Hugging Face Transformers",
+    "langchain": "LangChain",
+    "openai": "OpenAI API",
+    "anthropic": "Anthropic API",
+    "groq": "Groq",
+    "google.generativeai": "Gemini",
+    "google-generativeai": "Gemini",
+    "bs4": "BeautifulSoup",
+    "beautifulsoup4": "BeautifulSoup",
+    "selenium": "Selenium",
+    "scrapy": "Scrapy",
+    "pytest": "pytest",
+    "streamlit": "Streamlit",
+    "gradio": "Gradio",
+    "cv2": "OpenCV",
+    "opencv-python": "OpenCV",
+    "pil": "Pillow",
+    "pillow": "Pillow",
+    "boto3": "AWS",
+    "redis": "Redis",
+    "pymongo": "MongoDB",
+    "psycopg2": "PostgreSQL",
+    "psycopg2-binary": "PostgreSQL",
+    "pymysql": "MySQL",
+    "sqlite3": "SQLite",
+    "tkinter": "Tkinter",
+    "pyqt5": "PyQt",
+    "discord": "discord.py",
+    "telegram": "python-telegram-bot",
+    "fuzzywuzzy": "FuzzyWuzzy",
+    "dotenv": "python-dotenv",
+    "python-dotenv": "python-dotenv",
+    # JavaScript / TypeScript
+    "react": "React",
+    "react-dom": "React",
+    "react-native": "React Native",
+    "next": "Next.js",
+    "vue": "Vue.js",
+    "nuxt": "Nuxt.js",
+    "@angular/core": "Angular",
+    "svelte": "Svelte",
+    "express": "Express",
+    "@nestjs/core": "NestJS",
+    "koa": "Koa",
+    "axios": "Axios",
+    "redux": "Redux",
+    "@reduxjs/toolkit": "Redux",
+    "typescript": "TypeScript",
+    "vite": "Vite",
+    "webpack": "webpack",
+    "tailwindcss": "Tailwind CSS",
+    "jest": "Jest",
+    "mongoose": "MongoDB",
+    "pg": "PostgreSQL",
+    "mysql2": "MySQL",
+    "prisma": "Prisma",
+    "@prisma/client": "Prisma",
+    "socket.io": "Socket.IO",
+    "graphql": "GraphQL",
+    "@apollo/client": "Apollo",
+    "electron": "Electron",
+    "three": "three.js",
+    "d3": "D3.js",
+    "jquery": "jQuery",
+    # Java
+    "org.springframework.boot": "Spring Boot",
+    "org.springframework": "Spring",
+    "spring-boot-starter-web": "Spring Boot",
+    "javax.persistence": "JPA",
+    "jakarta.persistence": "JPA",
+    "org.hibernate": "Hibernate",
+    "lombok": "Lombok",
+    "org.projectlombok": "Lombok",
+    "org.junit": "JUnit",
+    "junit": "JUnit",
+    "com.fasterxml.jackson": "Jackson",
+    "android": "Android",
+    "androidx": "Android",
+    # Go
+    "github.com/gin-gonic/gin": "Gin",
+    "github.com/labstack/echo": "Echo",
+    "github.com/gofiber/fiber": "Fiber",
+    "github.com/gorilla/mux": "Gorilla Mux",
+    "gorm.io/gorm": "GORM",
+    "github.com/spf13/cobra": "Cobra",
+    "google.golang.org/grpc": "gRPC",
+    "github.com/redis/go-redis": "Redis",
+    "go.mongodb.org/mongo-driver": "MongoDB",
+    # C / C++
+    "opencv2": "OpenCV",
+    "boost": "Boost",
+    "qt": "Qt",
+    "gl": "OpenGL",
+    "sdl2": "SDL",
+    # Docker base image
+    "python": "Python",
+    "node": "Node.js",
+    "golang": "Go",
+    "openjdk": "Java",
+    "nginx": "Nginx",
+    "postgres": "PostgreSQL",
+    "mysql": "MySQL",
+    "mongo": "MongoDB",
+}
+
+REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+GO_REQUIRE = re.compile(
+    r"^\s*(?:require\s+)?([\w.-]+\.[a-z]+/[^\s]+)\s+v", re.MULTILINE
+)
+DOCKER_FROM = re.compile(
+    r"^\s*FROM\s+(?:--\S+\s+)*([^\s:@]+)", re.IGNORECASE | re.MULTILINE
+)
+
+
+# 패키지 이름에 해당하는 기술을 찾는 함수 (없으면 None)
+def LookupTechnology(name):
+    name = name.strip().lower()
+    while name:
+        if name in PACKAGE_TECHNOLOGIES:
+            return PACKAGE_TECHNOLOGIES[name]
+        cut = max(name.rfind("."), name.rfind("/"))
+        if cut <= 0:
+            return None
+        name = name[:cut]
+    return None
+
+
+# requirements.txt에서 패키지 이름을 추출하는 함수
+def ParseRequirements(text):
+    names = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0]
+        if line.strip().startswith("-"):
+            continue
+        match = REQUIREMENT_NAME.match(line)
+        if match:
+            names.append(match.group(1))
+    return names
+
+
+# package.json에서 의존성 이름을 추출하는 함수
+def ParsePackageJson(text):
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return []
+    names = []
+    for field in ("dependencies", "devDependencies", "peerDependencies"):
+        deps = data.get(field)
+        if isinstance(deps, dict):
+            names.extend(deps)
+    return names
+
+
+# go.mod에서 모듈 경로를 추출하는 함수
+def ParseGoMod(text):
+    return GO_REQUIRE.findall(text)
+
+
+# pom.xml에서 groupId/artifactId를 추출하는 함수
+def ParsePom(text):
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        return []
+    names = []
+    for element in root.iter():
+        tag = element.tag.rsplit("}", 1)[-1]
+        if tag in ("groupId", "artifactId") and element.text:
+            names.append(element.text.strip())
+    return names
+
+
+# Dockerfile에서 베이스 이미지 이름을 추출하는 함수 (레지스트리 경로 제외)
+def ParseDockerfile(text):
+    return [image.rsplit("/", 1)[-1] for image in DOCKER_FROM.findall(text)]
+
+
+MANIFEST_PARSERS = {
+    "requirements.txt": ParseRequirements,
+    "package.json": ParsePackageJson,
+    "go.mod": ParseGoMod,
+    "pom.xml": ParsePom,
+    "Dockerfile": ParseDockerfile,
+}
+
+
+# 근거 하나를 태그 신뢰도에 더하는 함수 (독립된 근거로 보고 1 - (1-a)(1-b)로 합침)
+def AddEvidence(scores, tag, confidence):
+    scores[tag] = 1 - (1 - scores.get(tag, 0.0)) * (1 - confidence)
+
+
+# import와 manifest 파일로 태그와 신뢰도를 계산하는 함수
+# - imports: {import 이름: 사용한 파일 수} (AnalyzeRepository 결과)
+# - manifests: [(경로, 내용)]
+# 반환값은 신뢰도 높은 순, 같으면 이름순인 [(태그, 신뢰도)]
+def StaticTags(imports=None, manifests=()):
+    scores = {}
+
+    for path, text in manifests:
+        fileName = os.path.basename(path)
+        for tag in MANIFEST_TECHNOLOGIES.get(fileName, []):
+            AddEvidence(scores, tag, 1.0)
+        parser = MANIFEST_PARSERS.get(fileName)
+        for name in parser(text) if parser else []:
+            tag = LookupTechnology(name)
+            if tag:
+                AddEvidence(scores, tag, 0.9)
+
+    # 코드에서 import한 패키지는 사용한 파일이 많을수록 신뢰도를 높임
+    if imports and not isinstance(imports, dict):
+        imports = {name: 1 for name in imports}
+    for name, count in (imports or {}).items():
+        tag = LookupTechnology(name) if name else None
+        if tag:
+            AddEvidence(scores, tag, min(0.9, IMPORT_BASE + IMPORT_STEP * count))
+
+    return sorted(
+        ((tag, round(score, 3)) for tag, score in scores.items()),
+        key=lambda item: (-item[1], item[0]),
+    )
+
+
+# 신뢰도가 기준 이상인 태그만 반환하는 함수
+def ConfidentTags(staticTags, threshold=STATIC_CONFIDENCE):
+    return [tag for tag, confidence in staticTags or [] if confidence >= threshold]
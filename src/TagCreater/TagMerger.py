@@ -1,21 +1,172 @@
-from fuzzywuzzy import fuzz
+import re
+
+# 같은 기술을 가리키는 표기 -> 대표 이름 (키는 NormalizeTag 결과 형식)
+TAG_ALIASES = {
+    "js": "JavaScript",
+    "javascript": "JavaScript",
+    "ecmascript": "JavaScript",
+    "ts": "TypeScript",
+    "typescript": "TypeScript",
+    "py": "Python",
+    "python": "Python",
+    "golang": "Go",
+    "go": "Go",
+    "cpp": "C++",
+    "c++": "C++",
+    "csharp": "C#",
+    "c#": "C#",
+    "node": "Node.js",
+    "nodejs": "Node.js",
+    "react": "React",
+    "reactjs": "React",
+    "vue": "Vue.js",
+    "vuejs": "Vue.js",
+    "vue3": "Vue.js",
+    "nextjs": "Next.js",
+    "nuxtjs": "Nuxt.js",
+    "angularjs": "AngularJS",
+    "express": "Express",
+    "expressjs": "Express",
+    "postgres": "PostgreSQL",
+    "postgresql": "PostgreSQL",
+    "mongo": "MongoDB",
+    "mongodb": "MongoDB",
+    "k8s": "Kubernetes",
+    "kubernetes": "Kubernetes",
+    "sklearn": "scikit-learn",
+    "scikitlearn": "scikit-learn",
+    "tensorflow": "TensorFlow",
+    "pytorch": "PyTorch",
+    "torch": "PyTorch",
+    "springboot": "Spring Boot",
+    "aws": "AWS",
+    "amazonwebservices": "AWS",
+    "gcp": "Google Cloud",
+    "googlecloud": "Google Cloud",
+    "googlecloudplatform": "Google Cloud",
+    "tailwind": "Tailwind CSS",
+    "tailwindcss": "Tailwind CSS",
+    "html5": "HTML",
+    "html": "HTML",
+    "css3": "CSS",
+    "css": "CSS",
+}
+
+# 끝에 붙은 버전 표기 ("Python 3.10", "react-18", "python3.8", "v2.x")
+VERSION_SUFFIX = re.compile(
+    r"(?:[\s_-]+v?\d+(?:\.(?:\d+|x))*|v?\d+(?:\.(?:\d+|x))+)$", re.IGNORECASE
+)
+# 키에 남길 문자 (C++, C# 구분을 위해 +, #은 유지)
+KEY_NOISE = re.compile(r"[^a-z0-9가-힣+#]")
+TAG_WORDS = re.compile(r"[A-Za-z0-9가-힣+#]+")
+# 유사도 비교 후보를 좁히기 위한 n-gram 길이
+NGRAM_SIZE = 3
+
+
+# 태그를 (비교용 키, 표시 이름)으로 정규화하는 함수
+# 대소문자/구두점/버전 표기를 없애고, 별칭 표에 있으면 대표 이름을 사용
+def NormalizeTag(tag):
+    text = VERSION_SUFFIX.sub("", tag.strip()) or tag.strip()
+    key = KEY_NOISE.sub("", text.lower())
+    if key in TAG_ALIASES:
+        text = TAG_ALIASES[key]
+        key = KEY_NOISE.sub("", text.lower())
+    return key, text
+
+
+# 키의 n-gram 집합 (짧은 키는 유사도 비교에서 제외)
+def KeyNgrams(key):
+    return {key[i : i + NGRAM_SIZE] for i in range(len(key) - NGRAM_SIZE + 1)}
+
+
+# 태그 병합 상태를 만드는 함수
+# keys: {키: {"tag": 표시 이름, "count": 등장한 목록 수}} (처음 나온 순서 유지)
+# ngrams: {n-gram: 키 목록}, lists: 합친 태그 목록 수
+def NewTagIndex(threshold=80):
+    return {"threshold": threshold, "keys": {}, "ngrams": {}, "lists": 0}
+
+
+# 키를 찾는 함수: 정확히 같은 키가 없으면 n-gram을 공유하는 키 중에서만 유사도 비교
+def FindKey(index, key):
+    if key in index["keys"]:
+        return key
+    if len(key) < NGRAM_SIZE:
+        return None
+
+    candidates = set()
+    for gram in KeyNgrams(key):
+        candidates.update(index["ngrams"].get(gram, ()))
+
+    # fuzzywuzzy는 태그 병합이 실제로 필요할 때만 import
+    from fuzzywuzzy import fuzz
+
+    best, bestScore = None, index["threshold"]
+    for candidate in sorted(candidates):
+        # 길이 차이가 크면 ratio가 threshold를 넘을 수 없으므로 비교 생략
+        if 200 * min(len(key), len(candidate)) < bestScore * (
+            len(key) + len(candidate)
+        ):
+            continue
+        score = fuzz.ratio(key, candidate)
+        if score >= bestScore:
+            best, bestScore = candidate, score + 1
+    return best
+
+
+# 태그 목록 하나를 병합 상태에 추가하는 함수 (같은 목록 안의 중복은 한 번만 셈)
+def AddTags(index, tagList):
+    index["lists"] += 1
+    seen = set()
+    for tag in tagList:
+        if not isinstance(tag, str) or not tag.strip():
+            continue
+        key, name = NormalizeTag(tag)
+        if not key:
+            continue
+
+        found = FindKey(index, key)
+        if found is None:
+            index["keys"][key] = {"tag": name, "count": 0}
+            for gram in KeyNgrams(key):
+                index["ngrams"].setdefault(gram, []).append(key)
+            found = key
+
+        if found not in seen:
+            seen.add(found)
+            index["keys"][found]["count"] += 1
+    return index
+
+
+# 다른 태그의 단어 일부로만 이루어진 태그(줄임말)를 찾는 함수
+# 예: "React Native"가 있으면 "React"는 제외 ("Java"와 "JavaScript"는 별개)
+def ContainedKeys(index):
+    phrases = {}
+    for key, entry in index["keys"].items():
+        phrases[key] = tuple(word.lower() for word in TAG_WORDS.findall(entry["tag"]))
+
+    spans = set()
+    for words in phrases.values():
+        for start in range(len(words)):
+            for end in range(start + 1, len(words) + 1):
+                if end - start < len(words):
+                    spans.add(words[start:end])
+    return {key for key, words in phrases.items() if words and words in spans}
+
+
+# 병합된 태그와 신뢰도(태그를 낸 목록의 비율)를 반환하는 함수
+def ScoredTags(index):
+    contained = ContainedKeys(index)
+    total = max(index["lists"], 1)
+    return [
+        (entry["tag"], round(entry["count"] / total, 3))
+        for key, entry in index["keys"].items()
+        if key not in contained
+    ]
 
 
 # Tag에서 중복 제거
 def MergeCleanTags(*tagLists, threshold=80):
-    tags = []
+    index = NewTagIndex(threshold)
     for tagList in tagLists:
-        for item in tagList:
-            if not any(
-                fuzz.ratio(item.lower(), existing.lower()) >= threshold
-                for existing in tags
-            ):
-                tags.append(item)
-
-    # 줄임말 제거
-    finalTags = tags[:]
-    for item in tags:
-        for other in tags:
-            if item != other and other in item and other in finalTags:
-                finalTags.remove(other)
-    return finalTags
+        AddTags(index, tagList)
+    return [tag for tag, _ in ScoredTags(index)]
@@ -0,0 +1,165 @@
+import os
+import json
+import hashlib
+import tempfile
+
+import requests
+
+from src.Utils.Metrics import RecordCache
+
+# 캐시 디렉토리 (None이면 캐시 비활성화)
+CACHE_DIR = None
+# 캐시 전체 크기 제한 (초과 시 오래 사용하지 않은 파일부터 삭제)
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+# 자체적으로 크기를 관리하는 하위 디렉토리 (EvictCache에서 건드리지 않음)
+UNMANAGED_DIRS = {"llm"}
+
+
+# 캐시 디렉토리와 최대 크기를 설정하는 함수
+def ConfigureCache(cacheDir, maxBytes=None):
+    global CACHE_DIR, CACHE_MAX_BYTES
+    CACHE_DIR = os.path.abspath(cacheDir) if cacheDir else None
+    if maxBytes is not None:
+        CACHE_MAX_BYTES = maxBytes
+    if CACHE_DIR:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+
+# 현재 설정된 캐시 디렉토리를 반환하는 함수
+def GetCacheDir():
+    return CACHE_DIR
+
+
+# 문자열을 캐시 키로 쓰기 위한 해시 함수
+def HashKey(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# git과 동일한 방식으로 blob SHA를 계산하는 함수
+def BlobSha(content):
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+# namespace/키에 해당하는 캐시 파일 경로
+def CachePath(namespace, key):
+    return os.path.join(CACHE_DIR, namespace, key[:2], key)
+
+
+# 캐시에서 bytes를 읽는 함수 (없으면 None)
+def ReadCache(namespace, key):
+    if not CACHE_DIR:
+        return None
+    path = CachePath(namespace, key)
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return None
+    # LRU 삭제를 위해 마지막 사용 시각 갱신
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+# 캐시에 bytes를 원자적으로 저장하는 함수
+def WriteCache(namespace, key, data):
+    if not CACHE_DIR:
+        return
+    path = CachePath(namespace, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmpPath = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmpPath, path)
+    except OSError:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+
+# 캐시에서 JSON 값을 읽는 함수
+def ReadJson(namespace, key):
+    data = ReadCache(namespace, key)
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+
+# 캐시에 JSON 값을 저장하는 함수
+def WriteJson(namespace, key, value):
+    WriteCache(namespace, key, json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+# CachedGet으로 받아 ETag와 함께 저장된 응답이 있는지 확인하는 함수
+# (있으면 다시 요청해도 304로 재검증되어 GitHub rate limit을 쓰지 않음)
+def HasCachedResponse(url):
+    return ReadJson("http", HashKey(url)) is not None
+
+
+# 캐시 크기가 제한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제하는 함수
+def EvictCache():
+    if not CACHE_DIR:
+        return 0
+
+    entries, total = [], 0
+    for root, dirs, names in os.walk(CACHE_DIR):
+        if root == CACHE_DIR:
+            dirs[:] = [d for d in dirs if d not in UNMANAGED_DIRS]
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    removed = 0
+    if total <= CACHE_MAX_BYTES:
+        return removed
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+# ETag(If-None-Match)로 재검증하며 GET 요청을 보내는 함수
+# 304 응답이면 저장된 본문을 그대로 사용하고 (status, text)를 반환
+def CachedGet(url, headers=None, get=requests.get):
+    key = HashKey(url)
+    entry = ReadJson("http", key)
+
+    headers = dict(headers or {})
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    response = get(url, headers=headers)
+    RecordCache("http", response.status_code == 304 and entry is not None)
+    if response.status_code == 304 and entry:
+        return entry["status"], entry["body"]
+
+    if response.status_code == 200 and response.headers.get("ETag"):
+        WriteJson(
+            "http",
+            key,
+            {
+                "etag": response.headers["ETag"],
+                "status": response.status_code,
+                "body": response.text,
+            },
+        )
+    return response.status_code, response.text
@@ -0,0 +1,63 @@
+import os
+import threading
+
+from src.Utils.Config import LoadConfig
+
+LoadConfig()
+
+# Gemini API 주소 (벤치마크에서 로컬 가짜 서버를 쓸 때만 설정, REST로 호출)
+# Groq 클라이언트는 GROQ_BASE_URL 환경 변수를 직접 읽음
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL")
+
+# 프로세스 전체에서 공유하는 LLM 클라이언트 (처음 사용할 때 한 번만 생성)
+# Groq 클라이언트는 내부 연결 풀을 재사용하므로 저장소마다 새로 만들지 않음
+GROQ_CLIENT = None
+GEMINI_MODELS = {}
+CLIENT_LOCK = threading.Lock()
+
+
+# 공유 Groq 클라이언트를 반환하는 함수
+# SDK import 비용이 크므로 LLM 단계가 실제로 실행될 때 처음 import
+def GetGroqClient():
+    global GROQ_CLIENT
+    with CLIENT_LOCK:
+        if GROQ_CLIENT is None:
+            from groq import Groq
+
+            GROQ_CLIENT = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        return GROQ_CLIENT
+
+
+# 응답에서 (프롬프트 토큰 수, 생성 토큰 수)를 꺼내는 함수 (Groq/Gemini 응답 모두 지원)
+def ResponseUsage(response):
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        return (
+            getattr(usage, "prompt_tokens", None),
+            getattr(usage, "completion_tokens", None),
+        )
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        return (
+            getattr(usage, "prompt_token_count", None),
+            getattr(usage, "candidates_token_count", None),
+        )
+    return None, None
+
+
+# 모델 이름별로 공유 Gemini 모델을 반환하는 함수 (SDK는 처음 사용할 때 import)
+def GetGeminiModel(modelName):
+    with CLIENT_LOCK:
+        if modelName not in GEMINI_MODELS:
+            import google.generativeai as genai
+
+            if not GEMINI_MODELS and GEMINI_BASE_URL:
+                genai.configure(
+                    api_key=os.getenv("GOOGLE_API_KEY"),
+                    transport="rest",
+                    client_options={"api_endpoint": GEMINI_BASE_URL},
+                )
+            elif not GEMINI_MODELS:
+                genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+            GEMINI_MODELS[modelName] = genai.GenerativeModel(modelName)
+        return GEMINI_MODELS[modelName]
@@ -0,0 +1,20 @@
+import os
+import threading
+
+from dotenv import load_dotenv
+
+# 저장소 루트의 .env 파일
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
+
+CONFIG_LOADED = False
+CONFIG_LOCK = threading.Lock()
+
+
+# .env 파일을 환경 변수로 읽는 함수 (프로세스에서 처음 호출될 때 한 번만 읽음)
+# 이미 설정된 환경 변수는 덮어쓰지 않음
+def LoadConfig():
+    global CONFIG_LOADED
+    with CONFIG_LOCK:
+        if not CONFIG_LOADED:
+            load_dotenv(dotenv_path=ENV_PATH)
+            CONFIG_LOADED = True
@@ -1,31 +1,78 @@
 import os
 import re
+import json
+import struct
 import requests
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, unquote
 
 from src.TagCreater.READMEFetcher import GetREADME, RepoInfo
-
-# Github API Token을 사용하여 요청 헤더 설정
-envPath = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
-load_dotenv(dotenv_path=os.path.abspath(envPath))
-
+from src.Utils.Cache import CachedGet
+from src.Utils.GithubClient import (
+    GITHUB_API_URL,
+    GITHUB_RAW_URL,
+    GetWithRetry,
+    GithubRequest,
+)
+from src.READMECreater.GithubFetcher import (
+    FetchTree,
+    GetCommitSha,
+    GetDefaultBranch,
+    GetRepoPath,
+)
+from src.Utils.Metrics import IMAGE_PROBE_SECONDS, Timed
 
 # 상수 정의
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
-HEADERS = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
 IMAGE_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".svg"]
 
+# README의 markdown 이미지 ![alt](url "title")와 <img src="url"> 태그
+MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'][^)]*)?\)")
+HTML_IMAGE = re.compile(r"<img\b[^>]*?\bsrc\s*=\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+# 대표 이미지로 쓰지 않는 배지 이미지 주소
+BADGE_PATTERN = re.compile(
+    r"shields\.io|badge|badgen\.net|travis-ci|codecov\.io|circleci\.com",
+    re.IGNORECASE,
+)
+
+# 저장소 파일 중 점수가 높은 순서로 확인할 이미지 수
+MAX_REPO_CANDIDATES = 5
+# SVG 문서 앞에 올 수 있는 BOM과 공백
+SVG_LEADING = b"\xef\xbb\xbf \t\r\n"
+# 이미지 하나를 확인할 때 기다리는 최대 시간(초)
+PROBE_TIMEOUT = 5
+# 동시에 확인하는 이미지 수
+PROBE_WORKERS = 8
+# 크기를 알아내기 위해 Range 요청으로 읽는 앞부분 크기(바이트)
+SNIFF_BYTES = 16 * 1024
+# 이보다 큰 이미지는 받지 않음
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+# 가로/세로 중 짧은 쪽이 이보다 작으면 아이콘으로 보고 제외
+MIN_IMAGE_SIDE = 64
+# README 이미지의 기본 점수 (등장 순서가 늦을수록 1점씩 감소)
+README_IMAGE_SCORE = 20
+
+
+# 저장소 파일의 raw 주소 (path는 트리 목록처럼 인코딩하지 않은 실제 파일 경로)
+def RawFileURL(repoPath, ref, path):
+    return f"{GITHUB_RAW_URL}/{repoPath}/{ref}/{quote(path)}"
+
 
-# 상대 이미지 URL 수정
-def ResolveImageURL(imgURL, repoURL):
-    if imgURL.startswith("http"):
+# 상대 이미지 URL 수정 (branch는 상대 경로를 raw 주소로 바꿀 때 사용)
+# commitSha가 있으면 상대 경로와 기본 브랜치의 raw 주소를 저장소 이미지 후보와 같은
+# 커밋 기준 주소로 바꿔서, 같은 파일이 두 번 후보에 오르지 않도록 함
+def ResolveImageURL(imgURL, repoURL, branch="main", commitSha=None):
+    repoPath = GetRepoPath(repoURL)
+    branchURL = f"{GITHUB_RAW_URL}/{repoPath}/{branch}/"
+    if commitSha and imgURL.startswith(branchURL):
+        imgURL = imgURL[len(branchURL) :]
+    elif imgURL.startswith("http"):
         return imgURL
 
-    # 상대 경로 처리
-    repoPath = re.sub(r"https://github.com/|.git$", "", repoURL.strip("/"))
-    imgURL = imgURL.lstrip("./")
+    # 상대 경로 처리 (raw 파일에는 query와 fragment가 필요 없음)
+    # README 링크는 URL 인코딩되어 있으므로 실제 파일 경로로 되돌린 뒤 다시 인코딩
+    imgURL = unquote(imgURL.split("#", 1)[0].split("?", 1)[0].lstrip("./"))
 
-    return f"https://raw.githubusercontent.com/{repoPath}/main/{imgURL}"
+    return RawFileURL(repoPath, commitSha or branch, imgURL)
 
 
 # 이미지 확장자 확인 함수
@@ -35,18 +82,20 @@ def IsImageFile(fileName):
 
 # GitHub 저장소에서 이미지 파일 탐색
 def FetchImageFiles(url):
-    response = requests.get(url, headers=HEADERS)
-    if response.status_code != 200:
-        raise Exception(f"Failed to fetch repository contents: {response.json()}")
+    # 디렉토리 목록은 ETag로 재검증하여 변경이 없으면 캐시 사용
+    status, body = CachedGet(url, get=GetWithRetry)
+    if status != 200:
+        raise Exception(f"Failed to fetch repository contents: {body}")
 
     images = []
-    for item in response.json():
+    for item in json.loads(body):
         if item["type"] == "file" and IsImageFile(item["name"]):
             images.append(
                 {
                     "name": item["name"],
                     "path": item["path"],
                     "download_url": item["download_url"],
+                    "size": item.get("size"),
                 }
             )
         elif item["type"] == "dir":
@@ -54,24 +103,28 @@ def FetchImageFiles(url):
     return images
 
 
-# branch 이름이 main과 다를 때 값 가져오기
-def GetDefaultBranch(repoPath):
-    url = f"https://api.github.com/repos/{repoPath}"
-    res = requests.get(url, headers=HEADERS)
-
-    if res.status_code == 200:
-        return res.json().get("default_branch", "main")
-    raise Exception(
-        f"Repository not found or access denied. Status: {res.status_code}, msg: {res.json().get('message')}"
-    )
-
-
 # 레포 안에 image 찾기
-def FindImagesInRepo(repoURL):
-    repoPath = RepoInfo(repoURL)
-    defaultBranch = GetDefaultBranch(repoPath)
-    apiURL = f"https://api.github.com/repos/{repoPath}/contents/?ref={defaultBranch}"
-    return FetchImageFiles(apiURL)
+# 코드 수집 단계와 같은 트리 목록(커밋 SHA 기준 캐시)을 사용하고,
+# 트리가 잘린 경우에만 contents API로 디렉토리를 탐색
+def FindImagesInRepo(repoURL, branch=None, commitSha=None):
+    repoPath = "/".join(RepoInfo(repoURL))
+    branch = branch or GetDefaultBranch(repoPath)
+    commitSha = commitSha or GetCommitSha(repoPath, branch)
+    tree = FetchTree(repoPath, commitSha)
+    if tree is None:
+        apiURL = f"{GITHUB_API_URL}/repos/{repoPath}/contents/?ref={branch}"
+        return FetchImageFiles(apiURL)
+
+    return [
+        {
+            "name": os.path.basename(item["path"]),
+            "path": item["path"],
+            "download_url": RawFileURL(repoPath, commitSha, item["path"]),
+            "size": item["size"],
+        }
+        for item in tree
+        if IsImageFile(item["path"])
+    ]
 
 
 # 이미지 점수화
@@ -95,40 +148,241 @@ def GetImageScore(path):
     return score
 
 
+# 점수 순으로 정렬한 이미지 목록
+def RankImages(imgURLs):
+    return sorted(imgURLs, key=lambda img: GetImageScore(img["path"]), reverse=True)
+
+
 # 점수화해서 가장 높은 이미지 선택
 def ChooseImage(imgURLs):
-    scored = [(img, GetImageScore(img["path"])) for img in imgURLs]
-    scored.sort(key=lambda x: x[1], reverse=True)
+    ranked = RankImages(imgURLs)
+    return ranked[0] if ranked else None
 
-    return scored[0][0] if scored else None
 
+# README에 있는 이미지 주소를 등장 순서대로 반환 (배지와 중복 제외)
+def ReadmeImageURLs(readmeContent, repoURL, branch="main", commitSha=None):
+    if not readmeContent:
+        return []
+    matches = [
+        (match.start(), match.group(1))
+        for pattern in (MARKDOWN_IMAGE, HTML_IMAGE)
+        for match in pattern.finditer(readmeContent)
+    ]
+    urls = []
+    for _, imgURL in sorted(matches):
+        if imgURL.startswith("data:") or BADGE_PATTERN.search(imgURL):
+            continue
+        imgURL = ResolveImageURL(imgURL, repoURL, branch, commitSha)
+        if imgURL not in urls:
+            urls.append(imgURL)
+    return urls
 
-# 사이트가 404인지 확인
-def Is404(url):
-    try:
-        response = requests.head(url, allow_redirects=True)
-        return response.status_code != 404
-    except requests.RequestException as e:
-        return False
-
-
-# github에 속한 이미지 가져오기
-def GetImageInGithub(repoURL):
-    readmeContent = GetREADME(repoURL, GITHUB_TOKEN)
-    # README에 이미지 있으면 가져옴
-    if readmeContent:
-        match = re.search(r'<img\s+src="([^"]+)"', readmeContent)
+
+# JPEG에서 크기 정보를 담은 SOF marker (DHT/JPG/DAC 제외)
+def IsJpegFrame(marker):
+    return 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC)
+
+
+# JPEG 앞부분에서 SOF segment를 찾아 (가로, 세로)를 반환 (없으면 None)
+def JpegDimensions(header):
+    i = 2
+    while i + 9 <= len(header):
+        if header[i] != 0xFF:
+            i += 1
+            continue
+        marker = header[i + 1]
+        if marker == 0xFF:
+            i += 1
+        elif marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            i += 2
+        elif IsJpegFrame(marker):
+            height, width = struct.unpack(">HH", header[i + 5 : i + 9])
+            return width, height
+        else:
+            i += 2 + struct.unpack(">H", header[i + 2 : i + 4])[0]
+    return None
+
+
+# WebP 앞부분에서 (가로, 세로)를 반환 (VP8 / VP8L / VP8X, 잘린 파일이면 None)
+def WebpDimensions(header):
+    chunk = header[12:16]
+    if len(header) < 30:
+        return None
+    if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and header[20:21] == b"\x2f":
+        bits = int.from_bytes(header[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(header[24:27], "little") + 1
+        height = int.from_bytes(header[27:30], "little") + 1
+        return width, height
+    return None
+
+
+# SVG 문서인지 확인하는 함수 (<svg 또는 XML 선언으로 시작해야 함, HTML 페이지는 제외)
+def IsSvg(header):
+    text = header.lstrip(SVG_LEADING).lower()
+    if text.startswith(b"<svg"):
+        return True
+    return text.startswith(b"<?xml") and b"<svg" in text and b"<html" not in text
+
+
+# 이미지 앞부분으로 형식과 크기를 알아내는 함수
+# contentType이 text/html이면 (로그인/오류 페이지 등) 이미지로 보지 않음
+# 반환값: {"type", "width", "height"} (SVG와 잘린 파일은 크기 없음), 이미지가 아니면 None
+def ImageHeader(header, contentType=None):
+    if contentType and contentType.lower().startswith("text/html"):
+        return None
+    dimensions = None
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        kind = "png"
+        if len(header) >= 24:
+            dimensions = struct.unpack(">II", header[16:24])
+    elif header[:6] in (b"GIF87a", b"GIF89a") and len(header) >= 10:
+        kind, dimensions = "gif", struct.unpack("<HH", header[6:10])
+    elif header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        kind, dimensions = "webp", WebpDimensions(header)
+    elif header.startswith(b"\xff\xd8"):
+        kind, dimensions = "jpeg", JpegDimensions(header)
+    elif IsSvg(header):
+        kind = "svg"
     else:
-        match = None
-
-    if match:
-        imgURL = match.group(1)
-        imgURL = ResolveImageURL(imgURL, repoURL)
-        if Is404(imgURL):
-            return imgURL
-
-    # README에 없으면 폴더 확인
-    imgURLs = FindImagesInRepo(repoURL)
-    chosen = ChooseImage(imgURLs)
-    imgURL = chosen["download_url"] if chosen else None
-    return imgURL
+        return None
+    width, height = dimensions or (None, None)
+    return {"type": kind, "width": width, "height": height}
+
+
+# Content-Range / Content-Length 헤더로 전체 파일 크기를 구하는 함수
+def TotalBytes(response):
+    contentRange = response.headers.get("Content-Range", "")
+    if "/" in contentRange:
+        total = contentRange.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    size = response.headers.get("Content-Length")
+    if response.status_code == 200 and size and size.isdigit():
+        return int(size)
+    return None
+
+
+# 이미지 앞부분만 Range 요청으로 읽어 형식, 크기, 파일 크기를 알아내는 함수
+# Range를 지원하지 않는 서버도 SNIFF_BYTES만 읽고 연결을 닫음 (이미지가 아니면 None)
+def SniffImage(url):
+    headers = {"Range": f"bytes=0-{SNIFF_BYTES - 1}"}
+    try:
+        with Timed(IMAGE_PROBE_SECONDS):
+            if url.startswith((GITHUB_RAW_URL, GITHUB_API_URL)):
+                response = GithubRequest(
+                    "GET",
+                    url,
+                    headers=headers,
+                    stream=True,
+                    allow_redirects=True,
+                    timeout=PROBE_TIMEOUT,
+                )
+            else:
+                response = requests.get(
+                    url,
+                    headers=headers,
+                    stream=True,
+                    allow_redirects=True,
+                    timeout=PROBE_TIMEOUT,
+                )
+            with response:
+                if response.status_code not in (200, 206):
+                    return None
+                header = b""
+                for chunk in response.iter_content(4096):
+                    header += chunk
+                    if len(header) >= SNIFF_BYTES:
+                        break
+                total = TotalBytes(response)
+                contentType = response.headers.get("Content-Type")
+    except requests.RequestException:
+        return None
+
+    info = ImageHeader(header[:SNIFF_BYTES], contentType)
+    if info is None:
+        return None
+    info["bytes"] = total
+    return info
+
+
+# 파일 크기와 가로/세로 크기로 점수를 조정하는 함수 (받지 않을 이미지면 None)
+def SizeScore(info):
+    size, width, height = info["bytes"], info["width"], info["height"]
+    if size is not None and size > MAX_IMAGE_BYTES:
+        return None
+    score = 0
+    if width and height:
+        shortSide, longSide = sorted((width, height))
+        if shortSide < MIN_IMAGE_SIDE:
+            return None
+        # 스크린샷 크기면 가산, 가늘고 긴 이미지(배너 조각, 구분선)는 감점
+        if shortSide >= 300:
+            score += 4
+        elif shortSide >= 128:
+            score += 2
+        if longSide > shortSide * 5:
+            score -= 4
+    # 같은 조건이면 가벼운 파일을 우선
+    if size:
+        score -= 4 * size / MAX_IMAGE_BYTES
+    return score
+
+
+# 후보의 앞부분을 동시에 읽고, 이름/순서 점수와 크기 점수의 합이 가장 높은 주소를 반환
+# candidates: [{"url", "score", "size"}] (size는 트리 목록의 blob 크기, 모르면 None)
+def SelectImage(candidates):
+    # 트리 목록에서 이미 너무 큰 것으로 알려진 파일은 요청하지 않음
+    candidates = [
+        c for c in candidates if c["size"] is None or c["size"] <= MAX_IMAGE_BYTES
+    ]
+    if not candidates:
+        return None
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(candidates))) as pool:
+        infos = list(pool.map(lambda c: SniffImage(c["url"]), candidates))
+
+    best, bestScore = None, None
+    for candidate, info in zip(candidates, infos):
+        if info is None:
+            continue
+        if info["bytes"] is None:
+            info["bytes"] = candidate["size"]
+        sizeScore = SizeScore(info)
+        if sizeScore is None:
+            continue
+        score = candidate["score"] + sizeScore
+        if bestScore is None or score > bestScore:
+            best, bestScore = candidate["url"], score
+    return best
+
+
+# github에 속한 이미지 가져오기 (이미 받은 README가 있으면 그대로 사용)
+# README 이미지(등장 순서)와 저장소 이미지(점수 순) 후보의 앞부분만 읽어 하나를 고름
+def GetImageInGithub(repoURL, readmeContent=None):
+    if readmeContent is None:
+        readmeContent = GetREADME(repoURL)
+    repoPath = "/".join(RepoInfo(repoURL))
+    branch = GetDefaultBranch(repoPath)
+    commitSha = GetCommitSha(repoPath, branch)
+
+    # README 이미지와 저장소 이미지 모두 커밋 기준 raw 주소로 맞춰서 중복을 제거
+    readmeURLs = ReadmeImageURLs(readmeContent, repoURL, branch, commitSha)
+    candidates = [
+        {"url": url, "score": README_IMAGE_SCORE - index, "size": None}
+        for index, url in enumerate(readmeURLs)
+    ]
+    seen = {c["url"] for c in candidates}
+    repoImages = RankImages(FindImagesInRepo(repoURL, branch, commitSha))
+    for img in repoImages[:MAX_REPO_CANDIDATES]:
+        if img["download_url"] not in seen:
+            candidates.append(
+                {
+                    "url": img["download_url"],
+                    "score": GetImageScore(img["path"]),
+                    "size": img.get("size"),
+                }
+            )
+    return SelectImage(candidates)
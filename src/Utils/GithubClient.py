@@ -0,0 +1,286 @@
+import os
+import time
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.Utils.Metrics import GITHUB_BYTES, GITHUB_REQUESTS, GITHUB_SECONDS, Timed
+from src.Utils.Scheduler import BackendSlot
+from src.Utils.Config import LoadConfig
+
+logger = logging.getLogger(__name__)
+
+LoadConfig()
+
+# GitHub API/raw 파일 주소 (벤치마크에서는 로컬 가짜 서버 주소로 바꿔서 사용)
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_RAW_URL = os.getenv(
+    "GITHUB_RAW_URL", "https://raw.githubusercontent.com"
+).rstrip("/")
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+GITHUB_ACCEPT = "application/vnd.github+json"
+
+# 재시도 설정
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+REQUEST_TIMEOUT = 30
+# rate limit이 풀릴 때까지 기다리는 최대 시간(초), 더 길면 기다리지 않고 응답을 반환
+MAX_RESET_WAIT = 900
+
+# 토큰이 있을 때 GraphQL 요청 한 번으로 저장소 정보를 가져올지 여부
+USE_GRAPHQL = True
+
+# 모든 모듈이 공유하는 keep-alive 세션 (인증 헤더는 요청마다 토큰을 골라 붙임)
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+SESSION.mount("https://", ADAPTER)
+SESSION.mount("http://", ADAPTER)
+
+# 토큰별 rate limit 상태
+# REST(core)와 GraphQL은 한도가 따로 계산되므로 X-RateLimit-Resource별로 저장
+# (remaining이 None이면 아직 그 resource의 응답을 받지 못한 토큰)
+TOKEN_STATES = []
+TOKEN_LOCK = threading.Lock()
+
+# 초당 요청 수 제한 (token bucket, rate가 None이면 제한 없음)
+RATE_BUCKET = {"rate": None, "capacity": 1.0, "tokens": 1.0, "updated": 0.0}
+BUCKET_LOCK = threading.Lock()
+
+
+# GitHub가 200이 아닌 응답을 반환했을 때의 예외 (status: HTTP 상태 코드)
+class GithubError(Exception):
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+# 토큰 하나의 rate limit 상태를 만드는 함수 {"limits": {resource: 한도 상태}}
+def NewTokenState(token):
+    return {"token": token, "limits": {}}
+
+
+# 토큰의 resource별 한도 상태를 반환하는 함수 (처음이면 새로 만듦, lock을 잡은 상태에서 호출)
+def ResourceLimit(state, resource):
+    return state["limits"].setdefault(resource, {"remaining": None, "reset": 0.0})
+
+
+# 요청이 사용하는 rate limit resource (GraphQL 외의 API 요청은 core)
+def RequestResource(url):
+    return "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+
+
+# 사용할 토큰과 초당 요청 수를 설정하는 함수
+# - tokens: 토큰 목록 (rate limit이 남은 토큰을 번갈아 사용, 없으면 익명 요청)
+# - rate / burst: 초당 평균 요청 수와 한 번에 몰아서 보낼 수 있는 요청 수
+# - graphql: False이면 REST API만 사용
+def ConfigureGithub(tokens=None, rate=None, burst=None, graphql=True):
+    global USE_GRAPHQL
+    USE_GRAPHQL = graphql
+    with TOKEN_LOCK:
+        TOKEN_STATES[:] = [NewTokenState(token) for token in tokens or [] if token]
+        if not TOKEN_STATES:
+            TOKEN_STATES.append(NewTokenState(None))
+    with BUCKET_LOCK:
+        capacity = float(burst or max(1.0, rate or 1.0))
+        RATE_BUCKET.update(
+            rate=rate or None,
+            capacity=capacity,
+            tokens=capacity,
+            updated=time.monotonic(),
+        )
+
+
+# 환경 변수의 토큰 목록 (GITHUB_TOKENS는 쉼표로 구분, 없으면 GITHUB_TOKEN)
+def EnvTokens():
+    tokens = os.getenv("GITHUB_TOKENS") or os.getenv("GITHUB_TOKEN") or ""
+    return [token.strip() for token in tokens.split(",") if token.strip()]
+
+
+# GraphQL을 사용할 수 있는지 확인하는 함수 (GraphQL은 인증이 필요함)
+def GraphQLEnabled():
+    with TOKEN_LOCK:
+        return USE_GRAPHQL and any(state["token"] for state in TOKEN_STATES)
+
+
+# token bucket에서 요청 하나를 꺼내는 함수 (비어 있으면 채워질 때까지 대기)
+def TakeRateToken():
+    while True:
+        with BUCKET_LOCK:
+            rate = RATE_BUCKET["rate"]
+            if rate is None:
+                return
+            now = time.monotonic()
+            RATE_BUCKET["tokens"] = min(
+                RATE_BUCKET["capacity"],
+                RATE_BUCKET["tokens"] + (now - RATE_BUCKET["updated"]) * rate,
+            )
+            RATE_BUCKET["updated"] = now
+            if RATE_BUCKET["tokens"] >= 1:
+                RATE_BUCKET["tokens"] -= 1
+                return
+            wait = (1 - RATE_BUCKET["tokens"]) / rate
+        time.sleep(wait)
+
+
+# 요청에 사용할 토큰을 고르는 함수
+# resource의 남은 요청 수가 가장 많은 토큰을 쓰고, 모두 소진되었으면 가장 먼저 풀리는 토큰을 반환
+def ChooseToken(resource="core"):
+    with TOKEN_LOCK:
+        now = time.time()
+        limits = [(state, ResourceLimit(state, resource)) for state in TOKEN_STATES]
+        usable = [
+            (state, limit)
+            for state, limit in limits
+            if limit["remaining"] is None
+            or limit["remaining"] > 0
+            or limit["reset"] <= now
+        ]
+        if usable:
+            return max(
+                usable,
+                key=lambda item: (
+                    float("inf")
+                    if item[1]["remaining"] is None
+                    else item[1]["remaining"]
+                ),
+            )[0]
+        return min(limits, key=lambda item: item[1]["reset"])[0]
+
+
+# 응답의 X-RateLimit-* 헤더로 토큰의 resource별 한도 상태를 갱신하는 함수
+# 응답에 X-RateLimit-Resource가 있으면 요청한 resource 대신 그 값을 사용
+def UpdateRateLimit(state, response, resource="core"):
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or not remaining.isdigit():
+        return
+    resource = response.headers.get("X-RateLimit-Resource") or resource
+    with TOKEN_LOCK:
+        limit = ResourceLimit(state, resource)
+        limit["remaining"] = int(remaining)
+        if reset and reset.isdigit():
+            limit["reset"] = float(reset)
+
+
+# 시간당 요청 한도를 모두 쓴 응답인지 확인하는 함수
+def IsRateLimited(response):
+    return (
+        response.status_code in (403, 429)
+        and response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+# 5xx 또는 secondary rate limit 응답인지 확인하는 함수
+def IsRetryable(response):
+    if response.status_code >= 500:
+        return True
+    if response.status_code in (403, 429):
+        return (
+            "Retry-After" in response.headers or "secondary rate limit" in response.text
+        )
+    return False
+
+
+# 재시도 전 대기 시간 (Retry-After가 있으면 우선 사용, 없으면 지수 backoff)
+def RetryDelay(response, attempt):
+    retryAfter = response.headers.get("Retry-After") if response is not None else None
+    if retryAfter and retryAfter.isdigit():
+        return int(retryAfter)
+    return BACKOFF_SECONDS * (2**attempt)
+
+
+# 토큰의 resource 한도가 소진되었으면 reset 시각까지 기다리는 함수 (너무 길면 False)
+def WaitForReset(state, resource="core"):
+    with TOKEN_LOCK:
+        limit = dict(ResourceLimit(state, resource))
+    if limit["remaining"] is None or limit["remaining"] > 0:
+        return True
+    wait = limit["reset"] - time.time()
+    if wait <= 0:
+        return True
+    if wait > MAX_RESET_WAIT:
+        return False
+    logger.warning("GitHub rate limit exhausted, waiting %.0fs for reset", wait)
+    time.sleep(wait + 1)
+    return True
+
+
+# 토큰의 인증 헤더와 기본 Accept 헤더를 붙이는 함수 (호출자가 넘긴 헤더가 우선)
+def AuthHeaders(state, headers=None):
+    merged = {"Accept": GITHUB_ACCEPT}
+    if state["token"]:
+        merged["Authorization"] = f"Bearer {state['token']}"
+    merged.update(headers or {})
+    return merged
+
+
+# 공유 세션으로 GitHub에 요청을 보내는 함수
+# - 요청마다 rate limit이 남은 토큰을 고르고, 응답 헤더로 남은 요청 수를 갱신
+# - 한도를 다 쓴 토큰은 다른 토큰으로 다시 보내거나 reset 시각까지 기다림
+# - 5xx와 secondary rate limit은 backoff 후 재시도
+def GithubRequest(method, url, headers=None, **kwargs):
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    resource = RequestResource(url)
+    for attempt in range(MAX_RETRIES + 1):
+        TakeRateToken()
+        state = ChooseToken(resource)
+        if not WaitForReset(state, resource):
+            logger.warning("GitHub rate limit resets too late, not waiting: %s", url)
+        try:
+            with BackendSlot("github"), Timed(GITHUB_SECONDS):
+                response = SESSION.request(
+                    method, url, headers=AuthHeaders(state, headers), **kwargs
+                )
+        except requests.ConnectionError:
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(RetryDelay(None, attempt))
+            continue
+
+        # 스트리밍 응답은 본문을 읽지 않도록 Content-Length만 사용
+        GITHUB_REQUESTS.labels(status=str(response.status_code)).inc()
+        size = response.headers.get("Content-Length")
+        if size and size.isdigit():
+            GITHUB_BYTES.inc(int(size))
+        elif not kwargs.get("stream"):
+            GITHUB_BYTES.inc(len(response.content))
+        UpdateRateLimit(state, response, resource)
+
+        if attempt == MAX_RETRIES:
+            return response
+        if IsRateLimited(response):
+            # 다음 시도에서 남은 토큰을 고르거나 reset까지 기다림
+            if not WaitForReset(ChooseToken(resource), resource):
+                return response
+            response.close()
+            continue
+        if not IsRetryable(response):
+            return response
+        response.close()
+        logger.warning(
+            "GitHub request failed with %s, retrying: %s", response.status_code, url
+        )
+        time.sleep(RetryDelay(response, attempt))
+
+
+# GET 요청 (CachedGet의 get 인자로 사용)
+def GetWithRetry(url, **kwargs):
+    return GithubRequest("GET", url, **kwargs)
+
+
+# GraphQL 쿼리를 실행하고 data를 반환하는 함수 (오류가 있으면 예외)
+def GraphQL(query, variables=None):
+    response = GithubRequest(
+        "POST", GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables or {}}
+    )
+    if response.status_code != 200:
+        raise Exception(f"GraphQL request failed ({response.status_code})")
+    body = response.json()
+    if body.get("errors"):
+        raise Exception(f"GraphQL errors: {body['errors'][0].get('message')}")
+    return body["data"]
+
+
+ConfigureGithub(EnvTokens())
@@ -0,0 +1,200 @@
+import time
+import uuid
+import queue
+import logging
+import threading
+from collections import OrderedDict
+
+from src.Utils.Metrics import JOB_QUEUE_DEPTH, JOB_SECONDS, JOBS
+
+logger = logging.getLogger(__name__)
+
+# 동시에 실행하는 작업 수
+JOB_WORKERS = 2
+# 대기열에 넣을 수 있는 최대 작업 수 (가득 차면 새 작업을 받지 않음)
+MAX_QUEUED_JOBS = 32
+# 끝난 작업을 보관하는 수 (넘으면 가장 오래된 작업부터 삭제)
+MAX_FINISHED_JOBS = 256
+# 종료할 때 대기 중이던 작업에 남기는 오류 메시지
+CANCELLED_ERROR = "cancelled: service is shutting down"
+
+
+# 작업 하나의 상태를 만드는 함수
+# status: queued -> running -> done / failed, waiters: 같은 작업을 요청한 수
+def NewJob(key, payload):
+    return {
+        "id": uuid.uuid4().hex,
+        "key": key,
+        "payload": payload,
+        "status": "queued",
+        "submitted": time.time(),
+        "started": None,
+        "finished": None,
+        "result": None,
+        "error": None,
+        "waiters": 1,
+    }
+
+
+# 작업 대기열을 만들고 worker thread를 시작하는 함수
+# - run(jobId, payload): 작업을 실행하고 결과를 반환하는 함수 (worker thread에서 실행)
+# - onEvict(job): 보관 수를 넘어 삭제되는 작업을 정리하는 함수 (None이면 사용 안 함)
+def NewJobQueue(
+    run,
+    workers=JOB_WORKERS,
+    maxQueued=MAX_QUEUED_JOBS,
+    maxFinished=MAX_FINISHED_JOBS,
+    onEvict=None,
+):
+    jobQueue = {
+        "run": run,
+        "onEvict": onEvict,
+        "maxFinished": maxFinished,
+        "maxQueued": maxQueued,
+        # 대기열 크기는 SubmitJob이 제한 (종료 신호는 가득 차 있어도 넣을 수 있어야 함)
+        "pending": queue.Queue(),
+        "stopping": False,
+        "jobs": OrderedDict(),
+        "inflight": {},
+        "lock": threading.Lock(),
+        "threads": [],
+    }
+    for index in range(max(1, workers)):
+        thread = threading.Thread(
+            target=RunWorker, args=(jobQueue,), name=f"job-worker-{index}", daemon=True
+        )
+        thread.start()
+        jobQueue["threads"].append(thread)
+    return jobQueue
+
+
+# 작업을 대기열에 넣고 (작업, 합쳐졌는지)를 반환하는 함수
+# 같은 key의 작업이 대기 중이거나 실행 중이면 새로 만들지 않고 그 작업을 반환
+# 대기열이 가득 찼거나 종료 중이면 (None, False)를 반환 (호출한 쪽에서 나중에 다시 요청)
+def SubmitJob(jobQueue, key, payload):
+    with jobQueue["lock"]:
+        if jobQueue["stopping"]:
+            return None, False
+        jobId = jobQueue["inflight"].get(key)
+        if jobId is not None:
+            job = jobQueue["jobs"][jobId]
+            job["waiters"] += 1
+            JOBS.labels(result="coalesced").inc()
+            return JobView(job), True
+
+        if QueueFull(jobQueue):
+            JOBS.labels(result="rejected").inc()
+            return None, False
+        job = NewJob(key, payload)
+        jobQueue["pending"].put_nowait(job["id"])
+        jobQueue["jobs"][job["id"]] = job
+        jobQueue["inflight"][key] = job["id"]
+        JOB_QUEUE_DEPTH.set(jobQueue["pending"].qsize())
+        JOBS.labels(result="queued").inc()
+        return JobView(job), False
+
+
+# 대기열이 가득 찼는지 확인하는 함수 (작업을 만들기 전에 비용이 드는 준비를 건너뛸 때 사용)
+def QueueFull(jobQueue):
+    return jobQueue["pending"].qsize() >= jobQueue["maxQueued"]
+
+
+# 작업 상태를 복사해서 반환하는 함수 (없으면 None)
+def GetJob(jobQueue, jobId):
+    with jobQueue["lock"]:
+        job = jobQueue["jobs"].get(jobId)
+        return JobView(job) if job else None
+
+
+# 외부에 보여줄 작업 상태 (payload 제외, worker가 바꾸는 중에도 안전하도록 복사)
+def JobView(job):
+    return {name: value for name, value in job.items() if name != "payload"}
+
+
+# 대기 중인 작업 수, 실행 중인 작업 수, 대기열 크기를 반환하는 함수
+def QueueStats(jobQueue):
+    with jobQueue["lock"]:
+        running = sum(
+            1 for job in jobQueue["jobs"].values() if job["status"] == "running"
+        )
+        return {
+            "queued": jobQueue["pending"].qsize(),
+            "running": running,
+            "capacity": jobQueue["maxQueued"],
+            "workers": len(jobQueue["threads"]),
+            "jobs": len(jobQueue["jobs"]),
+        }
+
+
+# 끝난 작업이 보관 수를 넘으면 오래된 것부터 지우고, 지운 작업 목록을 반환하는 함수
+# (lock을 잡은 상태에서 호출)
+def TrimFinished(jobQueue):
+    finished = [
+        jobId
+        for jobId, job in jobQueue["jobs"].items()
+        if job["status"] in ("done", "failed")
+    ]
+    excess = len(finished) - jobQueue["maxFinished"]
+    return [jobQueue["jobs"].pop(jobId) for jobId in finished[: max(0, excess)]]
+
+
+# 대기열에서 작업을 하나씩 꺼내 실행하는 worker (None을 받으면 종료)
+def RunWorker(jobQueue):
+    while True:
+        jobId = jobQueue["pending"].get()
+        if jobId is None:
+            return
+
+        with jobQueue["lock"]:
+            job = jobQueue["jobs"][jobId]
+            job["status"] = "running"
+            job["started"] = time.time()
+            JOB_QUEUE_DEPTH.set(jobQueue["pending"].qsize())
+        JOB_SECONDS.labels(phase="wait").observe(job["started"] - job["submitted"])
+
+        try:
+            result, status, error = jobQueue["run"](jobId, job["payload"]), "done", None
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", jobId, job["key"])
+            result, status, error = None, "failed", str(e)
+
+        with jobQueue["lock"]:
+            job.update(status=status, result=result, error=error, finished=time.time())
+            if jobQueue["inflight"].get(job["key"]) == jobId:
+                del jobQueue["inflight"][job["key"]]
+            evicted = TrimFinished(jobQueue)
+        JOB_SECONDS.labels(phase="run").observe(job["finished"] - job["started"])
+        JOBS.labels(result=status).inc()
+
+        if jobQueue["onEvict"]:
+            for old in evicted:
+                jobQueue["onEvict"](old)
+
+
+# worker를 모두 종료하는 함수 (실행 중인 작업은 끝날 때까지 기다림)
+# 새 작업을 더 받지 않고, 대기 중인 작업은 실행하지 않고 실패(취소)로 처리함
+def StopJobQueue(jobQueue):
+    with jobQueue["lock"]:
+        jobQueue["stopping"] = True
+        cancelled = 0
+        while True:
+            try:
+                jobId = jobQueue["pending"].get_nowait()
+            except queue.Empty:
+                break
+            job = jobQueue["jobs"].get(jobId)
+            if job is None:
+                continue
+            job.update(status="failed", error=CANCELLED_ERROR, finished=time.time())
+            if jobQueue["inflight"].get(job["key"]) == jobId:
+                del jobQueue["inflight"][job["key"]]
+            cancelled += 1
+        JOB_QUEUE_DEPTH.set(0)
+    if cancelled:
+        JOBS.labels(result="cancelled").inc(cancelled)
+        logger.warning("Cancelled %d queued jobs on shutdown", cancelled)
+
+    for _ in jobQueue["threads"]:
+        jobQueue["pending"].put_nowait(None)
+    for thread in jobQueue["threads"]:
+        thread.join()
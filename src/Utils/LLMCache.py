@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from src.Utils.Cache import HashKey
+from src.Utils.Metrics import RecordCache
+
+# LLM 응답 캐시 파일 경로 (None이면 캐시 비활성화)
+LLM_CACHE_PATH = None
+# 저장한 응답의 유효 기간(초)
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+# 캐시 전체 크기 제한 (초과 시 오래 사용하지 않은 응답부터 삭제)
+LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+CONNECTION = None
+CONNECTION_LOCK = threading.Lock()
+
+
+# LLM 응답 캐시를 설정하는 함수 (path가 None이면 캐시를 끔)
+def ConfigureLLMCache(path, ttl=None, maxBytes=None):
+    global LLM_CACHE_PATH, LLM_CACHE_TTL, LLM_CACHE_MAX_BYTES, CONNECTION
+    with CONNECTION_LOCK:
+        if CONNECTION is not None:
+            CONNECTION.close()
+            CONNECTION = None
+
+        LLM_CACHE_PATH = os.path.abspath(path) if path else None
+        if ttl is not None:
+            LLM_CACHE_TTL = ttl
+        if maxBytes is not None:
+            LLM_CACHE_MAX_BYTES = maxBytes
+        if not LLM_CACHE_PATH:
+            return
+
+        os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+        CONNECTION = sqlite3.connect(
+            LLM_CACHE_PATH, timeout=30, check_same_thread=False
+        )
+        CONNECTION.execute("PRAGMA journal_mode=WAL")
+        CONNECTION.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, response TEXT, "
+            "size INTEGER, created REAL, accessed REAL)"
+        )
+        CONNECTION.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)"
+        )
+        # 유효 기간이 지난 응답 정리
+        CONNECTION.execute(
+            "DELETE FROM responses WHERE created < ?", (time.time() - LLM_CACHE_TTL,)
+        )
+        CONNECTION.commit()
+
+
+# 모델, 프롬프트, temperature로 캐시 키를 만드는 함수
+def LLMCacheKey(model, prompt, temperature=None):
+    return HashKey(
+        json.dumps([model, prompt, temperature], ensure_ascii=False, sort_keys=True)
+    )
+
+
+# 캐시된 응답을 읽는 함수 (없거나 만료되었으면 None)
+def ReadResponse(key):
+    with CONNECTION_LOCK:
+        if CONNECTION is None:
+            return None
+        row = CONNECTION.execute(
+            "SELECT response, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        if row[1] < now - LLM_CACHE_TTL:
+            CONNECTION.execute("DELETE FROM responses WHERE key = ?", (key,))
+            CONNECTION.commit()
+            return None
+        CONNECTION.execute(
+            "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+        )
+        CONNECTION.commit()
+        return row[0]
+
+
+# 응답을 저장하고 크기 제한을 넘으면 오래 사용하지 않은 응답부터 삭제하는 함수
+def WriteResponse(key, model, response):
+    with CONNECTION_LOCK:
+        if CONNECTION is None:
+            return
+        now = time.time()
+        CONNECTION.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (key, model, response, len(response.encode("utf-8")), now, now),
+        )
+
+        total = CONNECTION.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total > LLM_CACHE_MAX_BYTES:
+            rows = CONNECTION.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            ).fetchall()
+            expired = []
+            for oldKey, size in rows:
+                if total <= LLM_CACHE_MAX_BYTES:
+                    break
+                expired.append((oldKey,))
+                total -= size
+            CONNECTION.executemany("DELETE FROM responses WHERE key = ?", expired)
+        CONNECTION.commit()
+
+
+# 캐시된 응답을 삭제하는 함수 (응답이 형식에 맞지 않았을 때 사용)
+def DeleteResponse(key):
+    with CONNECTION_LOCK:
+        if CONNECTION is None:
+            return
+        CONNECTION.execute("DELETE FROM responses WHERE key = ?", (key,))
+        CONNECTION.commit()
+
+
+# 캐시에 있으면 저장된 응답을, 없으면 request()를 호출해 응답을 저장하고 반환
+# 같은 모델/프롬프트/temperature면 같은 응답을 재사용
+def CachedCompletion(model, prompt, temperature, request):
+    key = LLMCacheKey(model, prompt, temperature)
+    cached = ReadResponse(key)
+    if LLM_CACHE_PATH:
+        RecordCache("llm", cached is not None)
+    if cached is not None:
+        return cached
+
+    response = request()
+    if response:
+        WriteResponse(key, model, response)
+    return response
@@ -0,0 +1,155 @@
+import json
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    start_http_server,
+)
+
+# 이 프로젝트의 지표만 담는 registry (다른 라이브러리의 기본 지표와 섞이지 않도록 분리)
+REGISTRY = CollectorRegistry()
+
+# 네트워크 요청은 수 ms ~ 수십 초, 파일 분석은 수 ms 이하가 대부분
+REQUEST_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+ANALYZE_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+STAGE_SECONDS = Histogram(
+    "readme_creater_stage_seconds",
+    "Time spent in each pipeline stage",
+    ["stage"],
+    buckets=REQUEST_BUCKETS,
+    registry=REGISTRY,
+)
+STAGE_FAILURES = Counter(
+    "readme_creater_stage_failures_total",
+    "Pipeline stages that failed",
+    ["stage"],
+    registry=REGISTRY,
+)
+GITHUB_REQUESTS = Counter(
+    "readme_creater_github_requests_total",
+    "GitHub HTTP responses by status code",
+    ["status"],
+    registry=REGISTRY,
+)
+GITHUB_BYTES = Counter(
+    "readme_creater_github_response_bytes_total",
+    "Bytes received from GitHub",
+    registry=REGISTRY,
+)
+GITHUB_SECONDS = Histogram(
+    "readme_creater_github_request_seconds",
+    "GitHub request latency",
+    buckets=REQUEST_BUCKETS,
+    registry=REGISTRY,
+)
+FILES_ANALYZED = Counter(
+    "readme_creater_files_analyzed_total",
+    "Source files analyzed, by language and whether the result was cached",
+    ["language", "source"],
+    registry=REGISTRY,
+)
+ANALYZER_SECONDS = Histogram(
+    "readme_creater_analyzer_seconds",
+    "Time spent analyzing one file",
+    ["language"],
+    buckets=ANALYZE_BUCKETS,
+    registry=REGISTRY,
+)
+LLM_SECONDS = Histogram(
+    "readme_creater_llm_request_seconds",
+    "LLM request latency",
+    ["model"],
+    buckets=REQUEST_BUCKETS,
+    registry=REGISTRY,
+)
+LLM_TOKENS = Counter(
+    "readme_creater_llm_tokens_total",
+    "LLM tokens used, by model and kind (prompt/completion)",
+    ["model", "kind"],
+    registry=REGISTRY,
+)
+CACHE_EVENTS = Counter(
+    "readme_creater_cache_events_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+    registry=REGISTRY,
+)
+IMAGE_PROBE_SECONDS = Histogram(
+    "readme_creater_image_probe_seconds",
+    "Time spent checking one image candidate",
+    buckets=REQUEST_BUCKETS,
+    registry=REGISTRY,
+)
+JOBS = Counter(
+    "readme_creater_jobs_total",
+    "Service jobs by result (queued/coalesced/rejected/done/failed/cancelled)",
+    ["result"],
+    registry=REGISTRY,
+)
+JOB_QUEUE_DEPTH = Gauge(
+    "readme_creater_job_queue_depth",
+    "Service jobs waiting for a worker",
+    registry=REGISTRY,
+)
+JOB_SECONDS = Histogram(
+    "readme_creater_job_seconds",
+    "Time a service job spent waiting in the queue and running",
+    ["phase"],
+    buckets=REQUEST_BUCKETS + (300, 600),
+    registry=REGISTRY,
+)
+
+
+# 구간 실행 시간을 histogram에 기록하는 context manager
+@contextmanager
+def Timed(histogram, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metric = histogram.labels(**labels) if labels else histogram
+        metric.observe(time.perf_counter() - start)
+
+
+# 캐시 조회 결과를 기록하는 함수
+def RecordCache(cache, hit):
+    CACHE_EVENTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+# LLM 호출 한 번의 지연 시간과 토큰 수를 기록하는 함수
+def RecordLLMCall(model, seconds, promptTokens=None, completionTokens=None):
+    LLM_SECONDS.labels(model=model).observe(seconds)
+    if promptTokens:
+        LLM_TOKENS.labels(model=model, kind="prompt").inc(promptTokens)
+    if completionTokens:
+        LLM_TOKENS.labels(model=model, kind="completion").inc(completionTokens)
+
+
+# 지표를 JSON으로 저장할 수 있는 dict로 변환하는 함수
+# {지표 이름: [{"labels": {...}, "value": 값}, ...]} (histogram은 _count, _sum, _bucket으로 나뉨)
+def DumpMetrics():
+    metrics = {}
+    for family in REGISTRY.collect():
+        for sample in family.samples:
+            if sample.name.endswith("_created"):
+                continue
+            metrics.setdefault(sample.name, []).append(
+                {"labels": dict(sample.labels), "value": sample.value}
+            )
+    return metrics
+
+
+# 지표를 JSON 파일로 저장하는 함수
+def WriteMetricsJson(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(DumpMetrics(), f, ensure_ascii=False, indent=2)
+
+
+# 지표를 노출하는 HTTP 서버를 별도 thread로 시작하는 함수
+def StartMetricsServer(port, addr="0.0.0.0"):
+    start_http_server(port, addr=addr, registry=REGISTRY)
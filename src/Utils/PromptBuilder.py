@@ -0,0 +1,132 @@
+import re
+
+# README 생성 프롬프트의 기본 토큰 예산
+PROMPT_TOKEN_BUDGET = 3000
+# 태그 추출에 넘기는 README의 토큰 예산
+TAG_README_TOKENS = 300
+# 주석 하나에 쓸 수 있는 최대 토큰 수
+MAX_COMMENT_TOKENS = 80
+
+# BPE 토크나이저와 비슷하게 긴 단어는 4글자 단위로 나눠 세는 근사 패턴
+TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+WORD_PATTERN = re.compile(r"[A-Za-z가-힣][A-Za-z0-9가-힣]+")
+
+# 라이선스 헤더, 자동 생성 코드 표시 등 저장소 설명에 도움이 안 되는 주석
+BOILERPLATE_PATTERN = re.compile(
+    r"copyright|licen[cs]e[ds]?\b|spdx-license|all rights reserved|"
+    r"permission is hereby granted|without warranty|warranties|"
+    r"auto-?generated|generated by|do not edit|@author|@since",
+    re.IGNORECASE,
+)
+
+# README에서 태그 추출에 필요 없는 줄 (배지, 이미지, HTML 주석/태그)
+README_NOISE_PATTERN = re.compile(
+    r"^\s*(?:\[?!\[[^\]]*\]\([^)]*\)\]?(?:\([^)]*\))?\s*)+$"
+    r"|^\s*<!--.*?-->\s*$"
+    r"|^\s*</?(?:p|div|img|br|a|picture|source)\b[^>]*>\s*$",
+    re.IGNORECASE,
+)
+README_LICENSE_HEADING = re.compile(r"^#+\s*licen[cs]e\b", re.IGNORECASE)
+
+
+# 로컬에서 토큰 수를 추정하는 함수 (API 호출 없이 예산 계산용)
+def EstimateTokens(text):
+    return len(TOKEN_PATTERN.findall(text))
+
+
+# 토큰 예산 안에 들어가도록 텍스트를 자르는 함수
+def TruncateTokens(text, maxTokens):
+    if maxTokens <= 0:
+        return ""
+    for count, match in enumerate(TOKEN_PATTERN.finditer(text), 1):
+        if count > maxTokens:
+            return text[: match.start()].rstrip()
+    return text
+
+
+# 라이선스/자동 생성 문구인지 확인하는 함수
+def IsBoilerplate(comment):
+    return BOILERPLATE_PATTERN.search(comment) is not None
+
+
+# import를 사용한 파일 수 기준으로 정렬하는 함수 (같으면 이름순)
+def RankImports(importCounts):
+    return [
+        name
+        for name, _ in sorted(
+            importCounts.items(), key=lambda item: (-item[1], item[0])
+        )
+        if name
+    ]
+
+
+# 주석을 정보량 기준으로 정렬하는 함수
+# 라이선스 헤더는 제외하고, 공백/대소문자만 다른 주석은 하나로 합침
+def RankComments(comments):
+    ranked = {}
+    for comment in comments:
+        if not comment or IsBoilerplate(comment):
+            continue
+        text = " ".join(comment.split())
+        normalized = text.lower()
+        if normalized in ranked:
+            continue
+        text = TruncateTokens(text, MAX_COMMENT_TOKENS)
+        score = len({word.lower() for word in WORD_PATTERN.findall(text)})
+        if score >= 2:
+            ranked[normalized] = (score, text)
+    return [
+        text for score, text in sorted(ranked.values(), key=lambda r: (-r[0], r[1]))
+    ]
+
+
+# 섹션별 항목을 예산 안에서 순서대로 채워 프롬프트를 만드는 함수
+# sections: [(제목, 정렬된 항목 목록, 항목이 없을 때 문구)]
+# 남는 예산은 다음 섹션으로 넘어가며, 출력은 입력이 같으면 항상 같음
+def BuildPrompt(header, sections, footer, budget=PROMPT_TOKEN_BUDGET):
+    remaining = budget - EstimateTokens(header) - EstimateTokens(footer)
+    remaining -= sum(EstimateTokens(f"## {title}\n\n\n") for title, _, _ in sections)
+
+    parts = [header]
+    for index, (title, items, emptyText) in enumerate(sections):
+        share = max(0, remaining // (len(sections) - index))
+        chosen, used = [], 0
+        for item in items:
+            cost = EstimateTokens(item) + 1
+            if used + cost > share:
+                break
+            chosen.append(item)
+            used += cost
+        remaining -= used
+
+        omitted = len(items) - len(chosen)
+        body = ", ".join(chosen) if chosen or omitted else emptyText
+        if omitted:
+            body += f"{', and ' if chosen else ''}{omitted} more..."
+        parts.append(f"## {title}\n{body}\n")
+
+    parts.append(footer)
+    return "\n".join(parts)
+
+
+# 태그 추출용으로 README를 정리하고 토큰 예산에 맞게 자르는 함수
+# 배지/이미지/HTML 줄과 라이선스 섹션을 빼고 앞부분의 설명을 우선 사용
+def CompactReadme(text, maxTokens=TAG_README_TOKENS):
+    if not text:
+        return text
+
+    lines, blank, inLicense = [], False, False
+    for line in text.splitlines():
+        if line.lstrip().startswith("#"):
+            inLicense = README_LICENSE_HEADING.match(line.lstrip()) is not None
+        if inLicense or README_NOISE_PATTERN.match(line):
+            continue
+        if not line.strip():
+            if not blank and lines:
+                lines.append("")
+            blank = True
+            continue
+        lines.append(line.rstrip())
+        blank = False
+
+    return TruncateTokens("\n".join(lines).strip(), maxTokens)
@@ -0,0 +1,26 @@
+import threading
+from contextlib import contextmanager
+
+# 외부 서비스별 동시 호출 제한 (None이면 제한 없음)
+# 배치 실행 시 여러 저장소가 같은 서비스를 동시에 호출하더라도 이 수를 넘지 않음
+BACKENDS = ("github", "groq", "gemini")
+BACKEND_LIMITS = {name: None for name in BACKENDS}
+
+
+# 서비스별 동시 호출 수를 설정하는 함수 (0 또는 None이면 제한 해제)
+def ConfigureLimits(**limits):
+    for name, limit in limits.items():
+        if name not in BACKEND_LIMITS:
+            raise ValueError(f"Unknown backend: {name}")
+        BACKEND_LIMITS[name] = threading.BoundedSemaphore(limit) if limit else None
+
+
+# 서비스 호출 구간을 감싸 동시 호출 수를 제한하는 context manager
+@contextmanager
+def BackendSlot(name):
+    semaphore = BACKEND_LIMITS.get(name)
+    if semaphore is None:
+        yield
+        return
+    with semaphore:
+        yield
@@ -0,0 +1,171 @@
+import struct
+
+import pytest
+
+from src.Utils.GetImage import (
+    GITHUB_RAW_URL,
+    ImageHeader,
+    JpegDimensions,
+    RawFileURL,
+    ResolveImageURL,
+    WebpDimensions,
+)
+
+REPO_URL = "https://github.com/owner/repo"
+
+
+def Png(width, height):
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + struct.pack(">II", width, height)
+        + b"\x08\x06\x00\x00\x00"
+    )
+
+
+def Gif(width, height):
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00\x00\x00"
+
+
+def Jpeg(width, height):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width) + b"\x03"
+    return b"\xff\xd8" + app0 + sof + b"\x00" * 16
+
+
+def WebpVp8(width, height):
+    frame = b"\x00\x00\x00" + b"\x9d\x01\x2a" + struct.pack("<HH", width, height)
+    return b"RIFF" + struct.pack("<I", 30) + b"WEBP" + b"VP8 " + b"\x00" * 4 + frame
+
+
+def WebpVp8l(width, height):
+    bits = (width - 1) | ((height - 1) << 14)
+    return (
+        b"RIFF"
+        + struct.pack("<I", 30)
+        + b"WEBP"
+        + b"VP8L"
+        + b"\x00" * 4
+        + b"\x2f"
+        + bits.to_bytes(4, "little")
+        + b"\x00" * 8
+    )
+
+
+def WebpVp8x(width, height):
+    return (
+        b"RIFF"
+        + struct.pack("<I", 30)
+        + b"WEBP"
+        + b"VP8X"
+        + b"\x00" * 8
+        + (width - 1).to_bytes(3, "little")
+        + (height - 1).to_bytes(3, "little")
+    )
+
+
+@pytest.mark.parametrize(
+    "header, kind",
+    [
+        (Png(640, 480), "png"),
+        (Gif(640, 480), "gif"),
+        (Jpeg(640, 480), "jpeg"),
+        (WebpVp8(640, 480), "webp"),
+        (WebpVp8l(640, 480), "webp"),
+        (WebpVp8x(640, 480), "webp"),
+    ],
+)
+def test_dimensions(header, kind):
+    assert ImageHeader(header) == {"type": kind, "width": 640, "height": 480}
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        Png(640, 480),
+        Gif(640, 480),
+        Jpeg(640, 480),
+        WebpVp8(640, 480),
+        WebpVp8l(640, 480),
+        WebpVp8x(640, 480),
+    ],
+)
+def test_truncated_header_does_not_raise(header):
+    for end in range(len(header)):
+        info = ImageHeader(header[:end])
+        assert info is None or info["width"] in (None, 640)
+
+
+def test_truncated_png_has_no_dimensions():
+    assert ImageHeader(Png(640, 480)[:20]) == {
+        "type": "png",
+        "width": None,
+        "height": None,
+    }
+
+
+def test_truncated_webp_has_no_dimensions():
+    assert WebpDimensions(WebpVp8(640, 480)[:28]) is None
+
+
+def test_jpeg_without_frame():
+    assert JpegDimensions(b"\xff\xd8" + b"\xff\xe0\x00\x02" * 8) is None
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="10"></svg>',
+        b'\xef\xbb\xbf  <?xml version="1.0"?>\n<svg xmlns="http://www.w3.org/2000/svg">',
+        b"\n<SVG></SVG>",
+    ],
+)
+def test_svg(header):
+    assert ImageHeader(header) == {"type": "svg", "width": None, "height": None}
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        b"<!DOCTYPE html><html><body><svg></svg></body></html>",
+        b"<html><head><title>Sign in</title></head><svg/></html>",
+        b'<?xml version="1.0"?><html><svg/></html>',
+        b"404: Not Found",
+        b"",
+        b"\x00" * 64,
+    ],
+)
+def test_not_an_image(header):
+    assert ImageHeader(header) is None
+
+
+def test_html_content_type_is_rejected():
+    assert ImageHeader(Png(640, 480), "text/html; charset=utf-8") is None
+    assert ImageHeader(Png(640, 480), "image/png")["type"] == "png"
+
+
+def test_tree_path_with_percent_is_quoted_as_is():
+    assert RawFileURL("owner/repo", "abc", "img%20a.png") == (
+        f"{GITHUB_RAW_URL}/owner/repo/abc/img%2520a.png"
+    )
+
+
+@pytest.mark.parametrize(
+    "link",
+    [
+        "docs/my%20img.png",
+        "./docs/my img.png",
+        "docs/my%20img.png?raw=true",
+        f"{GITHUB_RAW_URL}/owner/repo/main/docs/my%20img.png",
+    ],
+)
+def test_readme_link_matches_tree_url(link):
+    assert ResolveImageURL(link, REPO_URL, "main", "abc") == RawFileURL(
+        "owner/repo", "abc", "docs/my img.png"
+    )
+
+
+def test_external_image_is_unchanged():
+    url = "https://example.com/a%20b.png"
+    assert ResolveImageURL(url, REPO_URL, "main", "abc") == url